@@ -0,0 +1,353 @@
+"""
+asyncio-native client for the Guardian API.
+
+This module provides an AsyncGuardianApiClient that mirrors GuardianApiClient
+but keeps many searches and page fetches in flight from a single thread.
+Article processing is shared with the synchronous client.
+"""
+
+import os
+import asyncio
+import logging
+from typing import AsyncIterator, Dict, List, Optional
+
+import aiohttp
+
+try:
+    from .brokers import BrokerRegistry, default_registry
+    from .guardian_api_client import (
+        GuardianApiClient,
+        MESSAGE_ATTRIBUTES,
+        build_search_params,
+        get_boto3_client,
+        validate_date,
+    )
+    from .message_encoding import encode_message, validate_encoding
+    from .projection import DEFAULT_PROJECTION, FieldProjection
+except ImportError:
+    from brokers import BrokerRegistry, default_registry
+    from guardian_api_client import (
+        GuardianApiClient,
+        MESSAGE_ATTRIBUTES,
+        build_search_params,
+        get_boto3_client,
+        validate_date,
+    )
+    from message_encoding import encode_message, validate_encoding
+    from projection import DEFAULT_PROJECTION, FieldProjection
+
+
+logger = logging.getLogger(__name__)
+logger.setLevel(os.environ.get("LOG_LEVEL", "INFO"))
+
+
+class AsyncGuardianApiClient:
+
+    API_URL = GuardianApiClient.API_URL
+    MAX_PAGE_SIZE = GuardianApiClient.MAX_PAGE_SIZE
+    determine_broker_type = GuardianApiClient.determine_broker_type
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        session: Optional[aiohttp.ClientSession] = None,
+        max_connections: int = 100,
+        timeout: float = 10.0,
+        message_encoding: str = "json",
+        projection: Optional[FieldProjection] = None,
+        broker_registry: Optional[BrokerRegistry] = None,
+    ):
+
+        self.api_key = api_key or os.environ.get("GUARDIAN_API_KEY")
+        if not self.api_key:
+            raise ValueError(
+                "Guardian API key is required. Set GUARDIAN_API_KEY environment variable."
+            )
+
+        validate_encoding(message_encoding)
+
+        self.session = session
+        self.max_connections = max_connections
+        self.timeout = timeout
+        self.message_encoding = message_encoding
+        self.projection = projection or DEFAULT_PROJECTION
+        self.broker_registry = broker_registry or default_registry
+        self._sns_client = None
+        self._sqs_client = None
+
+    async def __aenter__(self) -> "AsyncGuardianApiClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def close(self):
+        """Close the underlying HTTP session."""
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        # Created lazily as aiohttp sessions must be bound to a running loop.
+        if self.session is None:
+            self.session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.max_connections),
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+            )
+        return self.session
+
+    async def search_articles(
+        self,
+        search_term: str,
+        date_from: Optional[str] = None,
+        page_size: int = 10,
+        show_fields: Optional[str] = None,
+        page: int = 1,
+        date_to: Optional[str] = None,
+    ) -> Dict:
+        """
+        Search for articles in the Guardian API.
+
+        Args:
+            search_term: The term to search for
+            date_from: Optional date to filter results from (YYYY-MM-DD format)
+            page_size: Number of results to return (default: 10)
+            show_fields: Additional fields to include in the response
+                (default: the fields needed by the client's projection)
+            page: Page of results to return (default: 1)
+            date_to: Optional date to filter results to (YYYY-MM-DD format)
+
+        Returns:
+            Dict containing the API response
+
+        Raises:
+            aiohttp.ClientError: If the API request fails
+        """
+        projection_params = self.projection.search_params()
+        if show_fields is not None:
+            projection_params["show-fields"] = show_fields
+        params = build_search_params(
+            self.api_key,
+            search_term,
+            date_from,
+            page_size,
+            page,
+            date_to,
+            projection_params=projection_params,
+        )
+
+        logger.info(f"Searching Guardian API for: {search_term}")
+        session = self._get_session()
+        async with session.get(
+            self.API_URL, params={k: str(v) for k, v in params.items()}
+        ) as response:
+            response.raise_for_status()
+            return await response.json()
+
+    async def iter_articles(
+        self,
+        search_term: str,
+        date_from: Optional[str] = None,
+        date_to: Optional[str] = None,
+        max_results: Optional[int] = None,
+        page_size: int = MAX_PAGE_SIZE,
+    ) -> AsyncIterator[Dict]:
+        """
+        Lazily iterate over processed articles across all result pages.
+
+        Args:
+            search_term: The term to search for
+            date_from: Optional date to filter results from (YYYY-MM-DD format)
+            date_to: Optional date to filter results to (YYYY-MM-DD format)
+            max_results: Optional maximum number of articles to yield
+            page_size: Number of results to request per page (max: 200)
+
+        Yields:
+            Dictionaries containing processed article data
+        """
+        if max_results is not None and max_results <= 0:
+            return
+
+        page_size = min(page_size, self.MAX_PAGE_SIZE)
+        if max_results is not None:
+            page_size = min(page_size, max_results)
+
+        yielded = 0
+        page = 1
+        while True:
+            api_response = await self.search_articles(
+                search_term, date_from, page_size=page_size, page=page, date_to=date_to
+            )
+            for article in self.process_articles(api_response):
+                yield article
+                yielded += 1
+                if max_results is not None and yielded >= max_results:
+                    return
+
+            pages = api_response.get("response", {}).get("pages", 1)
+            if page >= pages:
+                return
+            page += 1
+
+    def process_articles(self, api_response: Dict) -> List[Dict]:
+        """
+        Process the API response and extract relevant article data.
+
+        Args:
+            api_response: The JSON response from the Guardian API
+
+        Returns:
+            List of dictionaries containing processed article data
+        """
+        results = api_response.get("response", {}).get("results", [])
+        return self.projection.extract_all(results)
+
+    async def publish_to_sns(self, topic_arn: str, articles: List[Dict]) -> Dict:
+        """
+        Publish articles to an SNS topic without blocking the event loop.
+
+        Args:
+            topic_arn: The ARN of the SNS topic
+            articles: List of article data to publish
+
+        Returns:
+            Dict containing the SNS publish response
+        """
+        if self._sns_client is None:
+            self._sns_client = get_boto3_client("sns")
+
+        message, attributes = encode_message(articles, self.message_encoding)
+        logger.info(f"Publishing {len(articles)} articles to SNS topic: {topic_arn}")
+        return await asyncio.to_thread(
+            self._sns_client.publish,
+            TopicArn=topic_arn,
+            Message=message,
+            MessageAttributes={**MESSAGE_ATTRIBUTES, **attributes},
+        )
+
+    async def publish_to_sqs(self, queue_url: str, articles: List[Dict]) -> Dict:
+        """
+        Publish articles to an SQS queue without blocking the event loop.
+
+        Args:
+            queue_url: The URL of the SQS queue
+            articles: List of article data to publish
+
+        Returns:
+            Dict containing the SQS send message response
+        """
+        if self._sqs_client is None:
+            self._sqs_client = get_boto3_client("sqs")
+
+        message, attributes = encode_message(articles, self.message_encoding)
+        logger.info(f"Publishing {len(articles)} articles to SQS queue: {queue_url}")
+        return await asyncio.to_thread(
+            self._sqs_client.send_message,
+            QueueUrl=queue_url,
+            MessageBody=message,
+            MessageAttributes={**MESSAGE_ATTRIBUTES, **attributes},
+        )
+
+    async def publish_articles(
+        self, search_term: str, broker_reference: str, date_from: Optional[str] = None
+    ) -> Dict:
+        """
+        Search for articles and publish them to the specified message broker.
+
+        Args:
+            search_term: The term to search for
+            broker_reference: Reference to the message broker (SNS ARN or SQS URL)
+            date_from: Optional date to filter results from (YYYY-MM-DD format)
+
+        Returns:
+            Dict containing information about the operation
+
+        Raises:
+            ValueError: If the broker type is unknown
+        """
+        if not search_term:
+            raise ValueError("Search term is required")
+        if not broker_reference:
+            raise ValueError("Broker reference is required")
+        validate_date("date_from", date_from)
+
+        broker_type = self.determine_broker_type(broker_reference)
+        if broker_type == "unknown":
+            raise ValueError(f"Unknown broker type for reference: {broker_reference}")
+        if broker_type not in ("sns", "sqs"):
+            raise ValueError(
+                f"Broker type {broker_type} is not supported asynchronously"
+            )
+
+        api_response = await self.search_articles(search_term, date_from)
+        articles = self.process_articles(api_response)
+
+        if broker_type == "sns":
+            publish_response = await self.publish_to_sns(broker_reference, articles)
+        else:
+            publish_response = await self.publish_to_sqs(broker_reference, articles)
+
+        return {
+            "status": "success",
+            "broker_type": broker_type,
+            "articles_count": len(articles),
+            "message_id": publish_response.get("MessageId"),
+        }
+
+    async def publish_many(
+        self,
+        terms: List[str],
+        broker_reference: str,
+        date_from: Optional[str] = None,
+    ) -> Dict:
+        """
+        Search for and publish articles for several terms concurrently.
+
+        Concurrency is bounded by the session's connection limit.
+
+        Args:
+            terms: The terms to search for
+            broker_reference: Reference to the message broker (SNS ARN or SQS URL)
+            date_from: Optional date to filter results from (YYYY-MM-DD format)
+
+        Returns:
+            Dict containing per-term results and errors
+        """
+        if isinstance(terms, str):
+            raise ValueError("terms must be a list of search terms")
+        terms = list(dict.fromkeys(term for term in terms if term))
+        if not terms:
+            raise ValueError("At least one search term is required")
+
+        outcomes = await asyncio.gather(
+            *(
+                self.publish_articles(term, broker_reference, date_from)
+                for term in terms
+            ),
+            return_exceptions=True,
+        )
+
+        results = {}
+        errors = {}
+        for term, outcome in zip(terms, outcomes):
+            if isinstance(outcome, Exception):
+                logger.error(f"Error publishing articles for {term}: {str(outcome)}")
+                errors[term] = str(outcome)
+            else:
+                results[term] = outcome
+
+        if not errors:
+            status = "success"
+        elif results:
+            status = "partial"
+        else:
+            status = "error"
+
+        return {
+            "status": status,
+            "broker_type": self.determine_broker_type(broker_reference),
+            "terms_count": len(terms),
+            "articles_count": sum(r["articles_count"] for r in results.values()),
+            "results": results,
+            "errors": errors,
+        }
@@ -0,0 +1,268 @@
+"""
+Parallel backfill of a search term over a date range.
+
+The range is split into time windows small enough to page through, by
+probing the number of results in each window and halving windows that hold
+more than a threshold. Windows are then published in parallel, and each
+completed window is checkpointed so an interrupted backfill resumes with
+the windows that are still outstanding. The checkpoints are removed once
+every window has been published.
+"""
+
+import os
+import time
+import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import date, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    from .checkpoints import CheckpointStore
+except ImportError:
+    from checkpoints import CheckpointStore
+
+
+logger = logging.getLogger(__name__)
+logger.setLevel(os.environ.get("LOG_LEVEL", "INFO"))
+
+# A window is a (date_from, date_to, total) tuple with inclusive YYYY-MM-DD dates.
+Window = Tuple[str, str, int]
+
+
+def split_window(date_from: str, date_to: str) -> List[Tuple[str, str]]:
+    """
+    Split an inclusive date range into two halves.
+
+    Args:
+        date_from: First day of the range (YYYY-MM-DD format)
+        date_to: Last day of the range (YYYY-MM-DD format)
+
+    Returns:
+        The two halves, or the range itself if it is a single day
+    """
+    start = date.fromisoformat(date_from)
+    end = date.fromisoformat(date_to)
+    if start >= end:
+        return [(date_from, date_to)]
+    middle = start + (end - start) // 2
+    return [
+        (start.isoformat(), middle.isoformat()),
+        ((middle + timedelta(days=1)).isoformat(), end.isoformat()),
+    ]
+
+
+def plan_windows(
+    client: Any,
+    search_term: str,
+    date_from: str,
+    date_to: str,
+    max_window_results: int = 2000,
+    max_workers: int = 4,
+) -> List[Window]:
+    """
+    Split a date range into windows of at most max_window_results results.
+
+    Each candidate window costs one single-result probe request. Windows
+    over the threshold are halved until they fit or are a single day.
+
+    Args:
+        client: The GuardianApiClient used to probe result counts
+        search_term: The term to search for
+        date_from: First day of the range (YYYY-MM-DD format)
+        date_to: Last day of the range (YYYY-MM-DD format)
+        max_window_results: Result count above which a window is split
+        max_workers: Maximum number of concurrent probe requests
+
+    Returns:
+        Windows in date order, each with its result count
+    """
+
+    def probe(window: Tuple[str, str]) -> int:
+        api_response = client.search_articles(
+            search_term, window[0], page_size=1, show_fields="", date_to=window[1]
+        )
+        return api_response.get("response", {}).get("total", 0)
+
+    windows = []
+    pending = [(date_from, date_to)]
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        while pending:
+            totals = list(pool.map(probe, pending))
+            next_pending = []
+            for window, total in zip(pending, totals):
+                halves = split_window(*window)
+                if total > max_window_results and len(halves) == 2:
+                    next_pending.extend(halves)
+                else:
+                    windows.append((window[0], window[1], total))
+            pending = next_pending
+
+    return sorted(windows)
+
+
+def backfill(
+    client: Any,
+    search_term: str,
+    broker_reference: str,
+    date_from: str,
+    date_to: str,
+    checkpoint_store: Optional[CheckpointStore] = None,
+    max_window_results: int = 2000,
+    max_workers: int = 4,
+    batch_size: int = 10,
+    per_article: bool = False,
+    deadline: Optional[float] = None,
+) -> Dict:
+    """
+    Publish every article for a term within a date range.
+
+    Args:
+        client: The GuardianApiClient used to search and publish
+        search_term: The term to search for
+        broker_reference: Reference to the message broker
+        date_from: First day of the range (YYYY-MM-DD format)
+        date_to: Last day of the range (YYYY-MM-DD format)
+        checkpoint_store: Optional store used to resume an interrupted backfill
+        max_window_results: Result count above which a window is split
+        max_workers: Maximum number of windows published at once
+        batch_size: Number of articles per message (default: 10)
+        per_article: Publish one message per article in batched requests
+        deadline: Optional time.monotonic() value after which no further
+            windows are started. Windows left over stay outstanding and the
+            result is marked with complete=False.
+
+    Returns:
+        Dict with the overall status, window and article counts, throughput
+        and per-window errors
+
+    Raises:
+        ValueError: If the date range is invalid
+    """
+    if not date_from or not date_to:
+        raise ValueError("date_from and date_to are required for a backfill")
+    for name, value in (("date_from", date_from), ("date_to", date_to)):
+        try:
+            date.fromisoformat(value)
+        except ValueError:
+            raise ValueError(f"Invalid {name} format. Use YYYY-MM-DD")
+    if date_from > date_to:
+        raise ValueError("date_from must not be after date_to")
+
+    started = time.monotonic()
+    job_key = f"backfill:{search_term}:{broker_reference}:{date_from}:{date_to}"
+    plan = checkpoint_store.get(f"{job_key}:plan") if checkpoint_store else None
+    if plan is not None:
+        windows = [tuple(window) for window in plan["windows"]]
+    else:
+        windows = plan_windows(
+            client, search_term, date_from, date_to, max_window_results, max_workers
+        )
+        if checkpoint_store is not None:
+            checkpoint_store.put(f"{job_key}:plan", {"windows": windows})
+
+    def window_key(window: Window) -> str:
+        return f"{job_key}:{window[0]}:{window[1]}"
+
+    outstanding = []
+    resumed = 0
+    articles_count = 0
+    for window in windows:
+        done = checkpoint_store.get(window_key(window)) if checkpoint_store else None
+        if done is not None:
+            resumed += 1
+            articles_count += done["articles_count"]
+        elif window[2] > 0:
+            outstanding.append(window)
+
+    logger.info(
+        f"Backfilling {search_term} from {date_from} to {date_to}: "
+        f"{len(windows)} windows, {len(outstanding)} outstanding"
+    )
+
+    def publish(window: Window) -> Optional[Dict]:
+        if deadline is not None and time.monotonic() >= deadline:
+            return None
+        return client.publish_articles(
+            search_term,
+            broker_reference,
+            window[0],
+            window[1],
+            max_results=window[2],
+            batch_size=batch_size,
+            per_article=per_article,
+            deadline=deadline,
+        )
+
+    published = 0
+    failed_count = 0
+    completed = 0
+    skipped = 0
+    errors = {}
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = {pool.submit(publish, window): window for window in outstanding}
+        for future in as_completed(futures):
+            window = futures[future]
+            name = f"{window[0]}..{window[1]}"
+            try:
+                result = future.result()
+            except Exception as e:
+                logger.error(f"Error backfilling {search_term} for {name}: {str(e)}")
+                errors[name] = str(e)
+                continue
+            if result is None:
+                skipped += 1
+                continue
+
+            completed += 1
+            published += result["articles_count"]
+            failed_count += result.get("failed_count", 0)
+            if result.get("complete") is False:
+                # Stopped part way through; the window's own checkpoint
+                # carries on from there next time.
+                skipped += 1
+            elif result["status"] == "success":
+                if checkpoint_store is not None:
+                    checkpoint_store.put(
+                        window_key(window),
+                        {"articles_count": result["articles_count"]},
+                    )
+            else:
+                errors[name] = f"{result.get('failed_count', 0)} articles failed"
+
+            elapsed = time.monotonic() - started
+            logger.info(
+                f"Backfill {search_term}: {completed}/{len(outstanding)} windows, "
+                f"{published} articles, {published / max(elapsed, 1e-6):.1f} articles/s"
+            )
+
+    elapsed = time.monotonic() - started
+    if not errors:
+        status = "success"
+    elif completed:
+        status = "partial"
+    else:
+        status = "error"
+
+    summary = {
+        "status": status,
+        "search_term": search_term,
+        "windows_count": len(windows),
+        "windows_resumed": resumed,
+        "articles_count": articles_count + published,
+        "failed_count": failed_count,
+        "elapsed_seconds": round(elapsed, 3),
+        "articles_per_second": round(published / max(elapsed, 1e-6), 1),
+        "errors": errors,
+    }
+    if skipped:
+        logger.warning(
+            f"Time budget used up backfilling {search_term} "
+            f"with {skipped} windows outstanding"
+        )
+        summary["complete"] = False
+    elif not errors and checkpoint_store is not None:
+        # Every window is done, so running the backfill again starts afresh.
+        for window in windows:
+            checkpoint_store.delete(window_key(window))
+        checkpoint_store.delete(f"{job_key}:plan")
+    return summary
@@ -0,0 +1,304 @@
+"""
+Message broker backends and the registry used to route broker references.
+
+GuardianApiClient resolves every broker reference through a BrokerRegistry
+to the backend that publishes to it. The default registry knows about:
+
+- SNS topics: arn:aws:sns:...
+- SQS queues: https://sqs.... or http://sqs....
+- Kinesis Data Streams: arn:aws:kinesis:... or kinesis://<stream name>
+- Firehose delivery streams: arn:aws:firehose:... or firehose://<stream name>
+- Local JSON Lines files: file://<path>
+- In-memory sinks for tests: memory://<name>
+
+Additional backends can be added with default_registry.register().
+"""
+
+import os
+import json
+import uuid
+import threading
+from collections import defaultdict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+def single_message_summary(response: Dict, articles_count: int) -> Dict:
+    """
+    Build a publish summary for articles sent together as one message.
+
+    Args:
+        response: The broker response containing a MessageId
+        articles_count: Number of articles in the message
+
+    Returns:
+        Dict with sent/failed counts, message IDs, errors and request count
+    """
+    return {
+        "sent": articles_count,
+        "failed": 0,
+        "requests": 1,
+        "message_ids": [response.get("MessageId")],
+        "errors": [],
+    }
+
+
+class BrokerBackend:
+    """
+    Base class for message broker backends.
+
+    Subclasses set name and prefixes, and implement publish. Backends that
+    write every article as its own record set per_record.
+    """
+
+    name = "unknown"
+    prefixes: Tuple[str, ...] = ()
+    per_record = False
+
+    def matches(self, broker_reference: str) -> bool:
+        """Return whether this backend handles the broker reference."""
+        return broker_reference.startswith(self.prefixes)
+
+    def publish(
+        self,
+        client: Any,
+        broker_reference: str,
+        articles: List[Dict],
+        per_article: bool,
+    ) -> Dict:
+        """
+        Publish articles to the broker.
+
+        Args:
+            client: The GuardianApiClient publishing the articles
+            broker_reference: Reference to the message broker
+            articles: List of article data to publish
+            per_article: Publish one message per article instead of one
+                message for all articles
+
+        Returns:
+            Dict with sent/failed counts, message IDs, errors and request
+            count. Error Ids are indexes into articles.
+        """
+        raise NotImplementedError
+
+
+class SnsBackend(BrokerBackend):
+    """
+    Publishes to SNS topics.
+
+    For FIFO topics, messages go to message_group_id, or with group_by to a
+    group per article 'id' or 'section', so groups are delivered in parallel.
+    Per-article messages are deduplicated on a hash of the article URL, or on
+    the ID returned by the deduplication_id function.
+    """
+
+    name = "sns"
+    prefixes = ("arn:aws:sns:",)
+
+    def __init__(
+        self,
+        message_group_id: Optional[str] = None,
+        group_by: Optional[str] = None,
+        deduplication_id: Optional[Callable[[Dict], str]] = None,
+    ):
+        if group_by not in (None, "id", "section"):
+            raise ValueError("group_by must be 'id' or 'section'")
+        self.message_group_id = message_group_id
+        self.group_by = group_by
+        self.deduplication_id = deduplication_id
+
+    def publish(self, client, broker_reference, articles, per_article):
+        if per_article:
+            return client.publish_to_sns_batch(
+                broker_reference,
+                articles,
+                message_group_id=self.message_group_id,
+                group_by=self.group_by,
+                deduplication_id=self.deduplication_id,
+            )
+        response = client.publish_to_sns(
+            broker_reference, articles, message_group_id=self.message_group_id
+        )
+        return single_message_summary(response, len(articles))
+
+
+class SqsBackend(BrokerBackend):
+    """Publishes to SQS queues."""
+
+    name = "sqs"
+    prefixes = ("https://sqs.", "http://sqs.")
+
+    def publish(self, client, broker_reference, articles, per_article):
+        if per_article:
+            return client.publish_to_sqs_batch(broker_reference, articles)
+        response = client.publish_to_sqs(broker_reference, articles)
+        return single_message_summary(response, len(articles))
+
+
+class KinesisBackend(BrokerBackend):
+    """
+    Publishes every article as its own record to a Kinesis data stream.
+
+    Records are partitioned on the article id, or on its section when
+    partition_by is 'section'.
+    """
+
+    name = "kinesis"
+    prefixes = ("arn:aws:kinesis:", "kinesis://")
+    per_record = True
+
+    def __init__(self, partition_by: str = "id", max_attempts: int = 3):
+        if partition_by not in ("id", "section"):
+            raise ValueError("partition_by must be 'id' or 'section'")
+        self.partition_by = partition_by
+        self.max_attempts = max_attempts
+
+    def publish(self, client, broker_reference, articles, per_article):
+        stream = broker_reference
+        if stream.startswith("kinesis://"):
+            stream = stream[len("kinesis://") :]
+        return client.publish_to_kinesis(
+            stream, articles, self.max_attempts, self.partition_by
+        )
+
+
+class FirehoseBackend(BrokerBackend):
+    """Publishes every article as its own record to a Firehose delivery stream."""
+
+    name = "firehose"
+    prefixes = ("arn:aws:firehose:", "firehose://")
+    per_record = True
+
+    def publish(self, client, broker_reference, articles, per_article):
+        if broker_reference.startswith("firehose://"):
+            stream_name = broker_reference[len("firehose://") :]
+        else:
+            stream_name = broker_reference.split("deliverystream/", 1)[-1]
+        return client.publish_to_firehose(stream_name, articles)
+
+
+class FileBackend(BrokerBackend):
+    """
+    Appends messages to a local JSON Lines file.
+
+    Each line holds one message, which is a list of articles, or a single
+    article when publishing per article.
+    """
+
+    name = "file"
+    prefixes = ("file://",)
+
+    def __init__(self):
+        self._lock = threading.Lock()
+
+    def publish(self, client, broker_reference, articles, per_article):
+        path = broker_reference[len("file://") :]
+        messages = articles if per_article else [articles]
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        with self._lock, open(path, "a", encoding="utf-8") as jsonl_file:
+            for message in messages:
+                jsonl_file.write(json.dumps(message) + "\n")
+
+        return {
+            "sent": len(articles),
+            "failed": 0,
+            "requests": 1,
+            "message_ids": [None] * len(messages),
+            "errors": [],
+        }
+
+
+class MemoryBackend(BrokerBackend):
+    """Keeps published messages in memory, keyed on the sink name."""
+
+    name = "memory"
+    prefixes = ("memory://",)
+
+    def __init__(self):
+        self.messages: Dict[str, List] = defaultdict(list)
+        self._lock = threading.Lock()
+
+    def publish(self, client, broker_reference, articles, per_article):
+        sink = broker_reference[len("memory://") :]
+        messages = list(articles) if per_article else [list(articles)]
+        message_ids = [str(uuid.uuid4()) for _ in messages]
+
+        with self._lock:
+            self.messages[sink].extend(messages)
+
+        return {
+            "sent": len(articles),
+            "failed": 0,
+            "requests": 1,
+            "message_ids": message_ids,
+            "errors": [],
+        }
+
+    def clear(self):
+        """Discard every stored message."""
+        with self._lock:
+            self.messages.clear()
+
+
+class BrokerRegistry:
+    """Ordered collection of backends, resolved by broker reference."""
+
+    def __init__(self):
+        self._backends: List[BrokerBackend] = []
+        self._lock = threading.Lock()
+
+    def register(self, backend: BrokerBackend) -> BrokerBackend:
+        """
+        Add a backend, replacing any registered backend with the same name.
+
+        Args:
+            backend: The backend to register
+
+        Returns:
+            The registered backend
+        """
+        with self._lock:
+            self._backends = [b for b in self._backends if b.name != backend.name]
+            self._backends.append(backend)
+        return backend
+
+    def get(self, name: str) -> Optional[BrokerBackend]:
+        """Return the backend registered under a name, if any."""
+        for backend in self._backends:
+            if backend.name == name:
+                return backend
+        return None
+
+    def resolve(self, broker_reference: str) -> Optional[BrokerBackend]:
+        """
+        Find the backend that handles a broker reference.
+
+        Args:
+            broker_reference: Reference to the message broker
+
+        Returns:
+            The matching backend, or None if no backend handles it
+        """
+        for backend in self._backends:
+            if backend.matches(broker_reference):
+                return backend
+        return None
+
+    def names(self) -> List[str]:
+        """Return the names of the registered backends."""
+        return [backend.name for backend in self._backends]
+
+
+default_registry = BrokerRegistry()
+for _backend in (
+    SnsBackend(),
+    SqsBackend(),
+    KinesisBackend(),
+    FirehoseBackend(),
+    FileBackend(),
+    MemoryBackend(),
+):
+    default_registry.register(_backend)
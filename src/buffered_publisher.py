@@ -0,0 +1,330 @@
+"""
+Micro-batching buffer that coalesces articles from many searches.
+
+Each publish_articles call normally makes its own broker request, however
+few articles it found. A BufferedPublisher instead collects the articles
+for each broker and publishes them together once a buffer holds enough
+articles or bytes, once its oldest article reaches a maximum age, or when
+flush() or close() is called. One background thread per publisher flushes
+the buffers that have aged, whichever broker they are for.
+"""
+
+import os
+import json
+import time
+import logging
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+logger = logging.getLogger(__name__)
+logger.setLevel(os.environ.get("LOG_LEVEL", "INFO"))
+
+# Called once a batch holding some of the articles passed to add() has been
+# sent, with their positions in that list that were published and that failed.
+PublishCallback = Callable[[List[int], List[int]], None]
+
+# Articles taken from a buffer, with the callback and position of each.
+_Batch = Tuple[List[Dict], List[Tuple[Optional[PublishCallback], int]]]
+
+
+class _Buffer:
+    """Articles waiting to be published to one broker."""
+
+    def __init__(self):
+        self.articles: List[Dict] = []
+        self.sizes: List[int] = []
+        self.arrived: List[float] = []
+        self.callbacks: List[Tuple[Optional[PublishCallback], int]] = []
+        self.bytes = 0
+
+    @property
+    def started(self) -> Optional[float]:
+        """When the oldest buffered article arrived, or None if empty."""
+        return self.arrived[0] if self.arrived else None
+
+
+class BufferedPublisher:
+    """
+    Thread-safe buffers of articles per broker, published in coalesced batches.
+
+    Batches are sent with the broker backend's publish, as one message of up
+    to max_articles articles, or with per_article, as one message per article
+    through the broker's batch API.
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        max_articles: int = 100,
+        max_bytes: int = 200 * 1024,
+        max_age: float = 1.0,
+    ):
+        """
+        Initialize the publisher.
+
+        Args:
+            client: The GuardianApiClient whose broker registry and clients
+                are used to publish
+            max_articles: Number of articles that triggers a flush (default: 100)
+            max_bytes: JSON size in bytes of the buffered articles that
+                triggers a flush, kept under the 256 KiB SNS and SQS message
+                limit (default: 200 KiB)
+            max_age: Seconds after which a buffer's oldest article is
+                flushed (default: 1.0)
+
+        Raises:
+            ValueError: If a limit is not positive
+        """
+        if max_articles < 1 or max_bytes < 1:
+            raise ValueError("max_articles and max_bytes must be at least 1")
+        if max_age <= 0:
+            raise ValueError("max_age must be positive")
+
+        self.client = client
+        self.max_articles = max_articles
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self.flushes = 0
+        self.articles = 0
+        self.requests = 0
+        self.failed = 0
+        self._buffers: Dict[Tuple[str, bool], _Buffer] = {}
+        self._lock = threading.Lock()
+        self._wakeup = threading.Condition(self._lock)
+        self._idle = threading.Condition(self._lock)
+        self._in_progress = 0
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+
+    def __enter__(self) -> "BufferedPublisher":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def add(
+        self,
+        broker_reference: str,
+        articles: List[Dict],
+        per_article=False,
+        on_published: Optional[PublishCallback] = None,
+    ):
+        """
+        Buffer articles for a broker, publishing any batches that are full.
+
+        Full batches are published by the calling thread.
+
+        Args:
+            broker_reference: Reference to the message broker
+            articles: Processed article data
+            per_article: Publish one message per article in batched requests
+            on_published: Optional callback run after each batch holding
+                some of the articles is sent, with the positions in articles
+                of those published and of those that failed
+
+        Raises:
+            RuntimeError: If the publisher has been closed
+        """
+        if not articles:
+            return
+        sizes = [len(json.dumps(article).encode("utf-8")) for article in articles]
+        ready = []
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("BufferedPublisher is closed")
+            key = (broker_reference, per_article)
+            buffer = self._buffers.setdefault(key, _Buffer())
+            buffer.articles.extend(articles)
+            buffer.sizes.extend(sizes)
+            buffer.arrived.extend([time.monotonic()] * len(articles))
+            buffer.callbacks.extend(
+                (on_published, position) for position in range(len(articles))
+            )
+            buffer.bytes += sum(sizes)
+            while (
+                len(buffer.articles) >= self.max_articles
+                or buffer.bytes >= self.max_bytes
+            ):
+                ready.append((key, self._take(buffer)))
+            self._in_progress += len(ready)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, daemon=True)
+                self._thread.start()
+            self._wakeup.notify()
+
+        self._publish_all(ready)
+
+    def _take(self, buffer: _Buffer) -> _Batch:
+        """Remove the next batch within the size limits from a buffer."""
+        count = 0
+        size = 0
+        for article_size in buffer.sizes:
+            if count and (
+                count == self.max_articles or size + article_size > self.max_bytes
+            ):
+                break
+            count += 1
+            size += article_size
+
+        batch = (buffer.articles[:count], buffer.callbacks[:count])
+        del buffer.articles[:count]
+        del buffer.sizes[:count]
+        del buffer.arrived[:count]
+        del buffer.callbacks[:count]
+        buffer.bytes -= size
+        return batch
+
+    def _take_all(self, buffer: _Buffer) -> List[_Batch]:
+        batches = []
+        while buffer.articles:
+            batches.append(self._take(buffer))
+        return batches
+
+    def _publish(self, key: Tuple[str, bool], taken: _Batch) -> Dict:
+        broker_reference, per_article = key
+        batch, callbacks = taken
+        try:
+            backend = self.client.resolve_broker(broker_reference)
+            with self.client.metrics.timer("publish"):
+                summary = backend.publish(
+                    self.client, broker_reference, batch, per_article
+                )
+        except Exception as e:
+            logger.error(
+                f"Error publishing {len(batch)} buffered articles to "
+                f"{broker_reference}: {str(e)}"
+            )
+            summary = {
+                "sent": 0,
+                "failed": len(batch),
+                "requests": 0,
+                "errors": [{"Id": str(index)} for index in range(len(batch))],
+            }
+
+        metrics = self.client.metrics
+        metrics.count("articles_published", len(batch) - summary["failed"])
+        metrics.count("articles_failed", summary["failed"])
+        metrics.count("broker_requests", summary.get("requests", 0))
+        with self._lock:
+            self.flushes += 1
+            self.articles += len(batch)
+            self.requests += summary.get("requests", 0)
+            self.failed += summary["failed"]
+
+        failed_ids = {error["Id"] for error in summary.get("errors", [])}
+        outcomes: Dict[PublishCallback, Tuple[List[int], List[int]]] = {}
+        for index, (callback, position) in enumerate(callbacks):
+            if callback is not None:
+                published, failed = outcomes.setdefault(callback, ([], []))
+                (failed if str(index) in failed_ids else published).append(position)
+        for callback, (published, failed) in outcomes.items():
+            try:
+                callback(published, failed)
+            except Exception as e:
+                logger.error(f"Error in publish callback: {str(e)}")
+        return summary
+
+    def _publish_all(self, ready: List[Tuple[Tuple[str, bool], _Batch]]) -> int:
+        """Publish batches taken from the buffers, returning the failed count."""
+        failed = 0
+        try:
+            for key, batch in ready:
+                failed += self._publish(key, batch)["failed"]
+        finally:
+            with self._lock:
+                self._in_progress -= len(ready)
+                self._idle.notify_all()
+        return failed
+
+    def flush(self, broker_reference: Optional[str] = None) -> Dict:
+        """
+        Publish everything buffered, for one broker or for all of them.
+
+        Also waits for batches that other threads are publishing, so
+        everything added before the call has been published when it returns.
+
+        Args:
+            broker_reference: Optional broker to flush (default: all)
+
+        Returns:
+            Dict with the number of batches, articles and failed articles
+            published by this flush
+        """
+        with self._lock:
+            ready = [
+                (key, batch)
+                for key, buffer in self._buffers.items()
+                if broker_reference is None or key[0] == broker_reference
+                for batch in self._take_all(buffer)
+            ]
+            self._in_progress += len(ready)
+
+        failed = self._publish_all(ready)
+        with self._lock:
+            while self._in_progress:
+                self._idle.wait()
+        return {
+            "batches": len(ready),
+            "articles": sum(len(articles) for _, (articles, _) in ready),
+            "failed": failed,
+        }
+
+    def close(self) -> Dict:
+        """
+        Publish everything buffered and stop the background thread.
+
+        Returns:
+            Dict with the number of batches, articles and failed articles
+            published by the final flush
+        """
+        with self._lock:
+            self._closed = True
+            self._wakeup.notify()
+        if self._thread is not None:
+            self._thread.join()
+        return self.flush()
+
+    def _run(self):
+        """Flush buffers whose oldest article has reached max_age."""
+        while True:
+            with self._lock:
+                if self._closed:
+                    return
+                now = time.monotonic()
+                started = [
+                    buffer.started
+                    for buffer in self._buffers.values()
+                    if buffer.started is not None
+                ]
+                if not started:
+                    self._wakeup.wait()
+                    continue
+                due = min(started) + self.max_age
+                if due > now:
+                    self._wakeup.wait(due - now)
+                    continue
+                ready = [
+                    (key, batch)
+                    for key, buffer in self._buffers.items()
+                    if buffer.started is not None
+                    and buffer.started + self.max_age <= now
+                    for batch in self._take_all(buffer)
+                ]
+                self._in_progress += len(ready)
+
+            self._publish_all(ready)
+
+    def stats(self) -> Dict:
+        """Return the buffered count and the totals of everything published."""
+        with self._lock:
+            return {
+                "buffered": sum(len(b.articles) for b in self._buffers.values()),
+                "flushes": self.flushes,
+                "articles": self.articles,
+                "requests": self.requests,
+                "failed": self.failed,
+                "articles_per_request": (
+                    round(self.articles / self.requests, 1) if self.requests else 0.0
+                ),
+            }
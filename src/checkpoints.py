@@ -0,0 +1,157 @@
+"""
+Stores recording the progress of long-running ingestion jobs.
+
+Checkpoints are JSON-serialisable dicts saved under a string key, so an
+interrupted job can resume from where it stopped instead of starting over.
+Each checkpoint is written as a single record, so a reader sees either the
+previous checkpoint or the new one in full.
+"""
+
+import json
+import time
+import sqlite3
+import threading
+from typing import Any, Dict, Optional
+
+
+class CheckpointStore:
+    """Base class for checkpoint stores."""
+
+    def get(self, key: str) -> Optional[Dict]:
+        """
+        Return the checkpoint saved under a key.
+
+        Args:
+            key: The checkpoint key
+
+        Returns:
+            The saved checkpoint, or None if there is none
+        """
+        raise NotImplementedError
+
+    def put(self, key: str, checkpoint: Dict):
+        """
+        Save a checkpoint, replacing any previous one under the same key.
+
+        Args:
+            key: The checkpoint key
+            checkpoint: JSON-serialisable checkpoint data
+        """
+        raise NotImplementedError
+
+    def delete(self, key: str):
+        """
+        Remove the checkpoint saved under a key, if any.
+
+        Args:
+            key: The checkpoint key
+        """
+        raise NotImplementedError
+
+
+class InMemoryCheckpointStore(CheckpointStore):
+    """Checkpoints held in process memory."""
+
+    def __init__(self):
+        self._checkpoints: Dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Dict]:
+        with self._lock:
+            checkpoint = self._checkpoints.get(key)
+        return json.loads(checkpoint) if checkpoint is not None else None
+
+    def put(self, key: str, checkpoint: Dict):
+        # Stored serialised so later changes to the dict are not recorded.
+        with self._lock:
+            self._checkpoints[key] = json.dumps(checkpoint)
+
+    def delete(self, key: str):
+        with self._lock:
+            self._checkpoints.pop(key, None)
+
+
+class SQLiteCheckpointStore(CheckpointStore):
+    """Checkpoints persisted in a SQLite database file."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS checkpoints "
+            "(key TEXT PRIMARY KEY, checkpoint TEXT NOT NULL)"
+        )
+        self._connection.commit()
+
+    def close(self):
+        """Close the database connection."""
+        self._connection.close()
+
+    def get(self, key: str) -> Optional[Dict]:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT checkpoint FROM checkpoints WHERE key = ?", (key,)
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def put(self, key: str, checkpoint: Dict):
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO checkpoints (key, checkpoint) VALUES (?, ?)",
+                (key, json.dumps(checkpoint)),
+            )
+
+    def delete(self, key: str):
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM checkpoints WHERE key = ?", (key,))
+
+
+class DynamoDBCheckpointStore(CheckpointStore):
+    """
+    Checkpoints persisted in a DynamoDB table, shared across Lambda invocations.
+
+    The table needs a string partition key named "key". Items carry an
+    expires_at attribute that can be used as the table's TTL attribute.
+    """
+
+    def __init__(self, table_name: str, client: Any = None, ttl: float = 604800):
+        self.table_name = table_name
+        self.ttl = ttl
+        self._client = client
+
+    @property
+    def client(self) -> Any:
+        """The DynamoDB client, created on first use."""
+        if self._client is None:
+            try:
+                from .guardian_api_client import get_boto3_client
+            except ImportError:
+                from guardian_api_client import get_boto3_client
+
+            self._client = get_boto3_client("dynamodb")
+        return self._client
+
+    def get(self, key: str) -> Optional[Dict]:
+        response = self.client.get_item(
+            TableName=self.table_name,
+            Key={"key": {"S": key}},
+            ConsistentRead=True,
+        )
+        item = response.get("Item")
+        if item is None or float(item["expires_at"]["N"]) <= time.time():
+            return None
+        return json.loads(item["checkpoint"]["S"])
+
+    def put(self, key: str, checkpoint: Dict):
+        self.client.put_item(
+            TableName=self.table_name,
+            Item={
+                "key": {"S": key},
+                "checkpoint": {"S": json.dumps(checkpoint)},
+                "expires_at": {"N": str(int(time.time() + self.ttl))},
+            },
+        )
+
+    def delete(self, key: str):
+        self.client.delete_item(TableName=self.table_name, Key={"key": {"S": key}})
@@ -0,0 +1,166 @@
+"""
+Claim-check offloading of large article bodies to S3.
+
+When GuardianApiClient is given a ClaimCheck, processed articles keep their
+full bodyText. Before publishing, bodies larger than the threshold are
+written to S3 and replaced in the message by a claimCheck pointer, so
+messages stay within broker size limits. Bodies are stored either as one
+JSON object per article or as one NDJSON object per published batch.
+
+Consumers restore the bodies with resolve_claim_checks.
+"""
+
+import json
+import hashlib
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+# Field holding the S3 location of an offloaded body.
+CLAIM_CHECK_FIELD = "claimCheck"
+
+
+class ClaimCheck:
+    """Writes large article bodies to an S3 bucket."""
+
+    MODES = ("article", "batch")
+
+    def __init__(
+        self,
+        bucket: str,
+        prefix: str = "articles/",
+        threshold: int = 16384,
+        mode: str = "article",
+        max_workers: int = 8,
+    ):
+        if not bucket:
+            raise ValueError("Claim-check bucket is required")
+        if mode not in self.MODES:
+            raise ValueError("mode must be 'article' or 'batch'")
+        if threshold < 0:
+            raise ValueError("threshold must not be negative")
+
+        self.bucket = bucket
+        self.prefix = prefix
+        self.threshold = threshold
+        self.mode = mode
+        self.max_workers = max_workers
+
+    def _key(self, name: str) -> str:
+        today = datetime.now(timezone.utc).strftime("%Y/%m/%d")
+        return f"{self.prefix}{today}/{name}"
+
+    def offload(self, s3_client: Any, articles: List[Dict]) -> List[Dict]:
+        """
+        Write bodies over the threshold to S3 and return the messages to publish.
+
+        Args:
+            s3_client: boto3 S3 client
+            articles: Processed articles, possibly carrying a bodyText
+
+        Returns:
+            The articles in the same order, with large bodies replaced by a
+            claimCheck pointer holding the bucket, key and, in batch mode,
+            the line of the NDJSON object
+        """
+        large = [
+            index
+            for index, article in enumerate(articles)
+            if len((article.get("bodyText") or "").encode("utf-8")) > self.threshold
+        ]
+        if not large:
+            return articles
+
+        messages = list(articles)
+        if self.mode == "batch":
+            key = self._key(f"{uuid.uuid4()}.ndjson")
+            lines = [
+                json.dumps(
+                    {
+                        "webUrl": articles[index].get("webUrl"),
+                        "bodyText": articles[index]["bodyText"],
+                    }
+                )
+                for index in large
+            ]
+            s3_client.put_object(
+                Bucket=self.bucket,
+                Key=key,
+                Body=("\n".join(lines) + "\n").encode("utf-8"),
+                ContentType="application/x-ndjson",
+            )
+            for line, index in enumerate(large):
+                messages[index] = self._pointer(articles[index], key, line)
+            return messages
+
+        def put(index: int) -> str:
+            article = articles[index]
+            source = article.get("webUrl") or article["bodyText"]
+            key = self._key(
+                f"{hashlib.sha256(source.encode('utf-8')).hexdigest()}.json"
+            )
+            s3_client.put_object(
+                Bucket=self.bucket,
+                Key=key,
+                Body=json.dumps(
+                    {"webUrl": article.get("webUrl"), "bodyText": article["bodyText"]}
+                ).encode("utf-8"),
+                ContentType="application/json",
+            )
+            return key
+
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(large))) as pool:
+            keys = list(pool.map(put, large))
+        for index, key in zip(large, keys):
+            messages[index] = self._pointer(articles[index], key)
+        return messages
+
+    def _pointer(self, article: Dict, key: str, line: Optional[int] = None) -> Dict:
+        pointer = {"bucket": self.bucket, "key": key}
+        if line is not None:
+            pointer["line"] = line
+        message = {name: value for name, value in article.items() if name != "bodyText"}
+        message[CLAIM_CHECK_FIELD] = pointer
+        return message
+
+
+def resolve_claim_checks(articles: List[Dict], s3_client: Any) -> List[Dict]:
+    """
+    Restore article bodies that were offloaded to S3.
+
+    Each S3 object is fetched once, however many articles point into it.
+
+    Args:
+        articles: Articles from a received message
+        s3_client: boto3 S3 client
+
+    Returns:
+        The articles with bodyText restored and claimCheck removed
+    """
+    objects: Dict = {}
+    resolved = []
+    for article in articles:
+        pointer = article.get(CLAIM_CHECK_FIELD)
+        if not pointer:
+            resolved.append(article)
+            continue
+
+        location = (pointer["bucket"], pointer["key"])
+        if location not in objects:
+            response = s3_client.get_object(
+                Bucket=pointer["bucket"], Key=pointer["key"]
+            )
+            objects[location] = response["Body"].read().decode("utf-8")
+        body = objects[location]
+        if "line" in pointer:
+            stored = json.loads(body.splitlines()[pointer["line"]])
+        else:
+            stored = json.loads(body)
+
+        article = {
+            name: value for name, value in article.items() if name != CLAIM_CHECK_FIELD
+        }
+        article["bodyText"] = stored["bodyText"]
+        resolved.append(article)
+    return resolved
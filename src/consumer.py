@@ -0,0 +1,298 @@
+"""
+Batch consumer for the articles GuardianApiClient publishes to SQS.
+
+Several pollers long-poll the queue with ReceiveMessage, up to 10 messages
+per call. Received messages are decoded, their claim checks are resolved and
+the articles are handed to a callback on a thread pool. Messages are deleted
+with DeleteMessageBatch once the callback returns, so a failing callback
+leaves them on the queue to be redelivered after the visibility timeout.
+"""
+
+import os
+import json
+import time
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+try:
+    from .claim_check import CLAIM_CHECK_FIELD, resolve_claim_checks
+    from .guardian_api_client import Boto3ClientAttribute
+    from .message_encoding import CONTENT_ENCODING_ATTRIBUTE, decode_message
+except ImportError:
+    from claim_check import CLAIM_CHECK_FIELD, resolve_claim_checks
+    from guardian_api_client import Boto3ClientAttribute
+    from message_encoding import CONTENT_ENCODING_ATTRIBUTE, decode_message
+
+
+logger = logging.getLogger(__name__)
+logger.setLevel(os.environ.get("LOG_LEVEL", "INFO"))
+
+SQS_MAX_RECEIVE = 10
+
+
+def decode_articles(message: Dict) -> List[Dict]:
+    """
+    Decode the articles carried by a received SQS message.
+
+    Handles messages sent directly to the queue, both a list of articles and
+    a single article per message, and SNS notifications delivered to a
+    subscribed queue without raw message delivery.
+
+    Args:
+        message: A message as returned by SQS ReceiveMessage
+
+    Returns:
+        The articles in the message
+
+    Raises:
+        ValueError: If the body cannot be decoded
+    """
+    attributes = message.get("MessageAttributes") or {}
+    if CONTENT_ENCODING_ATTRIBUTE in attributes:
+        payload = decode_message(message["Body"], attributes)
+    else:
+        payload = json.loads(message["Body"])
+        if isinstance(payload, dict) and payload.get("Type") == "Notification":
+            payload = decode_message(
+                payload["Message"], payload.get("MessageAttributes")
+            )
+    return payload if isinstance(payload, list) else [payload]
+
+
+class ArticleConsumer:
+    """
+    Reads article messages from an SQS queue and passes them to a callback.
+
+    The callback receives the articles from one ReceiveMessage call at a
+    time, in a list of up to 10 messages' worth of articles. The number of
+    batches waiting for or being handled by the callback is limited to twice
+    the number of workers, so pollers stop receiving when the callback falls
+    behind.
+    """
+
+    sqs_client = Boto3ClientAttribute("sqs")
+    s3_client = Boto3ClientAttribute("s3")
+
+    def __init__(
+        self,
+        queue_url: str,
+        handler: Callable[[List[Dict]], Any],
+        pollers: int = 4,
+        workers: int = 8,
+        wait_time: int = 20,
+        visibility_timeout: Optional[int] = None,
+        sqs_client: Any = None,
+        s3_client: Any = None,
+    ):
+        """
+        Initialize the consumer.
+
+        Args:
+            queue_url: The URL of the SQS queue
+            handler: Callback called with each batch of decoded articles
+            pollers: Number of concurrent ReceiveMessage loops (default: 4)
+            workers: Number of threads running the callback (default: 8)
+            wait_time: Long-poll wait in seconds, 0 to 20 (default: 20)
+            visibility_timeout: Optional visibility timeout in seconds for
+                received messages, overriding the queue's
+            sqs_client: Optional boto3 SQS client
+            s3_client: Optional boto3 S3 client used to resolve claim checks
+
+        Raises:
+            ValueError: If pollers, workers or wait_time is out of range
+        """
+        if pollers < 1 or workers < 1:
+            raise ValueError("pollers and workers must be at least 1")
+        if not 0 <= wait_time <= 20:
+            raise ValueError("wait_time must be between 0 and 20 seconds")
+
+        self.queue_url = queue_url
+        self.handler = handler
+        self.pollers = pollers
+        self.workers = workers
+        self.wait_time = wait_time
+        self.visibility_timeout = visibility_timeout
+        if sqs_client is not None:
+            self.sqs_client = sqs_client
+        if s3_client is not None:
+            self.s3_client = s3_client
+
+        self._stop = threading.Event()
+        self._in_flight = threading.BoundedSemaphore(workers * 2)
+        self._stats_lock = threading.Lock()
+        self._stats = {}
+
+    def stop(self):
+        """Ask the pollers to finish after their current receive."""
+        self._stop.set()
+
+    def _count(self, **counts: int):
+        with self._stats_lock:
+            for name, count in counts.items():
+                self._stats[name] += count
+
+    def receive(self) -> List[Dict]:
+        """
+        Receive up to 10 messages with a single long-poll request.
+
+        Returns:
+            The received messages, empty if the wait time passed without any
+        """
+        kwargs = {}
+        if self.visibility_timeout is not None:
+            kwargs["VisibilityTimeout"] = self.visibility_timeout
+        response = self.sqs_client.receive_message(
+            QueueUrl=self.queue_url,
+            MaxNumberOfMessages=SQS_MAX_RECEIVE,
+            WaitTimeSeconds=self.wait_time,
+            MessageAttributeNames=["All"],
+            **kwargs,
+        )
+        messages = response.get("Messages", [])
+        self._count(receives=1, received=len(messages))
+        return messages
+
+    def decode(self, messages: List[Dict]) -> Tuple[List[Dict], List[Dict]]:
+        """
+        Decode a batch of messages.
+
+        Messages that cannot be decoded are logged and left on the queue, so
+        a redrive policy can move them to a dead-letter queue.
+
+        Args:
+            messages: Messages as returned by ReceiveMessage
+
+        Returns:
+            The articles and the messages they were decoded from
+        """
+        articles = []
+        decoded = []
+        for message in messages:
+            try:
+                articles.extend(decode_articles(message))
+            except Exception as e:
+                logger.error(
+                    f"Could not decode message {message.get('MessageId')}: {str(e)}"
+                )
+                self._count(undecodable=1)
+                continue
+            decoded.append(message)
+
+        if any(CLAIM_CHECK_FIELD in article for article in articles):
+            articles = resolve_claim_checks(articles, self.s3_client)
+        return articles, decoded
+
+    def delete(self, messages: List[Dict]):
+        """
+        Delete handled messages with a single DeleteMessageBatch request.
+
+        Args:
+            messages: Messages as returned by ReceiveMessage
+        """
+        response = self.sqs_client.delete_message_batch(
+            QueueUrl=self.queue_url,
+            Entries=[
+                {"Id": str(index), "ReceiptHandle": message["ReceiptHandle"]}
+                for index, message in enumerate(messages)
+            ],
+        )
+        failed = response.get("Failed", [])
+        for error in failed:
+            logger.warning(
+                f"Could not delete message {error['Id']}: {error.get('Message')}"
+            )
+        self._count(deleted=len(messages) - len(failed))
+
+    def _handle(self, messages: List[Dict]):
+        try:
+            try:
+                articles, decoded = self.decode(messages)
+            except Exception as e:
+                logger.error(
+                    f"Could not resolve claim checks for {len(messages)} "
+                    f"messages: {str(e)}"
+                )
+                self._count(resolve_errors=1)
+                return
+            if not decoded:
+                return
+            try:
+                self.handler(articles)
+            except Exception as e:
+                logger.error(f"Handler failed for {len(decoded)} messages: {str(e)}")
+                self._count(handler_errors=1)
+                return
+            self._count(articles=len(articles))
+            try:
+                self.delete(decoded)
+            except Exception as e:
+                logger.error(f"Could not delete {len(decoded)} messages: {str(e)}")
+                self._count(delete_errors=1)
+        finally:
+            self._in_flight.release()
+
+    def _poll(self, executor: ThreadPoolExecutor, stop_when_empty: bool):
+        while not self._stop.is_set():
+            try:
+                messages = self.receive()
+            except Exception as e:
+                logger.error(f"Error receiving from {self.queue_url}: {str(e)}")
+                self._count(receive_errors=1)
+                time.sleep(1)
+                continue
+            if not messages:
+                if stop_when_empty:
+                    return
+                continue
+            self._in_flight.acquire()
+            executor.submit(self._handle, messages)
+
+    def run(self, stop_when_empty: bool = False) -> Dict:
+        """
+        Consume messages until stop() is called.
+
+        Args:
+            stop_when_empty: Also stop each poller once a receive returns no
+                messages, e.g. to drain a queue in a batch job
+
+        Returns:
+            Dict with counts of receives, messages received and deleted,
+            articles handled, errors, and messages per second
+        """
+        self._stop.clear()
+        self._stats = {
+            "receives": 0,
+            "received": 0,
+            "deleted": 0,
+            "articles": 0,
+            "undecodable": 0,
+            "handler_errors": 0,
+            "resolve_errors": 0,
+            "delete_errors": 0,
+            "receive_errors": 0,
+        }
+        logger.info(
+            f"Consuming {self.queue_url} with {self.pollers} pollers "
+            f"and {self.workers} workers"
+        )
+
+        started = time.monotonic()
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            threads = [
+                threading.Thread(
+                    target=self._poll, args=(executor, stop_when_empty), daemon=True
+                )
+                for _ in range(self.pollers)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        elapsed = time.monotonic() - started
+        stats = dict(self._stats)
+        stats["elapsed_seconds"] = round(elapsed, 3)
+        stats["messages_per_second"] = round(stats["deleted"] / max(elapsed, 1e-6), 1)
+        return stats
@@ -0,0 +1,226 @@
+"""
+Near-duplicate suppression for articles published under overlapping terms.
+
+Articles are suppressed when their id has been published before, or when
+their contentPreview is a near duplicate of an earlier article's, e.g. a
+syndicated copy or an updated version. Near duplicates are found with 64-bit
+SimHash fingerprints of word shingles: similar texts differ in few bits.
+
+Fingerprints are split into bands for lookup. If two fingerprints differ in
+at most max_distance bits, at least one of max_distance + 1 bands matches
+exactly, so only articles sharing a band are compared. The index holds at
+most max_size articles and evicts the least recently seen, so memory stays
+flat in long-running workers.
+"""
+
+import re
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional
+
+try:
+    from .seen_articles import SeenArticleStore
+except ImportError:
+    from seen_articles import SeenArticleStore
+
+
+FINGERPRINT_BITS = 64
+
+_WORD = re.compile(r"\w+")
+
+
+def simhash(text: str, shingle_size: int = 2) -> int:
+    """
+    Compute the 64-bit SimHash fingerprint of a text.
+
+    Args:
+        text: The text to fingerprint
+        shingle_size: Number of consecutive words hashed together (default: 2)
+
+    Returns:
+        The fingerprint
+    """
+    words = _WORD.findall(text.lower())
+    if len(words) > shingle_size:
+        shingles = [
+            " ".join(words[i : i + shingle_size])
+            for i in range(len(words) - shingle_size + 1)
+        ]
+    else:
+        shingles = [" ".join(words)]
+
+    weights = [0] * FINGERPRINT_BITS
+    for shingle in shingles:
+        digest = hashlib.blake2b(shingle.encode("utf-8"), digest_size=8).digest()
+        value = int.from_bytes(digest, "big")
+        for bit in range(FINGERPRINT_BITS):
+            if value >> bit & 1:
+                weights[bit] += 1
+            else:
+                weights[bit] -= 1
+
+    fingerprint = 0
+    for bit, weight in enumerate(weights):
+        if weight > 0:
+            fingerprint |= 1 << bit
+    return fingerprint
+
+
+class ContentDeduplicator:
+    """Bounded, thread-safe index of published article ids and fingerprints."""
+
+    def __init__(
+        self,
+        max_size: int = 10000,
+        max_distance: int = 7,
+        shingle_size: int = 2,
+        min_words: int = 20,
+    ):
+        """
+        Initialize the deduplicator.
+
+        Args:
+            max_size: Maximum number of articles held in the index
+            max_distance: Maximum number of differing fingerprint bits for two
+                articles to count as near duplicates (default: 7)
+            shingle_size: Number of consecutive words hashed together
+            min_words: Previews shorter than this are only matched on id, as
+                their fingerprints are not reliable
+
+        Raises:
+            ValueError: If max_size or max_distance is out of range
+        """
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        if not 0 <= max_distance < 16:
+            raise ValueError("max_distance must be between 0 and 15")
+
+        self.max_size = max_size
+        self.max_distance = max_distance
+        self.shingle_size = shingle_size
+        self.min_words = min_words
+        self.exact = 0
+        self.near = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, Optional[int]]" = OrderedDict()
+        bands = max_distance + 1
+        self._band_bits = -(-FINGERPRINT_BITS // bands)
+        self._bands: List[Dict[int, set]] = [{} for _ in range(bands)]
+
+    def _band_values(self, fingerprint: int) -> List[int]:
+        mask = (1 << self._band_bits) - 1
+        return [
+            fingerprint >> (band * self._band_bits) & mask
+            for band in range(len(self._bands))
+        ]
+
+    def fingerprint(self, article: Dict) -> Optional[int]:
+        """
+        Fingerprint an article's contentPreview.
+
+        Args:
+            article: Processed article data
+
+        Returns:
+            The fingerprint, or None if the preview is missing or too short
+        """
+        preview = article.get("contentPreview")
+        if not preview or len(_WORD.findall(preview)) < self.min_words:
+            return None
+        return simhash(preview, self.shingle_size)
+
+    def _find_near(self, fingerprint: int) -> Optional[str]:
+        candidates = set()
+        for band, value in zip(self._bands, self._band_values(fingerprint)):
+            candidates.update(band.get(value, ()))
+        for key in candidates:
+            distance = (self._entries[key] ^ fingerprint).bit_count()
+            if distance <= self.max_distance:
+                return key
+        return None
+
+    def _remove(self, key: str):
+        fingerprint = self._entries.pop(key)
+        if fingerprint is None:
+            return
+        for band, value in zip(self._bands, self._band_values(fingerprint)):
+            keys = band[value]
+            keys.discard(key)
+            if not keys:
+                del band[value]
+
+    def check(self, article: Dict) -> bool:
+        """
+        Check whether an article duplicates one already indexed, and index it
+        if not.
+
+        Checking and indexing happen together, so when several threads
+        publish overlapping terms only the first to see an article gets it.
+
+        Args:
+            article: Processed article data
+
+        Returns:
+            True if the article is an exact or near duplicate
+        """
+        key = SeenArticleStore.article_key(article)
+        fingerprint = self.fingerprint(article)
+        with self._lock:
+            if key is not None and key in self._entries:
+                self._entries.move_to_end(key)
+                self.exact += 1
+                return True
+            if fingerprint is not None:
+                match = self._find_near(fingerprint)
+                if match is not None:
+                    self._entries.move_to_end(match)
+                    self.near += 1
+                    return True
+            if key is None:
+                return False
+
+            self._entries[key] = fingerprint
+            if fingerprint is not None:
+                for band, value in zip(self._bands, self._band_values(fingerprint)):
+                    band.setdefault(value, set()).add(key)
+            while len(self._entries) > self.max_size:
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+        return False
+
+    def filter(self, articles: Iterable[Dict]) -> List[Dict]:
+        """
+        Return only the articles that are not duplicates, indexing them.
+
+        Args:
+            articles: Processed article data
+
+        Returns:
+            List of articles that are neither exact nor near duplicates
+        """
+        return [article for article in articles if not self.check(article)]
+
+    def discard(self, articles: Iterable[Dict]):
+        """
+        Remove articles from the index, e.g. because publishing them failed.
+
+        Args:
+            articles: Processed article data
+        """
+        with self._lock:
+            for article in articles:
+                key = SeenArticleStore.article_key(article)
+                if key in self._entries:
+                    self._remove(key)
+
+    def stats(self) -> Dict:
+        """Return exact and near duplicate counts, evictions and index size."""
+        with self._lock:
+            return {
+                "exact": self.exact,
+                "near": self.near,
+                "evictions": self.evictions,
+                "size": len(self._entries),
+            }
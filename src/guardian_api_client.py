@@ -1,22 +1,447 @@
 import os
 import json
+import hashlib
 import logging
-from typing import Dict, List, Optional
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from itertools import takewhile
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 from datetime import datetime
 
 import requests
-import boto3
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    from .backfill import backfill as run_backfill
+    from .brokers import BrokerBackend, BrokerRegistry, default_registry
+    from .buffered_publisher import BufferedPublisher
+    from .checkpoints import CheckpointStore
+    from .claim_check import ClaimCheck
+    from .dedup import ContentDeduplicator
+    from .message_encoding import encode_message, validate_encoding
+    from .metrics import Metrics
+    from .projection import DEFAULT_PROJECTION, FieldProjection
+    from .rate_limiter import RateLimiter, backoff_delay, parse_retry_after
+    from .response_cache import ResponseCache
+    from .seen_articles import SeenArticleStore
+    from .streaming import ResultStream
+    from .watermarks import WatermarkStore
+except ImportError:
+    from backfill import backfill as run_backfill
+    from brokers import BrokerBackend, BrokerRegistry, default_registry
+    from buffered_publisher import BufferedPublisher
+    from checkpoints import CheckpointStore
+    from claim_check import ClaimCheck
+    from dedup import ContentDeduplicator
+    from message_encoding import encode_message, validate_encoding
+    from metrics import Metrics
+    from projection import DEFAULT_PROJECTION, FieldProjection
+    from rate_limiter import RateLimiter, backoff_delay, parse_retry_after
+    from response_cache import ResponseCache
+    from seen_articles import SeenArticleStore
+    from streaming import ResultStream
+    from watermarks import WatermarkStore
 
 
 logger = logging.getLogger(__name__)
 logger.setLevel(os.environ.get("LOG_LEVEL", "INFO"))
 
 
+# boto3 clients shared by every GuardianApiClient in the process, so warm
+# Lambda invocations reuse them.
+_boto3_clients: Dict[str, Any] = {}
+_boto3_clients_lock = threading.Lock()
+
+
+def get_boto3_client(service_name: str) -> Any:
+    """
+    Return a boto3 client for a service, creating it on first use.
+
+    boto3 is only imported here, so it is never loaded by processes that
+    do not publish, and only the broker that is used pays for a client.
+
+    Args:
+        service_name: The AWS service name, e.g. 'sns' or 'sqs'
+
+    Returns:
+        The shared boto3 client
+    """
+    with _boto3_clients_lock:
+        if service_name not in _boto3_clients:
+            import boto3
+
+            _boto3_clients[service_name] = boto3.client(service_name)
+        return _boto3_clients[service_name]
+
+
+def create_session(
+    pool_size: int = 10, max_retries: int = 3, backoff_factor: float = 0.5
+) -> requests.Session:
+    """
+    Create a keep-alive HTTP session with a connection pool and retry policy.
+
+    The adapter retries failed connections. Retryable HTTP statuses are
+    handled by GuardianApiClient so that Retry-After and the rate limiter
+    apply to them.
+
+    Args:
+        pool_size: Maximum number of pooled connections per host
+        max_retries: Number of retries for failed connections
+        backoff_factor: Backoff factor applied between retries
+
+    Returns:
+        A configured requests.Session
+    """
+    retry = Retry(
+        total=max_retries,
+        backoff_factor=backoff_factor,
+        allowed_methods=frozenset(["GET"]),
+        respect_retry_after_header=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry
+    )
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+# Attached to every published message.
+MESSAGE_ATTRIBUTES = {
+    "TTL": {
+        "DataType": "Number",
+        "StringValue": "259200",  # 3 days in seconds
+    }
+}
+
+
+# Limits shared by SQS SendMessageBatch and SNS PublishBatch.
+MAX_BATCH_ENTRIES = 10
+MAX_BATCH_BYTES = 262144  # 256 KiB, including message attributes
+
+# Message group used for FIFO topics when none is given.
+DEFAULT_MESSAGE_GROUP_ID = "guardian_content"
+
+# PutRecords and PutRecordBatch limits.
+KINESIS_MAX_RECORDS = 500
+KINESIS_MAX_BATCH_BYTES = 5242880  # 5 MiB, including partition keys
+KINESIS_MAX_RECORD_BYTES = 1048576  # 1 MiB, including the partition key
+FIREHOSE_MAX_RECORDS = 500
+FIREHOSE_MAX_BATCH_BYTES = 4194304  # 4 MiB
+FIREHOSE_MAX_RECORD_BYTES = 1024000  # 1,000 KiB
+
+# HTTP statuses retried with backoff by GuardianApiClient.
+RETRY_STATUSES = frozenset([429, 500, 502, 503, 504])
+
+# Base delay in seconds before re-sending entries that failed in a batch.
+BATCH_RETRY_BACKOFF = 0.1
+
+# Bytes read at a time when streaming a response body.
+STREAM_CHUNK_SIZE = 65536
+
+# Keys of the most recently published articles kept in a publish checkpoint,
+# enough to cover results shifted by articles published while resuming.
+CHECKPOINT_PUBLISHED_IDS = 1000
+
+
+class DeadlineExceededError(requests.Timeout):
+    """Raised when an API request cannot be made or retried before a deadline."""
+
+
+def batched(items: Iterable, size: int) -> Iterator[List]:
+    """
+    Group an iterable into lists of at most size items.
+
+    Args:
+        items: The items to group
+        size: Maximum number of items per group
+
+    Yields:
+        Lists of items
+    """
+    batch = []
+    for item in items:
+        batch.append(item)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def attributes_size(attributes: Dict) -> int:
+    """Return the number of bytes message attributes count towards size limits."""
+    return sum(
+        len(name.encode("utf-8"))
+        + len(value["DataType"].encode("utf-8"))
+        + len(value["StringValue"].encode("utf-8"))
+        for name, value in attributes.items()
+    )
+
+
+def chunk_batch_entries(
+    entries: Iterable[Dict],
+    size_of: Callable[[Dict], int],
+    max_entries: int = MAX_BATCH_ENTRIES,
+    max_bytes: int = MAX_BATCH_BYTES,
+) -> Iterator[List[Dict]]:
+    """
+    Group batch entries so each group fits the entry count and byte limits.
+
+    Args:
+        entries: Batch request entries
+        size_of: Function returning the size in bytes of an entry
+        max_entries: Maximum number of entries per batch
+        max_bytes: Maximum aggregate size in bytes per batch
+
+    Yields:
+        Lists of entries that can be sent in a single batch request
+    """
+    batch = []
+    batch_bytes = 0
+    for entry in entries:
+        entry_bytes = size_of(entry)
+        if batch and (
+            len(batch) >= max_entries or batch_bytes + entry_bytes > max_bytes
+        ):
+            yield batch
+            batch = []
+            batch_bytes = 0
+        batch.append(entry)
+        batch_bytes += entry_bytes
+    if batch:
+        yield batch
+
+
+def send_batches(
+    send: Callable[[List[Dict]], Dict],
+    entries: List[Dict],
+    size_of: Callable[[Dict], int],
+    max_attempts: int = 3,
+) -> Dict:
+    """
+    Send entries in size-aware batches, retrying only the entries that failed.
+
+    Entries larger than MAX_BATCH_BYTES are reported as failed without being
+    sent. Failures caused by the sender are not retried.
+
+    Args:
+        send: Function sending one batch and returning the batch response
+        entries: Batch request entries, each with a unique "Id"
+        size_of: Function returning the size in bytes of an entry
+        max_attempts: Maximum number of times an entry is sent (default: 3)
+
+    Returns:
+        Dict with sent/failed counts, message IDs, errors, and request and
+        retry counts
+    """
+    summary = {
+        "sent": 0,
+        "failed": 0,
+        "requests": 0,
+        "retries": 0,
+        "message_ids": [],
+        "errors": [],
+    }
+
+    sendable = []
+    for entry in entries:
+        if size_of(entry) > MAX_BATCH_BYTES:
+            summary["errors"].append(
+                {
+                    "Id": entry["Id"],
+                    "Code": "MessageTooLong",
+                    "Message": f"Entry exceeds {MAX_BATCH_BYTES} bytes",
+                }
+            )
+        else:
+            sendable.append(entry)
+
+    for batch in chunk_batch_entries(sendable, size_of):
+        pending = batch
+        for attempt in range(1, max_attempts + 1):
+            response = send(pending)
+            summary["requests"] += 1
+
+            for success in response.get("Successful", []):
+                summary["sent"] += 1
+                summary["message_ids"].append(success.get("MessageId"))
+
+            retry_ids = set()
+            for failure in response.get("Failed", []):
+                if failure.get("SenderFault") or attempt == max_attempts:
+                    summary["errors"].append(
+                        {
+                            "Id": failure["Id"],
+                            "Code": failure.get("Code"),
+                            "Message": failure.get("Message"),
+                        }
+                    )
+                else:
+                    retry_ids.add(failure["Id"])
+
+            pending = [entry for entry in pending if entry["Id"] in retry_ids]
+            if not pending:
+                break
+            logger.warning(f"Retrying {len(pending)} failed batch entries")
+            summary["retries"] += len(pending)
+            time.sleep(BATCH_RETRY_BACKOFF * 2 ** (attempt - 1))
+
+    summary["failed"] = len(summary["errors"])
+    return summary
+
+
+def kinesis_partition_key(article: Dict, partition_by: str = "id") -> str:
+    """
+    Return the Kinesis partition key for an article.
+
+    Partitioning on the article id spreads records evenly over shards.
+    Partitioning on the section keeps each section's articles in order on a
+    single shard, at the cost of hot shards for busy sections.
+
+    Args:
+        article: Article data containing an id, sectionId or webUrl
+        partition_by: Either 'id' or 'section' (default: 'id')
+
+    Returns:
+        The partition key
+
+    Raises:
+        ValueError: If partition_by is not 'id' or 'section'
+    """
+    if partition_by not in ("id", "section"):
+        raise ValueError("partition_by must be 'id' or 'section'")
+
+    # Processed articles only keep the webUrl, whose path is the article id
+    # and starts with the section id.
+    web_url = article.get("webUrl") or ""
+    path = web_url.split("://", 1)[-1].partition("/")[2]
+    article_id = article.get("id") or path or web_url
+    if partition_by == "section":
+        return article.get("sectionId") or article_id.partition("/")[0] or "unknown"
+    return article_id or "unknown"
+
+
+def build_search_params(
+    api_key: str,
+    search_term: str,
+    date_from: Optional[str] = None,
+    page_size: int = 10,
+    page: int = 1,
+    date_to: Optional[str] = None,
+    use_date: Optional[str] = None,
+    projection_params: Optional[Dict] = None,
+) -> Dict:
+    """
+    Build the query parameters for a Guardian API search request.
+
+    Args:
+        projection_params: The show-fields, show-blocks and show-tags
+            parameters from FieldProjection.search_params()
+
+    Returns:
+        Dict of query parameters
+    """
+    params = {
+        "q": f'"{search_term}"',
+        "api-key": api_key,
+        "page-size": page_size,
+        "order-by": "newest",
+    }
+
+    if projection_params:
+        params.update(
+            (name, value) for name, value in projection_params.items() if value
+        )
+    if page > 1:
+        params["page"] = page
+    if date_from:
+        params["from-date"] = date_from
+    if date_to:
+        params["to-date"] = date_to
+    if use_date:
+        params["use-date"] = use_date
+
+    return params
+
+
+def validate_date(name: str, value: Optional[str]):
+    """
+    Check an optional date argument is in YYYY-MM-DD format.
+
+    Raises:
+        ValueError: If the date is not in YYYY-MM-DD format
+    """
+    if value:
+        try:
+            datetime.strptime(value, "%Y-%m-%d")
+        except ValueError:
+            raise ValueError(f"Invalid {name} format. Use YYYY-MM-DD")
+
+
+class Boto3ClientAttribute:
+    """
+    Instance attribute holding a boto3 client that is created on first use.
+
+    Until a client is assigned to the attribute, the process-wide client
+    from get_boto3_client is used.
+    """
+
+    def __init__(self, service_name: str):
+        self.service_name = service_name
+
+    def __set_name__(self, owner, name):
+        self.attribute = f"_{name}"
+
+    def __get__(self, instance, owner=None) -> Any:
+        if instance is None:
+            return self
+        client = instance.__dict__.get(self.attribute)
+        if client is None:
+            client = get_boto3_client(self.service_name)
+            instance.__dict__[self.attribute] = client
+        return client
+
+    def __set__(self, instance, client: Any):
+        instance.__dict__[self.attribute] = client
+
+
 class GuardianApiClient:
 
     API_URL = "https://content.guardianapis.com/search"
+    MAX_PAGE_SIZE = 200
 
-    def __init__(self, api_key: Optional[str] = None):
+    sns_client = Boto3ClientAttribute("sns")
+    sqs_client = Boto3ClientAttribute("sqs")
+    kinesis_client = Boto3ClientAttribute("kinesis")
+    firehose_client = Boto3ClientAttribute("firehose")
+    s3_client = Boto3ClientAttribute("s3")
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        session: Optional[requests.Session] = None,
+        pool_size: int = 10,
+        max_retries: int = 3,
+        timeout: float = 10.0,
+        seen_store: Optional[SeenArticleStore] = None,
+        watermark_store: Optional[WatermarkStore] = None,
+        response_cache: Optional[ResponseCache] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        broker_registry: Optional[BrokerRegistry] = None,
+        message_encoding: str = "json",
+        claim_check: Optional[ClaimCheck] = None,
+        projection: Optional[FieldProjection] = None,
+        stream_responses: bool = False,
+        checkpoint_store: Optional[CheckpointStore] = None,
+        metrics: Optional[Metrics] = None,
+        deduplicator: Optional[ContentDeduplicator] = None,
+        publish_buffer: Optional[BufferedPublisher] = None,
+    ):
 
         self.api_key = api_key or os.environ.get("GUARDIAN_API_KEY")
         if not self.api_key:
@@ -24,15 +449,40 @@ class GuardianApiClient:
                 "Guardian API key is required. Set GUARDIAN_API_KEY environment variable."
             )
 
-        self.sns_client = boto3.client("sns")
-        self.sqs_client = boto3.client("sqs")
+        validate_encoding(message_encoding)
+
+        self.session = session or create_session(pool_size, max_retries)
+        self.max_retries = max_retries
+        self.timeout = timeout
+        self.rate_limiter = rate_limiter
+        self.broker_registry = broker_registry or default_registry
+        self.seen_store = seen_store
+        self.watermark_store = watermark_store
+        self.checkpoint_store = checkpoint_store
+        self.response_cache = response_cache
+        self.message_encoding = message_encoding
+        self.claim_check = claim_check
+        self.projection = projection or DEFAULT_PROJECTION
+        self.stream_responses = stream_responses
+        self.metrics = metrics or Metrics()
+        self.deduplicator = deduplicator
+        self.publish_buffer = publish_buffer
+        if claim_check is not None and not self.projection.include_body:
+            # Claim-check mode publishes full bodies.
+            self.projection = self.projection.replace(include_body=True)
+        # Caps concurrent requests to the API host at the connection pool size.
+        self._host_slots = threading.BoundedSemaphore(pool_size)
 
     def search_articles(
         self,
         search_term: str,
         date_from: Optional[str] = None,
         page_size: int = 10,
-        show_fields: str = "bodyText",
+        show_fields: Optional[str] = None,
+        page: int = 1,
+        date_to: Optional[str] = None,
+        use_date: Optional[str] = None,
+        deadline: Optional[float] = None,
     ) -> Dict:
         """
         Search for articles in the Guardian API.
@@ -42,89 +492,319 @@ class GuardianApiClient:
             date_from: Optional date to filter results from (YYYY-MM-DD format)
             page_size: Number of results to return (default: 10)
             show_fields: Additional fields to include in the response
+                (default: the fields needed by the client's projection)
+            page: Page of results to return (default: 1)
+            date_to: Optional date to filter results to (YYYY-MM-DD format)
+            use_date: Optional date the from/to filters and ordering apply to
+            deadline: Optional time.monotonic() value the request, including
+                any retries, must finish by
 
         Returns:
             Dict containing the API response
 
         Raises:
             requests.RequestException: If the API request fails
+            DeadlineExceededError: If the deadline passes before the request
+                or a retry could be made
         """
-        params = {
-            "q": f'"{search_term}"',
-            "api-key": self.api_key,
-            "page-size": page_size,
-            "show-fields": show_fields,
-            "order-by": "newest",
-        }
+        projection_params = self.projection.search_params()
+        if show_fields is not None:
+            projection_params["show-fields"] = show_fields
+        params = build_search_params(
+            self.api_key,
+            search_term,
+            date_from,
+            page_size,
+            page,
+            date_to,
+            use_date,
+            projection_params,
+        )
 
-        if date_from:
-            params["from-date"] = date_from
+        headers = {}
+        if self.response_cache is not None:
+            cache_key = self.response_cache.key_for(self.API_URL, params)
+            cached, etag = self.response_cache.lookup(cache_key)
+            if cached is not None:
+                logger.info(f"Using cached Guardian API response for: {search_term}")
+                self.metrics.count("cache_hits")
+                return cached
+            if etag:
+                headers["If-None-Match"] = etag
 
         logger.info(f"Searching Guardian API for: {search_term}")
-        response = requests.get(self.API_URL, params=params)
+        response = self._get(params, headers, deadline=deadline)
+
+        if self.response_cache is not None and response.status_code == 304:
+            cached = self.response_cache.revalidate(cache_key)
+            if cached is not None:
+                return cached
+            # Evicted since the lookup, so fetch the full response instead.
+            response = self._get(params, {}, deadline=deadline)
         response.raise_for_status()
 
-        return response.json()
+        self.metrics.count("response_bytes", len(response.content))
+        with self.metrics.timer("parse"):
+            api_response = response.json()
+        if self.response_cache is not None:
+            self.response_cache.store(
+                cache_key, api_response, response.headers.get("ETag")
+            )
+        return api_response
 
-    def process_articles(self, api_response: Dict) -> List[Dict]:
+    def _stream_search(
+        self,
+        search_term: str,
+        date_from: Optional[str] = None,
+        page_size: int = 10,
+        page: int = 1,
+        date_to: Optional[str] = None,
+        use_date: Optional[str] = None,
+        deadline: Optional[float] = None,
+    ) -> Tuple[requests.Response, ResultStream]:
         """
-        Process the API response and extract relevant article data.
+        Search for articles, decoding results as the response body arrives.
 
-        Args:
-            api_response: The JSON response from the Guardian API
+        Streamed responses bypass the response cache. The caller must close
+        the returned response.
 
         Returns:
-            List of dictionaries containing processed article data
+            Tuple of the open response and a stream of its results
+
+        Raises:
+            requests.RequestException: If the API request fails
         """
+        params = build_search_params(
+            self.api_key,
+            search_term,
+            date_from,
+            page_size,
+            page,
+            date_to,
+            use_date,
+            self.projection.search_params(),
+        )
+
+        logger.info(f"Streaming Guardian API search for: {search_term}")
+        response = self._get(params, {}, stream=True, deadline=deadline)
         try:
-            results = api_response.get("response", {}).get("results", [])
-            processed_articles = []
+            response.raise_for_status()
+        except requests.RequestException:
+            response.close()
+            raise
+        return response, ResultStream(response.iter_content(STREAM_CHUNK_SIZE))
 
-            for article in results:
+    def _get(
+        self,
+        params: Dict,
+        headers: Dict,
+        stream: bool = False,
+        deadline: Optional[float] = None,
+    ) -> requests.Response:
+        """
+        Make a rate-limited API request, backing off on retryable statuses.
 
-                processed_article = {
-                    "webPublicationDate": article.get("webPublicationDate"),
-                    "webTitle": article.get("webTitle"),
-                    "webUrl": article.get("webUrl"),
-                }
+        429 and 5xx responses are retried up to max_retries times after the
+        delay given by Retry-After, or a jittered exponential backoff. With a
+        rate limiter, the delay holds back every thread sharing the client.
+        With a deadline, each request's timeout is capped at the time left,
+        and no retry is made whose delay would reach the deadline.
 
-                fields = article.get("fields", {})
-                if fields and "bodyText" in fields:
-                    body_text = fields["bodyText"]
-                    processed_article["contentPreview"] = (
-                        body_text[:1000] if body_text else None
+        Raises:
+            DeadlineExceededError: If the deadline passes before the request
+                or a retry could be made
+        """
+        for attempt in range(self.max_retries + 1):
+            timeout = self.timeout
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise DeadlineExceededError(
+                        "Time budget used up before the Guardian API request"
                     )
+                timeout = min(timeout, remaining)
+            if self.rate_limiter is not None:
+                with self.metrics.timer("rate_limit_wait"):
+                    self.rate_limiter.acquire()
+            with self._host_slots, self.metrics.timer("search"):
+                response = self.session.get(
+                    self.API_URL,
+                    params=params,
+                    headers=headers,
+                    timeout=timeout,
+                    stream=stream,
+                )
 
-                processed_articles.append(processed_article)
+            remaining = response.headers.get("X-RateLimit-Remaining-day")
+            if self.rate_limiter is not None and remaining and remaining.isdigit():
+                self.rate_limiter.sync_remaining(int(remaining))
 
-            return processed_articles
+            if (
+                response.status_code not in RETRY_STATUSES
+                or attempt == self.max_retries
+            ):
+                return response
+
+            response.close()
+            delay = parse_retry_after(response.headers.get("Retry-After"))
+            if delay is None:
+                delay = backoff_delay(attempt)
+            if deadline is not None and time.monotonic() + delay >= deadline:
+                raise DeadlineExceededError(
+                    f"Guardian API returned {response.status_code}, and retrying "
+                    f"in {delay:.2f}s would overrun the time budget"
+                )
+            logger.warning(
+                f"Guardian API returned {response.status_code}, retrying in {delay:.2f}s"
+            )
+            self.metrics.count("http_retries")
+            if self.rate_limiter is not None:
+                self.rate_limiter.pause(delay)
+            else:
+                time.sleep(delay)
+
+    def iter_articles(
+        self,
+        search_term: str,
+        date_from: Optional[str] = None,
+        date_to: Optional[str] = None,
+        max_results: Optional[int] = None,
+        page_size: int = MAX_PAGE_SIZE,
+        use_date: Optional[str] = None,
+        start: int = 0,
+        deadline: Optional[float] = None,
+    ) -> Iterator[Dict]:
+        """
+        Lazily iterate over processed articles across all result pages.
+
+        Pages are only requested once the articles of the previous page have
+        been consumed, so at most one page is held in memory at a time. With
+        stream_responses enabled and no response cache, each page is decoded
+        one result at a time as it arrives instead.
+
+        Args:
+            search_term: The term to search for
+            date_from: Optional date to filter results from (YYYY-MM-DD format)
+            date_to: Optional date to filter results to (YYYY-MM-DD format)
+            max_results: Optional maximum number of articles to yield
+            page_size: Number of results to request per page (max: 200)
+            use_date: Optional date the from/to filters and ordering apply to
+            start: Number of leading results to skip, e.g. to resume an
+                earlier iteration. Counts towards max_results.
+            deadline: Optional time.monotonic() value each page request must
+                finish by (see search_articles)
+
+        Yields:
+            Dictionaries containing processed article data
+        """
+        if max_results is not None and max_results <= start:
+            return
+
+        page_size = min(page_size, self.MAX_PAGE_SIZE)
+        if max_results is not None:
+            page_size = min(page_size, max_results)
+
+        streaming = self.stream_responses and self.response_cache is None
+        budget = {"deadline": deadline} if deadline is not None else {}
+        yielded = start
+        page = start // page_size + 1
+        skip = start % page_size
+        while True:
+            response = None
+            if streaming:
+                response, results = self._stream_search(
+                    search_term, date_from, page_size, page, date_to, use_date, **budget
+                )
+                articles = map(self.projection.extract, results)
+            else:
+                api_response = self.search_articles(
+                    search_term,
+                    date_from,
+                    page_size=page_size,
+                    page=page,
+                    date_to=date_to,
+                    use_date=use_date,
+                    **budget,
+                )
+                articles = self.process_articles(api_response)
+
+            try:
+                for article in articles:
+                    if skip:
+                        skip -= 1
+                        continue
+                    yield article
+                    yielded += 1
+                    if max_results is not None and yielded >= max_results:
+                        return
+            finally:
+                if response is not None:
+                    response.close()
+
+            if streaming:
+                api_response = results.metadata
+            pages = api_response.get("response", {}).get("pages", 1)
+            if page >= pages:
+                return
+            page += 1
+
+    def process_articles(self, api_response: Dict) -> List[Dict]:
+        """
+        Process the API response and extract relevant article data.
+
+        Args:
+            api_response: The JSON response from the Guardian API
+
+        Returns:
+            List of dictionaries containing processed article data
+        """
+        try:
+            results = api_response.get("response", {}).get("results", [])
+            with self.metrics.timer("process"):
+                return self.projection.extract_all(results)
         except Exception as e:
             logger.error(f"Error processing articles: {str(e)}")
             raise
 
-    def publish_to_sns(self, topic_arn: str, articles: List[Dict]) -> Dict:
+    def _encode(self, payload: Any) -> Tuple[str, Dict]:
+        message, attributes = encode_message(payload, self.message_encoding)
+        return message, {**MESSAGE_ATTRIBUTES, **attributes}
+
+    def publish_to_sns(
+        self,
+        topic_arn: str,
+        articles: List[Dict],
+        message_group_id: Optional[str] = None,
+    ) -> Dict:
         """
         Publish articles to an SNS topic.
 
+        For FIFO topics the message gets a group ID and a deduplication ID
+        derived from the message body.
+
         Args:
             topic_arn: The ARN of the SNS topic
             articles: List of article data to publish
+            message_group_id: Optional message group ID, required for FIFO topics
+                (defaults to DEFAULT_MESSAGE_GROUP_ID for FIFO topics)
 
         Returns:
             Dict containing the SNS publish response
         """
-        message = json.dumps(articles)
+        message, attributes = self._encode(articles)
         logger.info(f"Publishing {len(articles)} articles to SNS topic: {topic_arn}")
 
+        fifo = {}
+        if topic_arn.endswith(".fifo") or message_group_id:
+            fifo["MessageGroupId"] = message_group_id or DEFAULT_MESSAGE_GROUP_ID
+            fifo["MessageDeduplicationId"] = hashlib.sha256(
+                message.encode("utf-8")
+            ).hexdigest()
         response = self.sns_client.publish(
             TopicArn=topic_arn,
             Message=message,
-            MessageAttributes={
-                "TTL": {
-                    "DataType": "Number",
-                    "StringValue": "259200",  # 3 days in seconds
-                }
-            },
+            MessageAttributes=attributes,
+            **fifo,
         )
         return response
 
@@ -139,21 +819,324 @@ class GuardianApiClient:
         Returns:
             Dict containing the SQS send message response
         """
-        message = json.dumps(articles)
+        message, attributes = self._encode(articles)
         logger.info(f"Publishing {len(articles)} articles to SQS queue: {queue_url}")
 
         response = self.sqs_client.send_message(
             QueueUrl=queue_url,
             MessageBody=message,
-            MessageAttributes={
-                "TTL": {
-                    "DataType": "Number",
-                    "StringValue": "259200",  # 3 days in seconds
-                }
-            },
+            MessageAttributes=attributes,
         )
         return response
 
+    def publish_to_sns_batch(
+        self,
+        topic_arn: str,
+        articles: List[Dict],
+        max_attempts: int = 3,
+        message_group_id: Optional[str] = None,
+        group_by: Optional[str] = None,
+        deduplication_id: Optional[Callable[[Dict], str]] = None,
+    ) -> Dict:
+        """
+        Publish each article as its own message using SNS PublishBatch.
+
+        Articles are sent in batches of up to 10 messages and 256 KiB, and
+        only the entries reported as failed are retried. For FIFO topics each
+        message gets a group ID and a deduplication ID derived from the
+        article URL, so re-publishing the same article is suppressed by SNS.
+
+        Args:
+            topic_arn: The ARN of the SNS topic
+            articles: List of article data to publish
+            max_attempts: Maximum number of times a message is sent (default: 3)
+            message_group_id: Optional message group ID, required for FIFO topics
+                (defaults to DEFAULT_MESSAGE_GROUP_ID for FIFO topics)
+            group_by: Optionally group messages on the article 'id' or
+                'section' instead, so groups are delivered in parallel
+            deduplication_id: Optional function returning the deduplication
+                ID of an article (default: a hash of its URL)
+
+        Returns:
+            Dict with sent/failed counts, message IDs, errors and request count
+        """
+        if group_by not in (None, "id", "section"):
+            raise ValueError("group_by must be 'id' or 'section'")
+        if group_by is None and topic_arn.endswith(".fifo") and not message_group_id:
+            message_group_id = DEFAULT_MESSAGE_GROUP_ID
+
+        entries = []
+        for index, article in enumerate(articles):
+            message, attributes = self._encode(article)
+            entry = {
+                "Id": str(index),
+                "Message": message,
+                "MessageAttributes": attributes,
+            }
+            if message_group_id or group_by:
+                entry["MessageGroupId"] = (
+                    kinesis_partition_key(article, group_by)
+                    if group_by
+                    else message_group_id
+                )
+                if deduplication_id is not None:
+                    entry["MessageDeduplicationId"] = deduplication_id(article)
+                else:
+                    dedup_source = article.get("webUrl") or message
+                    entry["MessageDeduplicationId"] = hashlib.sha256(
+                        dedup_source.encode("utf-8")
+                    ).hexdigest()
+            entries.append(entry)
+        logger.info(
+            f"Publishing {len(articles)} articles as batched messages to SNS topic: {topic_arn}"
+        )
+
+        def send(batch: List[Dict]) -> Dict:
+            return self.sns_client.publish_batch(
+                TopicArn=topic_arn, PublishBatchRequestEntries=batch
+            )
+
+        return send_batches(
+            send,
+            entries,
+            lambda entry: len(entry["Message"].encode("utf-8"))
+            + attributes_size(entry["MessageAttributes"]),
+            max_attempts,
+        )
+
+    def publish_to_sqs_batch(
+        self, queue_url: str, articles: List[Dict], max_attempts: int = 3
+    ) -> Dict:
+        """
+        Publish each article as its own message using SQS SendMessageBatch.
+
+        Articles are sent in batches of up to 10 messages and 256 KiB, and
+        only the entries reported as failed are retried.
+
+        Args:
+            queue_url: The URL of the SQS queue
+            articles: List of article data to publish
+            max_attempts: Maximum number of times a message is sent (default: 3)
+
+        Returns:
+            Dict with sent/failed counts, message IDs, errors and request count
+        """
+        entries = []
+        for index, article in enumerate(articles):
+            message, attributes = self._encode(article)
+            entries.append(
+                {
+                    "Id": str(index),
+                    "MessageBody": message,
+                    "MessageAttributes": attributes,
+                }
+            )
+        logger.info(
+            f"Publishing {len(articles)} articles as batched messages to SQS queue: {queue_url}"
+        )
+
+        def send(batch: List[Dict]) -> Dict:
+            return self.sqs_client.send_message_batch(QueueUrl=queue_url, Entries=batch)
+
+        return send_batches(
+            send,
+            entries,
+            lambda entry: len(entry["MessageBody"].encode("utf-8"))
+            + attributes_size(entry["MessageAttributes"]),
+            max_attempts,
+        )
+
+    def publish_to_kinesis(
+        self,
+        stream: str,
+        articles: List[Dict],
+        max_attempts: int = 3,
+        partition_by: str = "id",
+    ) -> Dict:
+        """
+        Publish each article as its own record to a Kinesis data stream.
+
+        Records are sent with PutRecords in batches of up to 500 records and
+        5 MiB, and only the records reported as failed, e.g. because a shard
+        was throttled, are retried.
+
+        Args:
+            stream: The name or ARN of the Kinesis data stream
+            articles: List of article data to publish
+            max_attempts: Maximum number of times a record is sent (default: 3)
+            partition_by: Partition records on the article 'id' or 'section'
+                (default: 'id')
+
+        Returns:
+            Dict with sent/failed counts, sequence numbers, errors, request
+            count and the records and bytes written to each shard
+        """
+        stream_kwargs = (
+            {"StreamARN": stream}
+            if stream.startswith("arn:")
+            else {"StreamName": stream}
+        )
+        summary = {
+            "sent": 0,
+            "failed": 0,
+            "requests": 0,
+            "retries": 0,
+            "message_ids": [],
+            "errors": [],
+            "shards": {},
+        }
+        logger.info(f"Publishing {len(articles)} articles to Kinesis stream: {stream}")
+
+        entries = []
+        for index, article in enumerate(articles):
+            entry = {
+                "Id": str(index),
+                "Data": json.dumps(article).encode("utf-8"),
+                "PartitionKey": kinesis_partition_key(article, partition_by),
+            }
+            if self._kinesis_record_size(entry) > KINESIS_MAX_RECORD_BYTES:
+                summary["errors"].append(
+                    {
+                        "Id": entry["Id"],
+                        "Code": "RecordTooLarge",
+                        "Message": f"Record exceeds {KINESIS_MAX_RECORD_BYTES} bytes",
+                    }
+                )
+            else:
+                entries.append(entry)
+
+        started = time.monotonic()
+        for batch in chunk_batch_entries(
+            entries,
+            self._kinesis_record_size,
+            KINESIS_MAX_RECORDS,
+            KINESIS_MAX_BATCH_BYTES,
+        ):
+            pending = batch
+            for attempt in range(1, max_attempts + 1):
+                response = self.kinesis_client.put_records(
+                    Records=[
+                        {"Data": entry["Data"], "PartitionKey": entry["PartitionKey"]}
+                        for entry in pending
+                    ],
+                    **stream_kwargs,
+                )
+                summary["requests"] += 1
+
+                retry = []
+                for entry, record in zip(pending, response.get("Records", [])):
+                    if not record.get("ErrorCode"):
+                        summary["sent"] += 1
+                        summary["message_ids"].append(record.get("SequenceNumber"))
+                        shard = summary["shards"].setdefault(
+                            record.get("ShardId"), {"records": 0, "bytes": 0}
+                        )
+                        shard["records"] += 1
+                        shard["bytes"] += self._kinesis_record_size(entry)
+                    elif attempt == max_attempts:
+                        summary["errors"].append(
+                            {
+                                "Id": entry["Id"],
+                                "Code": record["ErrorCode"],
+                                "Message": record.get("ErrorMessage"),
+                            }
+                        )
+                    else:
+                        retry.append(entry)
+
+                pending = retry
+                if not pending:
+                    break
+                logger.warning(f"Retrying {len(pending)} failed Kinesis records")
+                summary["retries"] += len(pending)
+                time.sleep(BATCH_RETRY_BACKOFF * 2 ** (attempt - 1))
+
+        elapsed = max(time.monotonic() - started, 1e-6)
+        for shard_id, shard in summary["shards"].items():
+            shard["records_per_second"] = round(shard["records"] / elapsed, 1)
+            shard["bytes_per_second"] = round(shard["bytes"] / elapsed, 1)
+            logger.info(
+                f"Wrote {shard['records']} records ({shard['bytes']} bytes) "
+                f"to Kinesis shard {shard_id}"
+            )
+
+        summary["failed"] = len(summary["errors"])
+        return summary
+
+    @staticmethod
+    def _kinesis_record_size(entry: Dict) -> int:
+        return len(entry["Data"]) + len(entry["PartitionKey"].encode("utf-8"))
+
+    def publish_to_firehose(self, delivery_stream: str, articles: List[Dict]) -> Dict:
+        """
+        Publish each article as a newline-delimited JSON record to Firehose.
+
+        Records are sent with PutRecordBatch in batches of up to 500 records
+        and 4 MiB. Records over 1,000 KiB are reported as failed without
+        being sent.
+
+        Args:
+            delivery_stream: The name of the Firehose delivery stream
+            articles: List of article data to publish
+
+        Returns:
+            Dict with sent/failed counts, record IDs, errors and request count
+        """
+        summary = {
+            "sent": 0,
+            "failed": 0,
+            "requests": 0,
+            "message_ids": [],
+            "errors": [],
+        }
+        logger.info(
+            f"Publishing {len(articles)} articles to Firehose stream: {delivery_stream}"
+        )
+
+        entries = []
+        for index, article in enumerate(articles):
+            entry = {
+                "Id": str(index),
+                "Data": (json.dumps(article) + "\n").encode("utf-8"),
+            }
+            if len(entry["Data"]) > FIREHOSE_MAX_RECORD_BYTES:
+                summary["errors"].append(
+                    {
+                        "Id": entry["Id"],
+                        "Code": "RecordTooLarge",
+                        "Message": f"Record exceeds {FIREHOSE_MAX_RECORD_BYTES} bytes",
+                    }
+                )
+            else:
+                entries.append(entry)
+
+        for batch in chunk_batch_entries(
+            entries,
+            lambda entry: len(entry["Data"]),
+            FIREHOSE_MAX_RECORDS,
+            FIREHOSE_MAX_BATCH_BYTES,
+        ):
+            response = self.firehose_client.put_record_batch(
+                DeliveryStreamName=delivery_stream,
+                Records=[{"Data": entry["Data"]} for entry in batch],
+            )
+            summary["requests"] += 1
+            for entry, record in zip(batch, response.get("RequestResponses", [])):
+                if record.get("ErrorCode"):
+                    summary["errors"].append(
+                        {
+                            "Id": entry["Id"],
+                            "Code": record["ErrorCode"],
+                            "Message": record.get("ErrorMessage"),
+                        }
+                    )
+                else:
+                    summary["sent"] += 1
+                    summary["message_ids"].append(record.get("RecordId"))
+
+        summary["failed"] = len(summary["errors"])
+        return summary
+
     def determine_broker_type(self, broker_reference: str) -> str:
         """
         Determine the type of message broker from the reference.
@@ -162,27 +1145,88 @@ class GuardianApiClient:
             broker_reference: Reference to the message broker
 
         Returns:
-            String indicating the broker type ('sns', 'sqs', or 'unknown')
+            Name of the registered broker backend (e.g. 'sns' or 'sqs'), or
+            'unknown'
         """
-        if broker_reference.startswith("arn:aws:sns:"):
-            return "sns"
-        elif broker_reference.startswith("https://sqs.") or broker_reference.startswith(
-            "http://sqs."
-        ):
-            return "sqs"
-        else:
-            return "unknown"
+        backend = self.broker_registry.resolve(broker_reference)
+        return backend.name if backend else "unknown"
+
+    def resolve_broker(self, broker_reference: str) -> BrokerBackend:
+        """
+        Find the backend that publishes to a broker reference.
+
+        Args:
+            broker_reference: Reference to the message broker
+
+        Returns:
+            The matching broker backend
+
+        Raises:
+            ValueError: If no registered backend handles the reference
+        """
+        backend = self.broker_registry.resolve(broker_reference)
+        if backend is None:
+            raise ValueError(f"Unknown broker type for reference: {broker_reference}")
+        return backend
 
     def publish_articles(
-        self, search_term: str, broker_reference: str, date_from: Optional[str] = None
+        self,
+        search_term: str,
+        broker_reference: str,
+        date_from: Optional[str] = None,
+        date_to: Optional[str] = None,
+        max_results: Optional[int] = None,
+        batch_size: int = 10,
+        per_article: bool = False,
+        incremental: bool = False,
+        deadline: Optional[float] = None,
     ) -> Dict:
         """
         Search for articles and publish them to the specified message broker.
 
+        By default only the first page of results is published as a single
+        message. When max_results is given, results are paged through lazily
+        and published as a stream of messages of up to batch_size articles.
+        With per_article, every article is sent as its own message using the
+        broker's batch API. If the client has a seen_store, articles published
+        by earlier runs are skipped. If it has a deduplicator, articles already
+        published under any term, or near duplicates of them, are skipped.
+
+        In incremental mode the client's watermark_store supplies the newest
+        publication date published for the term by an earlier run. Only
+        content published after it is requested, and paging stops as soon as
+        older content is reached. The first incremental run publishes up to
+        max_results (default: 10) of the newest articles.
+
         Args:
             search_term: The term to search for
-            broker_reference: Reference to the message broker (SNS ARN or SQS URL)
+            broker_reference: Reference to the message broker (see brokers.py)
             date_from: Optional date to filter results from (YYYY-MM-DD format)
+            date_to: Optional date to filter results to (YYYY-MM-DD format)
+            max_results: Optional maximum number of articles to stream to the broker
+            batch_size: Number of articles per message when streaming (default: 10)
+            per_article: Publish one message per article in batched requests
+            incremental: Only publish content newer than the term's watermark
+            deadline: Optional time.monotonic() value after which no further
+                batches are pulled, so no further pages are fetched. At least
+                one batch is published, and a run stopped with results left
+                is marked with complete=False. Page requests and their
+                retries are also cut short at the deadline.
+
+        With a claim check configured, bodies over its threshold are written
+        to S3 and published as pointers.
+
+        With a publish_buffer, batches are handed to the buffer and published
+        later, coalesced with the articles of other searches. Articles are
+        only marked as seen once the buffer has published them, and those it
+        fails to publish are released from the deduplicator. Paged runs with
+        a checkpoint store, and incremental runs, still publish directly.
+
+        With a checkpoint store, paged runs commit their position in the
+        results and the keys of the published articles after every batch. A
+        run that is interrupted resumes after the last committed batch when
+        called again with the same arguments, skipping articles it already
+        published even if newer results have shifted the positions.
 
         Returns:
             Dict containing information about the operation
@@ -195,32 +1239,426 @@ class GuardianApiClient:
         if not broker_reference:
             raise ValueError("Broker reference is required")
 
-        if date_from:
+        validate_date("date_from", date_from)
+        validate_date("date_to", date_to)
+
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        if incremental and self.watermark_store is None:
+            raise ValueError("Incremental mode requires a watermark_store")
+
+        backend = self.resolve_broker(broker_reference)
+
+        skipped = 0
+        duplicates = 0
+        checkpoint_key = None
+        checkpoint = None
+        published_keys: Dict[str, None] = {}
+        position = 0
+        # Articles indexed by the deduplicator but not yet in a pulled batch.
+        pending: List[Dict] = []
+
+        def unseen(articles: Iterable[Dict]) -> Iterator[Dict]:
+            nonlocal skipped, duplicates
+            for article in articles:
+                if SeenArticleStore.article_key(article) in published_keys:
+                    continue
+                if self.seen_store is not None and self.seen_store.seen(article):
+                    skipped += 1
+                    continue
+                if self.deduplicator is not None:
+                    if self.deduplicator.check(article):
+                        duplicates += 1
+                        continue
+                    pending.append(article)
+                yield article
+
+        def consumed(articles: Iterable[Dict]) -> Iterator[Dict]:
+            nonlocal position
+            for article in articles:
+                position += 1
+                yield article
+
+        # Page requests must finish by the deadline too.
+        budget = {"deadline": deadline} if deadline is not None else {}
+        stop_at = deadline
+        watermark = None
+        if incremental:
+            watermark = self.watermark_store.get(search_term)
+            if watermark:
+                date_from = watermark[:10]
+            elif max_results is None:
+                max_results = 10
+
+        if max_results is None and watermark is None:
+            if self.stream_responses:
+                articles = self.iter_articles(
+                    search_term,
+                    date_from,
+                    date_to,
+                    max_results=10,
+                    page_size=10,
+                    **budget,
+                )
+            else:
+                api_response = self.search_articles(
+                    search_term, date_from, date_to=date_to, **budget
+                )
+                articles = self.process_articles(api_response)
+
+            def single_batch() -> Iterator[List[Dict]]:
+                yield list(unseen(articles))
+
+            batches = single_batch()
+            # The only batch is always published, so there is nothing to stop.
+            stop_at = None
+        else:
+            if self.checkpoint_store is not None:
+                checkpoint_key = (
+                    f"publish:{search_term}:{broker_reference}:{date_from}:"
+                    f"{date_to}:{max_results}:{incremental}"
+                )
+                checkpoint = self.checkpoint_store.get(checkpoint_key)
+                if checkpoint is not None:
+                    position = checkpoint["position"]
+                    published_keys.update(dict.fromkeys(checkpoint["published_ids"]))
+                    logger.info(
+                        f"Resuming {search_term} after {position} results "
+                        f"from checkpoint"
+                    )
+            articles = consumed(
+                self.iter_articles(
+                    search_term,
+                    date_from,
+                    date_to,
+                    max_results=max_results,
+                    page_size=10 if incremental else self.MAX_PAGE_SIZE,
+                    use_date="published" if incremental else None,
+                    start=position,
+                    **budget,
+                )
+            )
+            if watermark:
+                # Results are newest first, so everything after the first
+                # already-published article is older still.
+                articles = takewhile(
+                    lambda article: (article.get("webPublicationDate") or "")
+                    > watermark,
+                    articles,
+                )
+            batches = batched(unseen(articles), batch_size)
+
+        # Checkpoints and watermarks must only cover articles that have really
+        # been published.
+        publish_buffer = (
+            self.publish_buffer if checkpoint_key is None and not incremental else None
+        )
+        message_ids = []
+        articles_count = 0
+        buffered_count = 0
+        failed_count = 0
+        shards = {}
+        newest = checkpoint.get("newest") if checkpoint else None
+        stopped = False
+        batches = iter(batches)
+        while True:
+            # Checked before the next batch is pulled, which may fetch a page.
+            # Nothing is left once max_results results have been consumed.
+            if (
+                articles_count
+                and stop_at is not None
+                and (max_results is None or position < max_results)
+                and time.monotonic() >= stop_at
+            ):
+                stopped = True
+                logger.warning(
+                    f"Time budget used up publishing {search_term} "
+                    f"after {articles_count} articles"
+                )
+                break
             try:
-                datetime.strptime(date_from, "%Y-%m-%d")
-            except ValueError:
-                raise ValueError("Invalid date_from format. Use YYYY-MM-DD")
-
-        api_response = self.search_articles(search_term, date_from)
-        articles = self.process_articles(api_response)
-
-        broker_type = self.determine_broker_type(broker_reference)
-
-        if broker_type == "sns":
-            publish_response = self.publish_to_sns(broker_reference, articles)
-            return {
-                "status": "success",
-                "broker_type": "sns",
-                "articles_count": len(articles),
-                "message_id": publish_response.get("MessageId"),
-            }
-        elif broker_type == "sqs":
-            publish_response = self.publish_to_sqs(broker_reference, articles)
-            return {
-                "status": "success",
-                "broker_type": "sqs",
-                "articles_count": len(articles),
-                "message_id": publish_response.get("MessageId"),
-            }
+                batch = next(batches, None)
+            except Exception as e:
+                # Fetching the rest of the batch failed, so release the
+                # articles already indexed for it.
+                if self.deduplicator is not None:
+                    self.deduplicator.discard(pending)
+                if stop_at is None or not isinstance(e, DeadlineExceededError):
+                    raise
+                stopped = True
+                logger.warning(
+                    f"Time budget used up fetching {search_term} "
+                    f"after {articles_count} articles"
+                )
+                break
+            pending.clear()
+            if batch is None:
+                break
+            if not batch and (
+                self.seen_store is not None or self.deduplicator is not None
+            ):
+                continue
+            try:
+                messages = batch
+                if self.claim_check is not None:
+                    with self.metrics.timer("claim_check"):
+                        messages = self.claim_check.offload(self.s3_client, batch)
+                if publish_buffer is not None:
+                    publish_buffer.add(
+                        broker_reference,
+                        messages,
+                        per_article,
+                        partial(self._buffered_batch_published, batch),
+                    )
+                    buffered_count += len(batch)
+                    articles_count += len(batch)
+                    continue
+                with self.metrics.timer("publish"):
+                    summary = backend.publish(
+                        self, broker_reference, messages, per_article
+                    )
+            except Exception:
+                if self.deduplicator is not None:
+                    self.deduplicator.discard(batch)
+                raise
+            self.metrics.count("articles_published", len(batch) - summary["failed"])
+            self.metrics.count("articles_failed", summary["failed"])
+            self.metrics.count("broker_requests", summary.get("requests", 0))
+            self.metrics.count("broker_retries", summary.get("retries", 0))
+            message_ids.extend(summary["message_ids"])
+            failed_count += summary["failed"]
+            for shard_id, written in summary.get("shards", {}).items():
+                shard = shards.setdefault(shard_id, {"records": 0, "bytes": 0})
+                shard["records"] += written["records"]
+                shard["bytes"] += written["bytes"]
+            failed_ids = {error["Id"] for error in summary["errors"]}
+            published = [
+                article
+                for index, article in enumerate(batch)
+                if str(index) not in failed_ids
+            ]
+            if self.deduplicator is not None and failed_ids:
+                # Let a later run or another term publish them instead.
+                self.deduplicator.discard(
+                    article
+                    for index, article in enumerate(batch)
+                    if str(index) in failed_ids
+                )
+            if self.seen_store is not None:
+                self.seen_store.mark_seen(published)
+            for article in published:
+                published_date = article.get("webPublicationDate")
+                if published_date and (newest is None or published_date > newest):
+                    newest = published_date
+            articles_count += len(batch)
+            if checkpoint_key is not None:
+                for article in published:
+                    key = SeenArticleStore.article_key(article)
+                    if key is not None:
+                        published_keys[key] = None
+                recent_keys = list(published_keys)[-CHECKPOINT_PUBLISHED_IDS:]
+                self.checkpoint_store.put(
+                    checkpoint_key,
+                    {
+                        "position": position,
+                        "published_ids": recent_keys,
+                        "newest": newest,
+                    },
+                )
+
+        result = {
+            "status": "partial" if failed_count else "success",
+            "broker_type": backend.name,
+            "articles_count": articles_count,
+        }
+        # Per-record backends write one record per article, even for one page.
+        per_record = per_article or backend.per_record
+        if max_results is None and not per_record:
+            result["message_id"] = message_ids[0] if message_ids else None
         else:
-            raise ValueError(f"Unknown broker type for reference: {broker_reference}")
+            result["message_ids"] = message_ids
+        if per_record or failed_count:
+            result["sent_count"] = articles_count - failed_count
+            result["failed_count"] = failed_count
+        if shards:
+            result["shards"] = shards
+        if buffered_count:
+            result["buffered_count"] = buffered_count
+        if self.seen_store is not None:
+            result["seen_articles"] = {"skipped": skipped, **self.seen_store.stats()}
+            self.metrics.count("articles_skipped", skipped)
+        if self.deduplicator is not None:
+            result["duplicates"] = {"skipped": duplicates, **self.deduplicator.stats()}
+            self.metrics.count("articles_duplicate", duplicates)
+        if incremental:
+            # Results are newest first, so a run stopped early has not
+            # reached everything after the old watermark yet.
+            if newest and not failed_count and not stopped:
+                self.watermark_store.set(search_term, newest)
+            result["watermark"] = self.watermark_store.get(search_term)
+        if checkpoint is not None:
+            result["resumed_from"] = checkpoint["position"]
+        if stopped:
+            result["complete"] = False
+        elif checkpoint_key is not None:
+            # The run finished, so the next one starts from the beginning.
+            self.checkpoint_store.delete(checkpoint_key)
+        return result
+
+    def _buffered_batch_published(
+        self, batch: List[Dict], published: List[int], failed: List[int]
+    ):
+        """Record the outcome of a batch once the publish buffer has sent it."""
+        if self.seen_store is not None and published:
+            self.seen_store.mark_seen([batch[index] for index in published])
+        if self.deduplicator is not None and failed:
+            # Let a later run or another term publish them instead.
+            self.deduplicator.discard(batch[index] for index in failed)
+
+    def backfill(
+        self,
+        search_term: str,
+        broker_reference: str,
+        date_from: str,
+        date_to: str,
+        max_window_results: int = 2000,
+        max_workers: int = 4,
+        batch_size: int = 10,
+        per_article: bool = False,
+        deadline: Optional[float] = None,
+    ) -> Dict:
+        """
+        Publish every article for a term within a date range.
+
+        The range is split into windows of at most max_window_results
+        results, which are published in parallel. With a checkpoint store,
+        completed windows are recorded and skipped when the same backfill
+        is run again.
+
+        Args:
+            search_term: The term to search for
+            broker_reference: Reference to the message broker (see brokers.py)
+            date_from: First day of the range (YYYY-MM-DD format)
+            date_to: Last day of the range (YYYY-MM-DD format)
+            max_window_results: Result count above which a window is split
+            max_workers: Maximum number of windows published at once
+            batch_size: Number of articles per message (default: 10)
+            per_article: Publish one message per article in batched requests
+            deadline: Optional time.monotonic() value after which no further
+                windows are started
+
+        Returns:
+            Dict with the overall status, window and article counts,
+            throughput and per-window errors
+
+        Raises:
+            ValueError: If required parameters are missing or invalid
+        """
+        if not search_term:
+            raise ValueError("Search term is required")
+        if not broker_reference:
+            raise ValueError("Broker reference is required")
+        self.resolve_broker(broker_reference)
+
+        return run_backfill(
+            self,
+            search_term,
+            broker_reference,
+            date_from,
+            date_to,
+            checkpoint_store=self.checkpoint_store,
+            max_window_results=max_window_results,
+            max_workers=max_workers,
+            batch_size=batch_size,
+            per_article=per_article,
+            deadline=deadline,
+        )
+
+    def publish_many(
+        self,
+        terms: List[str],
+        broker_reference: str,
+        date_from: Optional[str] = None,
+        max_workers: int = 8,
+        deadline: Optional[float] = None,
+    ) -> Dict:
+        """
+        Search for and publish articles for several terms concurrently.
+
+        Each term is handled by publish_articles on a bounded thread pool.
+        Concurrent requests to the API host are additionally capped at the
+        client's connection pool size.
+
+        Args:
+            terms: The terms to search for
+            broker_reference: Reference to the message broker (see brokers.py)
+            date_from: Optional date to filter results from (YYYY-MM-DD format)
+            max_workers: Maximum number of terms processed at once (default: 8)
+            deadline: Optional time.monotonic() value after which no further
+                terms are started. Terms left over are listed in
+                pending_terms and the result is marked with complete=False.
+
+        Returns:
+            Dict containing per-term results and errors
+
+        Raises:
+            ValueError: If no terms are given or the broker type is unknown
+        """
+        if isinstance(terms, str):
+            raise ValueError("terms must be a list of search terms")
+        terms = list(dict.fromkeys(term for term in terms if term))
+        if not terms:
+            raise ValueError("At least one search term is required")
+        if not broker_reference:
+            raise ValueError("Broker reference is required")
+
+        backend = self.resolve_broker(broker_reference)
+
+        def publish(term: str) -> Optional[Dict]:
+            if deadline is None:
+                return self.publish_articles(term, broker_reference, date_from)
+            if time.monotonic() >= deadline:
+                return None
+            return self.publish_articles(
+                term, broker_reference, date_from, deadline=deadline
+            )
+
+        results = {}
+        errors = {}
+        pending = []
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(terms))) as executor:
+            futures = {term: executor.submit(publish, term) for term in terms}
+            for term, future in futures.items():
+                try:
+                    result = future.result()
+                except Exception as e:
+                    logger.error(f"Error publishing articles for {term}: {str(e)}")
+                    errors[term] = str(e)
+                    continue
+                if result is None:
+                    pending.append(term)
+                    continue
+                results[term] = result
+                if result.get("complete") is False:
+                    pending.append(term)
+
+        if not errors:
+            status = "success"
+        elif results:
+            status = "partial"
+        else:
+            status = "error"
+
+        summary = {
+            "status": status,
+            "broker_type": backend.name,
+            "terms_count": len(terms),
+            "articles_count": sum(r["articles_count"] for r in results.values()),
+            "results": results,
+            "errors": errors,
+        }
+        if pending:
+            logger.warning(f"Time budget used up with {len(pending)} terms pending")
+            summary["complete"] = False
+            summary["pending_terms"] = pending
+        return summary
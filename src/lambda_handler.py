@@ -5,20 +5,230 @@ This module provides an AWS Lambda handler that uses the GuardianApiClient
 to search for articles and publish them to a message broker.
 """
 
+import os
 import json
+import time
 import logging
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
-from guardian_api_client import GuardianApiClient
+from brokers import SnsBackend, default_registry
+from buffered_publisher import BufferedPublisher
+from checkpoints import DynamoDBCheckpointStore, InMemoryCheckpointStore
+from claim_check import ClaimCheck
+from dedup import ContentDeduplicator
+from guardian_api_client import GuardianApiClient, get_boto3_client
+from rate_limiter import RateLimiter
+from response_cache import InMemoryResponseCache
+from seen_articles import InMemorySeenArticleStore
+from watermarks import InMemoryWatermarkStore
 
 logger = logging.getLogger()
 logger.setLevel("INFO")
 
+# Reused across warm invocations so the HTTP connection pool stays open.
+_client: Optional[GuardianApiClient] = None
+
+# Time kept back from the Lambda timeout to return the response.
+TIME_BUDGET_MARGIN_MS = 10000
+MAX_CONTINUATIONS = 10
+METRICS_NAMESPACE = "GuardianApiClient"
+
+
+def get_client() -> GuardianApiClient:
+    """
+    Return the client shared across invocations, creating it on first use.
+
+    Returns:
+        The cached GuardianApiClient instance
+    """
+    global _client
+    if _client is None:
+        # Articles published by earlier warm invocations are skipped.
+        cache_ttl = float(os.environ.get("RESPONSE_CACHE_TTL", 0))
+        rate_limit = float(os.environ.get("GUARDIAN_RATE_LIMIT", 0))
+        daily_quota = os.environ.get("GUARDIAN_DAILY_QUOTA")
+        claim_check_bucket = os.environ.get("CLAIM_CHECK_BUCKET")
+        checkpoint_table = os.environ.get("CHECKPOINT_TABLE")
+        dedup_size = int(os.environ.get("DEDUP_INDEX_SIZE", 0))
+        sns_group_id = os.environ.get("SNS_MESSAGE_GROUP_ID")
+        sns_group_by = os.environ.get("SNS_MESSAGE_GROUP_BY")
+        if sns_group_id or sns_group_by:
+            # FIFO topics deliver each group in order, and groups in parallel.
+            default_registry.register(
+                SnsBackend(message_group_id=sns_group_id, group_by=sns_group_by)
+            )
+        _client = GuardianApiClient(
+            seen_store=InMemorySeenArticleStore(),
+            watermark_store=InMemoryWatermarkStore(),
+            # Runs cut short by the Lambda timeout resume from the checkpoint.
+            checkpoint_store=(
+                DynamoDBCheckpointStore(checkpoint_table)
+                if checkpoint_table
+                else InMemoryCheckpointStore()
+            ),
+            response_cache=InMemoryResponseCache(ttl=cache_ttl) if cache_ttl else None,
+            rate_limiter=(
+                RateLimiter(
+                    rate_limit, daily_quota=int(daily_quota) if daily_quota else None
+                )
+                if rate_limit
+                else None
+            ),
+            message_encoding=os.environ.get("MESSAGE_ENCODING", "json"),
+            stream_responses=os.environ.get("STREAM_RESPONSES", "").lower()
+            in ("1", "true", "yes"),
+            claim_check=(
+                ClaimCheck(
+                    claim_check_bucket,
+                    threshold=int(os.environ.get("CLAIM_CHECK_THRESHOLD", 16384)),
+                    mode=os.environ.get("CLAIM_CHECK_MODE", "article"),
+                )
+                if claim_check_bucket
+                else None
+            ),
+            # Fanned-out terms publish each story once, even across warm
+            # invocations.
+            deduplicator=(
+                ContentDeduplicator(max_size=dedup_size) if dedup_size else None
+            ),
+        )
+        _client.publish_buffer = (
+            BufferedPublisher(
+                _client,
+                max_articles=int(os.environ.get("PUBLISH_BUFFER_MAX_ARTICLES", 100)),
+                max_age=float(os.environ.get("PUBLISH_BUFFER_MAX_AGE", 1.0)),
+            )
+            if os.environ.get("PUBLISH_BUFFER", "").lower() in ("1", "true", "yes")
+            else None
+        )
+    return _client
+
+
+def get_deadline(context: Any) -> Optional[float]:
+    """
+    Work out when to stop starting new work in this invocation.
+
+    Args:
+        context: The Lambda context
+
+    Returns:
+        A time.monotonic() deadline, or None if the context has no time limit
+    """
+    get_remaining_time = getattr(context, "get_remaining_time_in_millis", None)
+    if get_remaining_time is None:
+        return None
+    margin = float(os.environ.get("TIME_BUDGET_MARGIN_MS", TIME_BUDGET_MARGIN_MS))
+    return time.monotonic() + (get_remaining_time() - margin) / 1000
+
+
+def continue_later(
+    event: Dict[str, Any], result: Dict[str, Any], context: Any
+) -> Dict[str, Any]:
+    """
+    Build the event that picks up where a cut-short invocation stopped.
+
+    Progress is held in the checkpoint store, so the follow-up event is the
+    original one with the terms still pending. With AUTO_CONTINUE set, or
+    auto_continue in the event, the function invokes itself asynchronously
+    with it, up to MAX_CONTINUATIONS times in a row.
+
+    Args:
+        event: The Lambda event data
+        result: The result of the cut-short run
+        context: The Lambda context
+
+    Returns:
+        The follow-up event
+    """
+    count = event.get("continuation_count", 0) + 1
+    next_event = {**event, "continuation_count": count}
+    if result.get("pending_terms"):
+        next_event["search_terms"] = result["pending_terms"]
+
+    auto_continue = event.get("auto_continue") or os.environ.get(
+        "AUTO_CONTINUE", ""
+    ).lower() in ("1", "true", "yes")
+    max_continuations = int(os.environ.get("MAX_CONTINUATIONS", MAX_CONTINUATIONS))
+    if auto_continue and count <= max_continuations:
+        logger.info(f"Invoking continuation {count} of {max_continuations}")
+        get_boto3_client("lambda").invoke(
+            FunctionName=context.invoked_function_arn,
+            InvocationType="Event",
+            Payload=json.dumps(next_event),
+        )
+    elif auto_continue:
+        logger.warning(f"Stopped after {max_continuations} continuations")
+    return next_event
+
+
+def emit_metrics(
+    client: GuardianApiClient, event: Dict[str, Any], context: Any, status_code: int
+):
+    """
+    Write the invocation's metrics to the log in Embedded Metric Format.
+
+    CloudWatch Logs turns the log line into metrics, so no API calls are made.
+    Metrics never fail the invocation; errors are only logged.
+
+    Args:
+        client: The client whose metrics are written
+        event: The Lambda event data
+        context: The Lambda context
+        status_code: The status code of the response
+    """
+    try:
+        document = client.metrics.emf(
+            os.environ.get("METRICS_NAMESPACE", METRICS_NAMESPACE),
+            dimensions={
+                "FunctionName": getattr(context, "function_name", "guardian_api_client")
+            },
+            properties={
+                "request_id": getattr(context, "aws_request_id", None),
+                "search_term": event.get("search_term"),
+                "search_terms": event.get("search_terms"),
+                "status_code": status_code,
+            },
+        )
+        print(json.dumps(document))
+    except Exception as e:
+        logger.warning(f"Could not emit metrics: {str(e)}")
+
 
 def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     """
     AWS Lambda handler function.
 
+    Args:
+        event: The Lambda event data containing search parameters
+        context: The Lambda context
+
+    Returns:
+        Dict containing the operation response
+    """
+    flushed = None
+    try:
+        response = handle_event(event, context)
+    finally:
+        # Nothing may stay buffered while the execution environment is frozen.
+        if _client is not None and _client.publish_buffer is not None:
+            flushed = _client.publish_buffer.flush()
+            if flushed["failed"]:
+                logger.error(f"{flushed['failed']} buffered articles failed to publish")
+    if flushed and flushed["failed"] and response["statusCode"] == 200:
+        result = json.loads(response["body"])
+        result["status"] = "partial"
+        result["buffer_failed_count"] = flushed["failed"]
+        response["body"] = json.dumps(result)
+    if _client is not None:
+        emit_metrics(_client, event, context, response["statusCode"])
+        _client.metrics.reset()
+    return response
+
+
+def handle_event(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
+    """
+    Run the search and publish requested by an event.
+
     Args:
         event: The Lambda event data containing search parameters
         context: The Lambda context
@@ -29,10 +239,11 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     try:
 
         search_term = event.get("search_term")
+        search_terms = event.get("search_terms")
         date_from = event.get("date_from")
         broker_reference = event.get("broker_reference")
 
-        if not search_term:
+        if not search_term and not search_terms:
             return {
                 "statusCode": 400,
                 "body": json.dumps({"error": "search_term is required"}),
@@ -44,8 +255,38 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
                 "body": json.dumps({"error": "broker_reference is required"}),
             }
 
-        client = GuardianApiClient()
-        result = client.publish_articles(search_term, broker_reference, date_from)
+        client = get_client()
+        # Work stops with a safety margin before the Lambda timeout.
+        deadline = get_deadline(context)
+        budget = {"deadline": deadline} if deadline is not None else {}
+        if search_terms:
+            result = client.publish_many(
+                search_terms,
+                broker_reference,
+                date_from,
+                max_workers=event.get("max_workers", 8),
+                **budget,
+            )
+        elif event.get("backfill"):
+            result = client.backfill(
+                search_term,
+                broker_reference,
+                date_from,
+                event.get("date_to"),
+                max_workers=event.get("max_workers", 4),
+                **budget,
+            )
+        elif event.get("incremental"):
+            result = client.publish_articles(
+                search_term, broker_reference, date_from, incremental=True, **budget
+            )
+        else:
+            result = client.publish_articles(
+                search_term, broker_reference, date_from, **budget
+            )
+
+        if result.get("complete") is False:
+            result["continuation"] = continue_later(event, result, context)
 
         return {"statusCode": 200, "body": json.dumps(result)}
 
@@ -0,0 +1,134 @@
+"""
+Compact encodings for published messages.
+
+By default messages are plain JSON. GuardianApiClient can instead publish
+gzip or zstd compressed JSON, or MessagePack, which is base64 encoded so it
+can travel in SNS and SQS message bodies. The encoding is recorded in a
+content-encoding message attribute, and decode_message reverses it for
+consumers.
+
+zstd and MessagePack need the optional zstandard and msgpack packages.
+"""
+
+import json
+import gzip
+import base64
+from typing import Any, Dict, Optional, Tuple
+
+# Message attribute naming the encoding of a message body.
+CONTENT_ENCODING_ATTRIBUTE = "content-encoding"
+
+ENCODINGS = ("json", "gzip", "zstd", "msgpack")
+
+
+def _zstandard():
+    try:
+        import zstandard
+    except ImportError:
+        raise ImportError("The zstd encoding requires the zstandard package")
+    return zstandard
+
+
+def _msgpack():
+    try:
+        import msgpack
+    except ImportError:
+        raise ImportError("The msgpack encoding requires the msgpack package")
+    return msgpack
+
+
+def validate_encoding(encoding: str):
+    """
+    Check a message encoding is supported.
+
+    Raises:
+        ValueError: If the encoding is unknown
+    """
+    if encoding not in ENCODINGS:
+        raise ValueError(
+            f"Unknown message encoding: {encoding}. Use one of {', '.join(ENCODINGS)}"
+        )
+
+
+def encode_message(payload: Any, encoding: str = "json") -> Tuple[str, Dict]:
+    """
+    Encode a message payload.
+
+    Args:
+        payload: JSON-serialisable data to publish
+        encoding: One of 'json', 'gzip', 'zstd' or 'msgpack' (default: 'json')
+
+    Returns:
+        Tuple of the message body and the message attributes to send with it.
+        Plain JSON messages carry no extra attributes.
+
+    Raises:
+        ValueError: If the encoding is unknown
+        ImportError: If the encoding needs a package that is not installed
+    """
+    validate_encoding(encoding)
+    if encoding == "json":
+        return json.dumps(payload), {}
+
+    if encoding == "msgpack":
+        data = _msgpack().packb(payload, use_bin_type=True)
+    else:
+        data = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+        if encoding == "gzip":
+            data = gzip.compress(data, mtime=0)
+        else:
+            data = _zstandard().ZstdCompressor().compress(data)
+
+    body = base64.b64encode(data).decode("ascii")
+    attributes = {
+        CONTENT_ENCODING_ATTRIBUTE: {"DataType": "String", "StringValue": encoding}
+    }
+    return body, attributes
+
+
+def message_encoding(attributes: Optional[Dict]) -> str:
+    """
+    Read the encoding of a received message from its attributes.
+
+    Accepts attributes as returned by SQS ReceiveMessage ({"StringValue": ...})
+    and as delivered in SNS notifications ({"Value": ...}).
+
+    Args:
+        attributes: The message attributes, if any
+
+    Returns:
+        The encoding, 'json' if the attribute is missing
+    """
+    attribute = (attributes or {}).get(CONTENT_ENCODING_ATTRIBUTE)
+    if not attribute:
+        return "json"
+    return attribute.get("StringValue") or attribute.get("Value") or "json"
+
+
+def decode_message(body: str, attributes: Optional[Dict] = None) -> Any:
+    """
+    Decode a message body published by GuardianApiClient.
+
+    Args:
+        body: The message body
+        attributes: The message attributes, used to find the encoding
+
+    Returns:
+        The decoded payload
+
+    Raises:
+        ValueError: If the encoding is unknown
+    """
+    encoding = message_encoding(attributes)
+    validate_encoding(encoding)
+    if encoding == "json":
+        return json.loads(body)
+
+    data = base64.b64decode(body)
+    if encoding == "msgpack":
+        return _msgpack().unpackb(data, raw=False)
+    if encoding == "gzip":
+        data = gzip.decompress(data)
+    else:
+        data = _zstandard().ZstdDecompressor().decompress(data)
+    return json.loads(data)
@@ -0,0 +1,212 @@
+"""
+Per-stage timings and counters for the search and publish hot path.
+
+GuardianApiClient records how long each stage takes (the Guardian HTTP
+request, JSON parsing, article extraction, claim-check offloading and the
+broker publish) and counts articles, bytes and retries. Totals are kept in a
+Metrics instance and every measurement is also passed to any registered
+hooks, so custom collectors can forward them elsewhere.
+
+The totals can be rendered as a CloudWatch Embedded Metric Format document.
+Printed as a single log line from Lambda, CloudWatch Logs extracts the
+metrics without any extra API calls.
+"""
+
+import time
+import threading
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Tuple
+
+
+class MetricsHook:
+    """Base class for collectors that receive every measurement."""
+
+    def timing(self, stage: str, seconds: float):
+        """
+        Receive the duration of one run of a stage.
+
+        Args:
+            stage: The stage name, e.g. 'search' or 'publish'
+            seconds: How long the stage took
+        """
+
+    def count(self, name: str, value: float):
+        """
+        Receive an increment of a counter.
+
+        Args:
+            name: The counter name, e.g. 'articles' or 'http_retries'
+            value: The amount added to the counter
+        """
+
+
+class InMemoryMetricsSink(MetricsHook):
+    """Hook recording every measurement in memory, for tests."""
+
+    def __init__(self):
+        self.events: List[Tuple[str, str, float]] = []
+        self._lock = threading.Lock()
+
+    def timing(self, stage: str, seconds: float):
+        with self._lock:
+            self.events.append(("timing", stage, seconds))
+
+    def count(self, name: str, value: float):
+        with self._lock:
+            self.events.append(("count", name, value))
+
+    def timings(self, stage: str) -> List[float]:
+        """Durations recorded for a stage, in order."""
+        with self._lock:
+            return [v for kind, n, v in self.events if kind == "timing" and n == stage]
+
+    def total(self, name: str) -> float:
+        """Sum of the increments recorded for a counter."""
+        with self._lock:
+            return sum(v for kind, n, v in self.events if kind == "count" and n == name)
+
+
+class Metrics:
+    """Thread-safe totals of stage timings and counters."""
+
+    def __init__(self, hooks: Optional[List[MetricsHook]] = None):
+        """
+        Initialize the metrics.
+
+        Args:
+            hooks: Optional collectors receiving every measurement
+        """
+        self.hooks = list(hooks or [])
+        self._lock = threading.Lock()
+        self._timings: Dict[str, Dict] = {}
+        self._counts: Dict[str, float] = {}
+
+    def add_hook(self, hook: MetricsHook):
+        """
+        Register a collector receiving every measurement.
+
+        Args:
+            hook: The collector
+        """
+        self.hooks.append(hook)
+
+    def timing(self, stage: str, seconds: float):
+        """
+        Record the duration of one run of a stage.
+
+        Args:
+            stage: The stage name
+            seconds: How long the stage took
+        """
+        with self._lock:
+            timing = self._timings.get(stage)
+            if timing is None:
+                timing = self._timings[stage] = {"count": 0, "total": 0.0, "max": 0.0}
+            timing["count"] += 1
+            timing["total"] += seconds
+            timing["max"] = max(timing["max"], seconds)
+        for hook in self.hooks:
+            hook.timing(stage, seconds)
+
+    def count(self, name: str, value: float = 1):
+        """
+        Add to a counter.
+
+        Args:
+            name: The counter name
+            value: The amount to add (default: 1)
+        """
+        if not value:
+            return
+        with self._lock:
+            self._counts[name] = self._counts.get(name, 0) + value
+        for hook in self.hooks:
+            hook.count(name, value)
+
+    @contextmanager
+    def timer(self, stage: str) -> Iterator[None]:
+        """
+        Time the enclosed block as one run of a stage.
+
+        Args:
+            stage: The stage name
+        """
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.timing(stage, time.perf_counter() - started)
+
+    def reset(self):
+        """Clear all totals."""
+        with self._lock:
+            self._timings.clear()
+            self._counts.clear()
+
+    def snapshot(self) -> Dict:
+        """
+        Return the current totals.
+
+        Returns:
+            Dict with 'timings', holding the count, total_ms and max_ms of
+            each stage, and 'counts', holding each counter
+        """
+        with self._lock:
+            return {
+                "timings": {
+                    stage: {
+                        "count": timing["count"],
+                        "total_ms": round(timing["total"] * 1000, 3),
+                        "max_ms": round(timing["max"] * 1000, 3),
+                    }
+                    for stage, timing in self._timings.items()
+                },
+                "counts": dict(self._counts),
+            }
+
+    def emf(
+        self,
+        namespace: str,
+        dimensions: Optional[Dict[str, str]] = None,
+        properties: Optional[Dict] = None,
+    ) -> Dict:
+        """
+        Render the current totals as a CloudWatch Embedded Metric Format document.
+
+        Each stage becomes a '<stage>_time' metric in milliseconds and each
+        counter a metric of the same name, in bytes for names ending in
+        '_bytes' and as a count otherwise.
+
+        Args:
+            namespace: The CloudWatch namespace
+            dimensions: Optional dimension names and values, e.g. the
+                function name
+            properties: Optional extra fields logged with the metrics but not
+                turned into metrics, e.g. the search term
+
+        Returns:
+            The EMF document, to be written to stdout as one JSON line
+        """
+        dimensions = dimensions or {}
+        snapshot = self.snapshot()
+        document = {**(properties or {}), **dimensions}
+        definitions = []
+        for stage, timing in snapshot["timings"].items():
+            document[f"{stage}_time"] = timing["total_ms"]
+            definitions.append({"Name": f"{stage}_time", "Unit": "Milliseconds"})
+        for name, value in snapshot["counts"].items():
+            document[name] = value
+            unit = "Bytes" if name.endswith("_bytes") else "Count"
+            definitions.append({"Name": name, "Unit": unit})
+
+        document["_aws"] = {
+            "Timestamp": int(time.time() * 1000),
+            "CloudWatchMetrics": [
+                {
+                    "Namespace": namespace,
+                    "Dimensions": [list(dimensions)],
+                    "Metrics": definitions,
+                }
+            ],
+        }
+        return document
@@ -0,0 +1,128 @@
+"""
+Declarative projection of Guardian API results onto published articles.
+
+A FieldProjection names the output keys of a published article and where
+each comes from in an API result. The same spec builds the show-fields,
+show-blocks and show-tags request parameters, so only the data that is
+published is requested, and drives a single-pass extractor.
+"""
+
+from typing import Dict, List, Optional
+
+# Output keys published by default, mapped to their source in API results.
+DEFAULT_FIELDS = {
+    "webPublicationDate": "webPublicationDate",
+    "webTitle": "webTitle",
+    "webUrl": "webUrl",
+}
+
+
+class FieldProjection:
+    """
+    Describes which API fields are requested and how they are published.
+
+    Sources are top-level result keys such as "webTitle" or "sectionId", or
+    "fields.<name>" for fields requested with show-fields, such as
+    "fields.trailText".
+    """
+
+    def __init__(
+        self,
+        fields: Optional[Dict[str, str]] = None,
+        preview_length: int = 1000,
+        include_body: bool = False,
+        show_blocks: Optional[str] = None,
+        show_tags: Optional[str] = None,
+    ):
+        if preview_length < 0:
+            raise ValueError("preview_length must not be negative")
+
+        self.fields = dict(DEFAULT_FIELDS if fields is None else fields)
+        self.preview_length = preview_length
+        self.include_body = include_body
+        self.show_blocks = show_blocks
+        self.show_tags = show_tags
+
+        # (output key, source name, whether the source is under "fields")
+        self._plan = []
+        for key, source in self.fields.items():
+            if source.startswith("fields."):
+                self._plan.append((key, source[len("fields.") :], True))
+            else:
+                self._plan.append((key, source, False))
+        self._needs_body = bool(preview_length) or include_body
+
+    def replace(self, **changes) -> "FieldProjection":
+        """Return a copy of the projection with some settings changed."""
+        settings = {
+            "fields": self.fields,
+            "preview_length": self.preview_length,
+            "include_body": self.include_body,
+            "show_blocks": self.show_blocks,
+            "show_tags": self.show_tags,
+        }
+        settings.update(changes)
+        return FieldProjection(**settings)
+
+    def show_fields(self) -> Optional[str]:
+        """
+        Return the show-fields request parameter.
+
+        Returns:
+            Comma-separated field names, or None if no fields are needed
+        """
+        names = [name for _, name, in_fields in self._plan if in_fields]
+        if self._needs_body:
+            names.append("bodyText")
+        return ",".join(dict.fromkeys(names)) or None
+
+    def search_params(self) -> Dict:
+        """Return the show-fields, show-blocks and show-tags request parameters."""
+        params = {}
+        show_fields = self.show_fields()
+        if show_fields:
+            params["show-fields"] = show_fields
+        if self.show_blocks:
+            params["show-blocks"] = self.show_blocks
+        if self.show_tags:
+            params["show-tags"] = self.show_tags
+        return params
+
+    def extract(self, result: Dict) -> Dict:
+        """
+        Build the published article from a single API result.
+
+        Args:
+            result: A single result from the Guardian API response
+
+        Returns:
+            Dictionary containing the projected article data
+        """
+        fields = result.get("fields") or {}
+        article = {
+            key: fields.get(name) if in_fields else result.get(name)
+            for key, name, in_fields in self._plan
+        }
+
+        if self._needs_body and "bodyText" in fields:
+            body_text = fields["bodyText"]
+            if self.preview_length:
+                article["contentPreview"] = (
+                    body_text[: self.preview_length] if body_text else None
+                )
+            if self.include_body:
+                article["bodyText"] = body_text
+
+        if self.show_tags:
+            article["tags"] = [tag.get("id") for tag in result.get("tags", [])]
+        if self.show_blocks:
+            article["blocks"] = result.get("blocks")
+        return article
+
+    def extract_all(self, results: List[Dict]) -> List[Dict]:
+        """Build the published articles from a list of API results."""
+        extract = self.extract
+        return [extract(result) for result in results]
+
+
+DEFAULT_PROJECTION = FieldProjection()
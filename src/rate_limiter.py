@@ -0,0 +1,160 @@
+"""
+Client-side rate limiting for the Guardian API.
+
+A RateLimiter is shared by every request a GuardianApiClient makes, across
+threads, so throughput stays within the calls per second and calls per day
+allowed by the API key instead of failing with 429 responses.
+"""
+
+import time
+import random
+import threading
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+
+class QuotaExceededError(Exception):
+    """Raised when the daily request budget has been used up."""
+
+
+def backoff_delay(attempt: int, base: float = 0.5, cap: float = 30.0) -> float:
+    """
+    Return a jittered exponential backoff delay.
+
+    Args:
+        attempt: Zero-based retry attempt
+        base: Delay in seconds for the first retry before jitter
+        cap: Maximum delay in seconds
+
+    Returns:
+        Delay in seconds, chosen uniformly up to the exponential bound
+    """
+    return random.uniform(0, min(cap, base * 2**attempt))
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header given in seconds or as an HTTP date.
+
+    Args:
+        value: The header value
+
+    Returns:
+        Delay in seconds, or None if the header is missing or invalid
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+class RateLimiter:
+    """
+    Thread-safe token bucket with an optional daily request budget.
+
+    Callers reserve a token before each request and sleep outside the lock
+    until their reservation is due, so waiting threads are served in order.
+    """
+
+    def __init__(
+        self, rate: float = 1.0, burst: int = 1, daily_quota: Optional[int] = None
+    ):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        if burst < 1:
+            raise ValueError("burst must be at least 1")
+
+        self.rate = rate
+        self.burst = burst
+        self.daily_quota = daily_quota
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._day = self._today()
+        self._used_today = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _today() -> str:
+        return datetime.now(timezone.utc).strftime("%Y-%m-%d")
+
+    def _roll_day(self):
+        today = self._today()
+        if today != self._day:
+            self._day = today
+            self._used_today = 0
+
+    @property
+    def used_today(self) -> int:
+        """Number of requests made since midnight UTC."""
+        with self._lock:
+            self._roll_day()
+            return self._used_today
+
+    @property
+    def remaining_quota(self) -> Optional[int]:
+        """Requests left in today's budget, or None if there is no budget."""
+        with self._lock:
+            self._roll_day()
+            if self.daily_quota is None:
+                return None
+            return max(0, self.daily_quota - self._used_today)
+
+    def acquire(self):
+        """
+        Block until a request may be made.
+
+        Raises:
+            QuotaExceededError: If the daily budget has been used up
+        """
+        with self._lock:
+            self._roll_day()
+            if self.daily_quota is not None and self._used_today >= self.daily_quota:
+                raise QuotaExceededError(
+                    f"Daily quota of {self.daily_quota} requests used up"
+                )
+            self._used_today += 1
+
+            now = time.monotonic()
+            self._tokens = min(
+                self.burst, self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+            wait = max(wait, self._paused_until - now)
+
+        if wait > 0:
+            time.sleep(wait)
+
+    def pause(self, seconds: float):
+        """
+        Hold back every caller for a period, e.g. after a 429 response.
+
+        Args:
+            seconds: How long to hold back requests
+        """
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+    def sync_remaining(self, remaining: int):
+        """
+        Align the daily budget with the remaining count reported by the API.
+
+        Args:
+            remaining: Requests the API reports as left today
+        """
+        with self._lock:
+            self._roll_day()
+            if self.daily_quota is not None:
+                self._used_today = max(self._used_today, self.daily_quota - remaining)
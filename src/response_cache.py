@@ -0,0 +1,181 @@
+"""
+Caches for Guardian API search responses.
+
+GuardianApiClient consults a cache before each search request. Responses
+are keyed on the normalised query parameters, excluding the API key, so
+identical searches within the TTL cost no API quota. Expired responses that
+carried an ETag are revalidated with If-None-Match rather than re-downloaded.
+"""
+
+import json
+import time
+import sqlite3
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+
+class ResponseCache:
+    """Base class for size-bounded, TTL-based response caches."""
+
+    def __init__(self, max_size: int, ttl: float):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key_for(url: str, params: Dict) -> str:
+        """
+        Build a cache key from a request URL and its query parameters.
+
+        Args:
+            url: The request URL
+            params: The query parameters
+
+        Returns:
+            String key independent of parameter order and the API key
+        """
+        normalised = {
+            name: str(value) for name, value in params.items() if name != "api-key"
+        }
+        return json.dumps([url, normalised], sort_keys=True)
+
+    def lookup(self, key: str) -> Tuple[Optional[Dict], Optional[str]]:
+        """
+        Look up a cached response.
+
+        Args:
+            key: The cache key
+
+        Returns:
+            Tuple of the response body if it is fresh, and otherwise the ETag
+            of the expired response if one can be revalidated
+        """
+        with self._lock:
+            entry = self._get(key)
+            if entry is not None and entry["expires_at"] > time.time():
+                self.hits += 1
+                return entry["body"], None
+            self.misses += 1
+            return None, entry["etag"] if entry else None
+
+    def revalidate(self, key: str) -> Optional[Dict]:
+        """
+        Renew an expired response after the server reported it unchanged.
+
+        Args:
+            key: The cache key
+
+        Returns:
+            The cached response body, or None if it is no longer cached
+        """
+        with self._lock:
+            entry = self._get(key)
+            if entry is None:
+                return None
+            self.revalidations += 1
+            self._set(key, entry["body"], entry["etag"], time.time() + self.ttl)
+            return entry["body"]
+
+    def store(self, key: str, body: Dict, etag: Optional[str] = None):
+        """
+        Cache a response.
+
+        Args:
+            key: The cache key
+            body: The decoded JSON response
+            etag: Optional ETag header returned with the response
+        """
+        with self._lock:
+            self._set(key, body, etag, time.time() + self.ttl)
+
+    def stats(self) -> Dict:
+        """Return hit, miss, revalidation and eviction counters."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "revalidations": self.revalidations,
+                "evictions": self.evictions,
+            }
+
+    def _get(self, key: str) -> Optional[Dict]:
+        raise NotImplementedError
+
+    def _set(self, key: str, body: Dict, etag: Optional[str], expires_at: float):
+        raise NotImplementedError
+
+
+class InMemoryResponseCache(ResponseCache):
+    """LRU response cache held in process memory."""
+
+    def __init__(self, max_size: int = 256, ttl: float = 300):
+        super().__init__(max_size, ttl)
+        self._entries: "OrderedDict[str, Dict]" = OrderedDict()
+
+    def _get(self, key: str) -> Optional[Dict]:
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    def _set(self, key: str, body: Dict, etag: Optional[str], expires_at: float):
+        self._entries[key] = {"body": body, "etag": etag, "expires_at": expires_at}
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+
+class SQLiteResponseCache(ResponseCache):
+    """LRU response cache persisted in a SQLite database file."""
+
+    def __init__(self, path: str, max_size: int = 1024, ttl: float = 300):
+        super().__init__(max_size, ttl)
+        self.path = path
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, "
+            "body TEXT NOT NULL, etag TEXT, expires_at REAL NOT NULL, "
+            "last_used REAL NOT NULL)"
+        )
+        self._connection.commit()
+
+    def close(self):
+        """Close the database connection."""
+        self._connection.close()
+
+    def _get(self, key: str) -> Optional[Dict]:
+        row = self._connection.execute(
+            "SELECT body, etag, expires_at FROM responses WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        with self._connection:
+            self._connection.execute(
+                "UPDATE responses SET last_used = ? WHERE key = ?", (time.time(), key)
+            )
+        return {"body": json.loads(row[0]), "etag": row[1], "expires_at": row[2]}
+
+    def _set(self, key: str, body: Dict, etag: Optional[str], expires_at: float):
+        with self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO responses "
+                "(key, body, etag, expires_at, last_used) VALUES (?, ?, ?, ?, ?)",
+                (key, json.dumps(body), etag, expires_at, time.time()),
+            )
+            size = self._connection.execute(
+                "SELECT COUNT(*) FROM responses"
+            ).fetchone()[0]
+            excess = size - self.max_size
+            if excess > 0:
+                self._connection.execute(
+                    "DELETE FROM responses WHERE key IN "
+                    "(SELECT key FROM responses ORDER BY last_used LIMIT ?)",
+                    (excess,),
+                )
+                self.evictions += excess
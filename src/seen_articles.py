@@ -0,0 +1,183 @@
+"""
+Stores recording which articles have already been published.
+
+GuardianApiClient consults a store before publishing so that articles seen
+by an earlier run are skipped. Articles are keyed on their Guardian id,
+falling back to webUrl for processed articles.
+"""
+
+import time
+import sqlite3
+import threading
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional
+
+
+class SeenArticleStore:
+    """Base class for stores of already-published articles."""
+
+    def __init__(self, ttl: float = 86400):
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def article_key(article: Dict) -> Optional[str]:
+        """Return the key identifying an article, or None if it has none."""
+        return article.get("id") or article.get("webUrl")
+
+    def seen(self, article: Dict) -> bool:
+        """
+        Check whether an article has already been published.
+
+        Args:
+            article: Article data containing an id or webUrl
+
+        Returns:
+            True if the article was published within the TTL
+        """
+        key = self.article_key(article)
+        with self._lock:
+            found = key is not None and self._contains(key, time.time())
+            if found:
+                self.hits += 1
+            else:
+                self.misses += 1
+        return found
+
+    def filter_new(self, articles: Iterable[Dict]) -> List[Dict]:
+        """
+        Return only the articles that have not been published yet.
+
+        Args:
+            articles: Article data to check
+
+        Returns:
+            List of unseen articles
+        """
+        return [article for article in articles if not self.seen(article)]
+
+    def mark_seen(self, articles: Iterable[Dict]):
+        """
+        Record articles as published.
+
+        Args:
+            articles: Article data that was published
+        """
+        keys = [self.article_key(article) for article in articles]
+        keys = [key for key in keys if key is not None]
+        if keys:
+            with self._lock:
+                self._add(keys, time.time() + self.ttl)
+
+    def stats(self) -> Dict:
+        """Return hit, miss and eviction counters and the current store size."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "size": self._size(),
+            }
+
+    def _contains(self, key: str, now: float) -> bool:
+        raise NotImplementedError
+
+    def _add(self, keys: List[str], expires_at: float):
+        raise NotImplementedError
+
+    def _size(self) -> int:
+        raise NotImplementedError
+
+
+class InMemorySeenArticleStore(SeenArticleStore):
+    """
+    LRU store held in process memory.
+
+    Survives across warm Lambda invocations when kept at module scope.
+    """
+
+    def __init__(self, max_size: int = 10000, ttl: float = 86400):
+        super().__init__(ttl)
+        self.max_size = max_size
+        self._entries: "OrderedDict[str, float]" = OrderedDict()
+
+    def _contains(self, key: str, now: float) -> bool:
+        expires_at = self._entries.get(key)
+        if expires_at is None:
+            return False
+        if expires_at <= now:
+            del self._entries[key]
+            self.evictions += 1
+            return False
+        self._entries.move_to_end(key)
+        return True
+
+    def _add(self, keys: List[str], expires_at: float):
+        for key in keys:
+            self._entries[key] = expires_at
+            self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def _size(self) -> int:
+        return len(self._entries)
+
+
+class SQLiteSeenArticleStore(SeenArticleStore):
+    """
+    Store persisted in a SQLite database file.
+
+    Useful locally and for long-running workers that restart.
+    """
+
+    def __init__(self, path: str, max_size: int = 100000, ttl: float = 86400):
+        super().__init__(ttl)
+        self.path = path
+        self.max_size = max_size
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS seen_articles "
+            "(key TEXT PRIMARY KEY, expires_at REAL NOT NULL)"
+        )
+        self._connection.commit()
+
+    def close(self):
+        """Close the database connection."""
+        self._connection.close()
+
+    def _contains(self, key: str, now: float) -> bool:
+        row = self._connection.execute(
+            "SELECT expires_at FROM seen_articles WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return False
+        if row[0] <= now:
+            self._connection.execute("DELETE FROM seen_articles WHERE key = ?", (key,))
+            self._connection.commit()
+            self.evictions += 1
+            return False
+        return True
+
+    def _add(self, keys: List[str], expires_at: float):
+        with self._connection:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO seen_articles (key, expires_at) VALUES (?, ?)",
+                [(key, expires_at) for key in keys],
+            )
+            excess = self._size() - self.max_size
+            if excess > 0:
+                self._connection.execute(
+                    "DELETE FROM seen_articles WHERE key IN "
+                    "(SELECT key FROM seen_articles ORDER BY expires_at LIMIT ?)",
+                    (excess,),
+                )
+                self.evictions += excess
+
+    def _size(self) -> int:
+        return self._connection.execute(
+            "SELECT COUNT(*) FROM seen_articles"
+        ).fetchone()[0]
@@ -0,0 +1,96 @@
+"""
+Incremental parsing of Guardian API search responses.
+
+ResultStream decodes the results array of a search response one result at
+a time as the HTTP body arrives, so memory is bounded by the largest single
+result rather than by the whole page. The rest of the response, such as the
+number of pages, is available from metadata once the results are consumed.
+"""
+
+import re
+import json
+import codecs
+from typing import Dict, Iterable, Iterator, Optional
+
+# Start of the results array, which follows the scalar response metadata.
+_RESULTS_START = re.compile(r'"results"\s*:\s*\[')
+_SKIP = re.compile(r"[\s,]*")
+
+
+class ResultStream:
+    """
+    Iterates over the results of a search response read in chunks.
+
+    Args:
+        chunks: The response body as an iterable of byte strings
+    """
+
+    def __init__(self, chunks: Iterable[bytes]):
+        self._chunks = iter(chunks)
+        self._decoder = json.JSONDecoder()
+        self._utf8 = codecs.getincrementaldecoder("utf-8")()
+        self._metadata: Optional[Dict] = None
+        self.results_count = 0
+
+    def _read(self) -> Optional[str]:
+        for chunk in self._chunks:
+            text = self._utf8.decode(chunk)
+            if text:
+                return text
+        return None
+
+    @property
+    def metadata(self) -> Dict:
+        """
+        The decoded response with an empty results array.
+
+        Raises:
+            RuntimeError: If the results have not been consumed yet
+        """
+        if self._metadata is None:
+            raise RuntimeError("Metadata is available once the results are consumed")
+        return self._metadata
+
+    def __iter__(self) -> Iterator[Dict]:
+        buffer = ""
+        match = None
+        while match is None:
+            text = self._read()
+            if text is None:
+                # No results array, e.g. an error response.
+                self._metadata = json.loads(buffer + self._utf8.decode(b"", True))
+                return
+            # Re-scan the end of the previous buffer in case the key was split.
+            match = _RESULTS_START.search(buffer + text, max(0, len(buffer) - 16))
+            buffer += text
+
+        head = buffer[: match.start()]
+        buffer = buffer[match.end() :]
+        position = 0
+        while True:
+            position = _SKIP.match(buffer, position).end()
+            if position < len(buffer) and buffer[position] == "]":
+                break
+            try:
+                result, end = self._decoder.raw_decode(buffer, position)
+            except json.JSONDecodeError:
+                text = self._read()
+                if text is None:
+                    raise
+                # Drop what has already been decoded before reading on.
+                buffer = buffer[position:] + text
+                position = 0
+                continue
+            self.results_count += 1
+            yield result
+            position = end
+            if position > len(buffer) // 2:
+                buffer = buffer[position:]
+                position = 0
+
+        tail = buffer[position + 1 :]
+        text = self._read()
+        while text is not None:
+            tail += text
+            text = self._read()
+        self._metadata = json.loads(head + '"results":[]' + tail)
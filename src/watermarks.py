@@ -0,0 +1,89 @@
+"""
+Stores recording the newest article published for each search term.
+
+GuardianApiClient uses a watermark in incremental mode to query only for
+content published since the previous run.
+"""
+
+import sqlite3
+import threading
+from typing import Dict, Optional
+
+
+class WatermarkStore:
+    """Base class for per-term publication date watermarks."""
+
+    def get(self, search_term: str) -> Optional[str]:
+        """
+        Return the latest webPublicationDate published for a term.
+
+        Args:
+            search_term: The search term
+
+        Returns:
+            ISO 8601 timestamp, or None if nothing has been published yet
+        """
+        raise NotImplementedError
+
+    def set(self, search_term: str, watermark: str):
+        """
+        Record the latest webPublicationDate published for a term.
+
+        Args:
+            search_term: The search term
+            watermark: ISO 8601 timestamp
+        """
+        raise NotImplementedError
+
+
+class InMemoryWatermarkStore(WatermarkStore):
+    """Watermarks held in process memory."""
+
+    def __init__(self):
+        self._watermarks: Dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def get(self, search_term: str) -> Optional[str]:
+        with self._lock:
+            return self._watermarks.get(search_term)
+
+    def set(self, search_term: str, watermark: str):
+        with self._lock:
+            current = self._watermarks.get(search_term)
+            if current is None or watermark > current:
+                self._watermarks[search_term] = watermark
+
+
+class SQLiteWatermarkStore(WatermarkStore):
+    """Watermarks persisted in a SQLite database file."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS watermarks "
+            "(search_term TEXT PRIMARY KEY, watermark TEXT NOT NULL)"
+        )
+        self._connection.commit()
+
+    def close(self):
+        """Close the database connection."""
+        self._connection.close()
+
+    def get(self, search_term: str) -> Optional[str]:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT watermark FROM watermarks WHERE search_term = ?",
+                (search_term,),
+            ).fetchone()
+        return row[0] if row else None
+
+    def set(self, search_term: str, watermark: str):
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT INTO watermarks (search_term, watermark) VALUES (?, ?) "
+                "ON CONFLICT(search_term) DO UPDATE SET watermark = excluded.watermark "
+                "WHERE excluded.watermark > watermarks.watermark",
+                (search_term, watermark),
+            )
@@ -0,0 +1,15 @@
+resource "aws_dynamodb_table" "checkpoints" {
+  name         = "guardian_content_checkpoints"
+  billing_mode = "PAY_PER_REQUEST"
+  hash_key     = "key"
+
+  attribute {
+    name = "key"
+    type = "S"
+  }
+
+  ttl {
+    attribute_name = "expires_at"
+    enabled        = true
+  }
+}
@@ -17,6 +17,8 @@ resource "aws_lambda_function" "guardian_api_client" {
     variables = {
       SECRETS_ARN = aws_secretsmanager_secret.api_credentials.arn
       GUARDIAN_API_KEY = local.api_credentials["guardian_api_key"]
+      CLAIM_CHECK_BUCKET = aws_s3_bucket.article_bodies.bucket
+      CHECKPOINT_TABLE = aws_dynamodb_table.checkpoints.name
     }
   }
   depends_on = [aws_s3_object.lambda_code, aws_s3_object.lambda_layer]
@@ -118,3 +118,59 @@ resource "aws_iam_role_policy_attachment" "attach_sqs_policy" {
 }
 
 
+
+resource "aws_iam_role_policy" "lambda_claim_check_write" {
+  name = "lambda_claim_check_write"
+  role = aws_iam_role.lambda_role.name
+
+  policy = jsonencode({
+    Version = "2012-10-17",
+    Statement = [
+      {
+        Effect = "Allow",
+        Action = [
+          "s3:PutObject"
+        ],
+        Resource = "${aws_s3_bucket.article_bodies.arn}/*"
+      }
+    ]
+  })
+}
+
+resource "aws_iam_role_policy" "lambda_checkpoints" {
+  name = "lambda_checkpoints"
+  role = aws_iam_role.lambda_role.name
+
+  policy = jsonencode({
+    Version = "2012-10-17",
+    Statement = [
+      {
+        Effect = "Allow",
+        Action = [
+          "dynamodb:GetItem",
+          "dynamodb:PutItem",
+          "dynamodb:DeleteItem"
+        ],
+        Resource = aws_dynamodb_table.checkpoints.arn
+      }
+    ]
+  })
+}
+
+resource "aws_iam_role_policy" "lambda_self_invoke" {
+  name = "lambda_self_invoke"
+  role = aws_iam_role.lambda_role.name
+
+  policy = jsonencode({
+    Version = "2012-10-17",
+    Statement = [
+      {
+        Effect = "Allow",
+        Action = [
+          "lambda:InvokeFunction"
+        ],
+        Resource = aws_lambda_function.guardian_api_client.arn
+      }
+    ]
+  })
+}
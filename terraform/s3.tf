@@ -20,3 +20,26 @@ resource "aws_s3_object" "lambda_layer" {
   etag   = filemd5(data.archive_file.layer_code.output_path)
   depends_on = [ data.archive_file.layer_code ]
 }
+
+resource "aws_s3_bucket" "article_bodies" {
+  bucket_prefix = "guardian-article-bodies"
+  tags = {
+    Name = "Claim-check article bodies"
+  }
+}
+
+resource "aws_s3_bucket_lifecycle_configuration" "article_bodies" {
+  bucket = aws_s3_bucket.article_bodies.id
+
+  rule {
+    id     = "expire-with-messages"
+    status = "Enabled"
+
+    filter {}
+
+    # Matches the queue's message retention.
+    expiration {
+      days = 3
+    }
+  }
+}
@@ -0,0 +1,99 @@
+"""
+Helpers for timing benchmarks and recording their results.
+
+Results are printed, and appended as JSON lines to the file named by the
+BENCHMARK_RESULTS environment variable when it is set, so runs can be
+compared over time.
+"""
+
+import os
+import json
+import time
+import platform
+import tracemalloc
+from typing import Callable, Dict, List
+
+
+def percentile(samples: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of a list of samples."""
+    ordered = sorted(samples)
+    index = max(0, min(len(ordered) - 1, round(fraction * len(ordered)) - 1))
+    return ordered[index]
+
+
+def run_benchmark(
+    name: str,
+    operation: Callable[[], int],
+    iterations: int,
+    count_requests: Callable[[], int] = lambda: 0,
+) -> Dict:
+    """
+    Run an operation repeatedly and measure its throughput and latency.
+
+    Latency is timed without tracing, then one more run under tracemalloc
+    measures peak memory.
+
+    Args:
+        name: The benchmark name
+        operation: Function running one iteration and returning the number
+            of articles it handled
+        iterations: Number of timed iterations
+        count_requests: Function returning the number of HTTP or broker
+            requests made so far
+
+    Returns:
+        Dict with requests and articles per second, p50 and p99 latency in
+        milliseconds, and peak memory in KiB
+    """
+    operation()
+    requests_before = count_requests()
+    latencies = []
+    articles = 0
+    started = time.perf_counter()
+    for _ in range(iterations):
+        iteration_started = time.perf_counter()
+        articles += operation()
+        latencies.append(time.perf_counter() - iteration_started)
+    elapsed = time.perf_counter() - started
+    requests_made = count_requests() - requests_before
+
+    tracemalloc.start()
+    try:
+        operation()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "name": name,
+        "iterations": iterations,
+        "requests_per_second": round(requests_made / elapsed, 1),
+        "articles_per_second": round(articles / elapsed, 1),
+        "p50_ms": round(percentile(latencies, 0.5) * 1000, 3),
+        "p99_ms": round(percentile(latencies, 0.99) * 1000, 3),
+        "peak_memory_kib": round(peak / 1024, 1),
+    }
+
+
+def record(result: Dict):
+    """
+    Print a benchmark result and append it to BENCHMARK_RESULTS, if set.
+
+    Args:
+        result: The result returned by run_benchmark
+    """
+    print(
+        f"\n{result['name']}: {result['requests_per_second']} requests/s, "
+        f"{result['articles_per_second']} articles/s, "
+        f"p50 {result['p50_ms']} ms, p99 {result['p99_ms']} ms, "
+        f"peak {result['peak_memory_kib']} KiB"
+    )
+    path = os.environ.get("BENCHMARK_RESULTS")
+    if path:
+        line = {
+            **result,
+            "timestamp": int(time.time()),
+            "python": platform.python_version(),
+        }
+        with open(path, "a") as results_file:
+            results_file.write(json.dumps(line) + "\n")
@@ -2,6 +2,8 @@ import pytest
 import os
 from unittest.mock import patch
 
+from fake_guardian_api import FakeGuardianApi
+
 
 @pytest.fixture(autouse=True)
 def mock_env_variables():
@@ -10,6 +12,15 @@ def mock_env_variables():
         yield
 
 
+@pytest.fixture
+def fake_api():
+    """Run a local fake Guardian API server for the duration of a test."""
+    server = FakeGuardianApi().start()
+    yield server
+    server.stop()
+
+
 def pytest_configure(config):
     """Configure pytest."""
     config.addinivalue_line("markers", "integration: mark test as an integration test")
+    config.addinivalue_line("markers", "benchmark: mark test as a benchmark")
@@ -0,0 +1,39 @@
+"""
+In-process stand-in for the DynamoDB item API used by checkpoint stores.
+"""
+
+import copy
+import threading
+from typing import Dict, List
+
+
+class FakeDynamoDB:
+    """A fake low-level boto3 DynamoDB client holding items in memory."""
+
+    def __init__(self):
+        self.tables: Dict[str, Dict] = {}
+        self.calls: List[str] = []
+        self.lock = threading.Lock()
+
+    def _item_key(self, Key: Dict) -> str:
+        return Key["key"]["S"]
+
+    def get_item(self, TableName: str, Key: Dict, ConsistentRead: bool = False):
+        with self.lock:
+            self.calls.append("GetItem")
+            item = self.tables.get(TableName, {}).get(self._item_key(Key))
+        return {"Item": copy.deepcopy(item)} if item is not None else {}
+
+    def put_item(self, TableName: str, Item: Dict):
+        with self.lock:
+            self.calls.append("PutItem")
+            self.tables.setdefault(TableName, {})[Item["key"]["S"]] = copy.deepcopy(
+                Item
+            )
+        return {}
+
+    def delete_item(self, TableName: str, Key: Dict):
+        with self.lock:
+            self.calls.append("DeleteItem")
+            self.tables.get(TableName, {}).pop(self._item_key(Key), None)
+        return {}
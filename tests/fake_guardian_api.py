@@ -0,0 +1,134 @@
+"""
+In-process stand-in for the Guardian Content API search endpoint.
+
+The server speaks HTTP/1.1 with keep-alive so tests can observe how many
+TCP connections a client opens. Latency and 429 responses can be switched on
+to benchmark the client against a slow or throttling API.
+"""
+
+import json
+import time
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List
+from urllib.parse import parse_qs, urlparse
+
+
+class _SearchHandler(BaseHTTPRequestHandler):
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def setup(self):
+        super().setup()
+        with self.server.fake.lock:
+            self.server.fake.connections += 1
+
+    def do_GET(self):
+        fake = self.server.fake
+        params = {k: v[0] for k, v in parse_qs(urlparse(self.path).query).items()}
+        with fake.lock:
+            fake.requests.append(params)
+            throttled = (
+                fake.throttle_every and len(fake.requests) % fake.throttle_every == 0
+            )
+        if fake.latency:
+            time.sleep(fake.latency)
+
+        if throttled:
+            self.send_response(429)
+            self.send_header("Retry-After", "0")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        if fake.etag and self.headers.get("If-None-Match") == fake.etag:
+            self.send_response(304)
+            self.send_header("ETag", fake.etag)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        body = json.dumps(fake.build_response(params)).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        if fake.etag:
+            self.send_header("ETag", fake.etag)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class FakeGuardianApi:
+    """
+    A local HTTP server emulating paged Guardian search results.
+
+    Args:
+        total: Number of results for every search
+        body_size: Length of each result's bodyText
+        etag: Optional ETag sent with every response
+        latency: Seconds to wait before answering each request
+        throttle_every: Answer every nth request with 429 and Retry-After: 0
+    """
+
+    def __init__(
+        self,
+        total: int = 25,
+        body_size: int = 100,
+        etag: str = None,
+        latency: float = 0.0,
+        throttle_every: int = 0,
+    ):
+        self.total = total
+        self.body_size = body_size
+        self.etag = etag
+        self.latency = latency
+        self.throttle_every = throttle_every
+        self.requests: List[Dict] = []
+        self.connections = 0
+        self.lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), _SearchHandler)
+        self._server.daemon_threads = True
+        self._server.fake = self
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address
+        return f"http://{host}:{port}/search"
+
+    def start(self) -> "FakeGuardianApi":
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def build_response(self, params: Dict) -> Dict:
+        page_size = int(params.get("page-size", 10))
+        page = int(params.get("page", 1))
+        pages = max(1, -(-self.total // page_size))
+        start = (page - 1) * page_size
+        results = [
+            {
+                "id": f"technology/article-{i}",
+                "webPublicationDate": "2023-11-21T12:00:00Z",
+                "webTitle": f"Article {i}",
+                "webUrl": f"https://www.theguardian.com/technology/article-{i}",
+                "fields": {"bodyText": "x" * self.body_size},
+            }
+            for i in range(start, min(start + page_size, self.total))
+        ]
+        return {
+            "response": {
+                "status": "ok",
+                "total": self.total,
+                "currentPage": page,
+                "pages": pages,
+                "results": results,
+            }
+        }
@@ -0,0 +1,70 @@
+"""
+In-process stand-in for a Kinesis data stream's PutRecords API.
+
+Records are routed to shards the way Kinesis does it, by the MD5 hash of
+the partition key, and each shard accepts a limited number of records per
+call so tests can observe throttled records being retried.
+"""
+
+import hashlib
+import threading
+from typing import Dict, List, Optional
+
+
+class FakeKinesis:
+    """A fake boto3 Kinesis client holding records in memory."""
+
+    def __init__(self, shard_count: int = 4, shard_capacity: Optional[int] = None):
+        self.shard_count = shard_count
+        self.shard_capacity = shard_capacity
+        self.shards: Dict[str, List[Dict]] = {
+            self.shard_id(index): [] for index in range(shard_count)
+        }
+        self.calls: List[Dict] = []
+        self.lock = threading.Lock()
+        self._sequence = 0
+
+    @staticmethod
+    def shard_id(index: int) -> str:
+        return f"shardId-{index:012d}"
+
+    def shard_for(self, partition_key: str) -> str:
+        """Return the shard a partition key hashes to."""
+        hash_key = int(hashlib.md5(partition_key.encode("utf-8")).hexdigest(), 16)
+        return self.shard_id(hash_key * self.shard_count >> 128)
+
+    def put_records(self, Records: List[Dict], StreamName=None, StreamARN=None):
+        if len(Records) > 500:
+            raise ValueError("PutRecords accepts at most 500 records")
+        size = sum(len(r["Data"]) + len(r["PartitionKey"]) for r in Records)
+        if size > 5 * 1024 * 1024:
+            raise ValueError("PutRecords accepts at most 5 MiB")
+
+        with self.lock:
+            self.calls.append({"StreamName": StreamName, "Records": Records})
+            accepted = {shard: 0 for shard in self.shards}
+            results = []
+            for record in Records:
+                shard = self.shard_for(record["PartitionKey"])
+                if (
+                    self.shard_capacity is not None
+                    and accepted[shard] >= self.shard_capacity
+                ):
+                    results.append(
+                        {
+                            "ErrorCode": "ProvisionedThroughputExceededException",
+                            "ErrorMessage": f"Rate exceeded for shard {shard}",
+                        }
+                    )
+                    continue
+                accepted[shard] += 1
+                self._sequence += 1
+                self.shards[shard].append(record)
+                results.append(
+                    {"SequenceNumber": str(self._sequence), "ShardId": shard}
+                )
+
+        return {
+            "FailedRecordCount": sum(1 for r in results if "ErrorCode" in r),
+            "Records": results,
+        }
@@ -0,0 +1,32 @@
+"""
+In-process stand-in for the S3 object API used by claim-check offloading.
+"""
+
+import io
+import threading
+from typing import Dict, List, Tuple
+
+
+class FakeS3:
+    """A fake boto3 S3 client holding objects in memory."""
+
+    def __init__(self):
+        self.objects: Dict[Tuple[str, str], Dict] = {}
+        self.gets: List[Tuple[str, str]] = []
+        self.lock = threading.Lock()
+
+    def put_object(self, Bucket: str, Key: str, Body: bytes, ContentType=None):
+        with self.lock:
+            self.objects[(Bucket, Key)] = {"Body": Body, "ContentType": ContentType}
+        return {"ETag": f'"{len(Body)}"'}
+
+    def get_object(self, Bucket: str, Key: str):
+        with self.lock:
+            self.gets.append((Bucket, Key))
+            if (Bucket, Key) not in self.objects:
+                raise KeyError(f"NoSuchKey: {Bucket}/{Key}")
+            stored = self.objects[(Bucket, Key)]
+        return {
+            "Body": io.BytesIO(stored["Body"]),
+            "ContentType": stored["ContentType"],
+        }
@@ -0,0 +1,48 @@
+"""
+In-process stand-in for the SNS publish API used by the client.
+"""
+
+import time
+import uuid
+import threading
+from typing import Dict, List
+
+
+class FakeSNS:
+    """
+    A fake boto3 SNS client recording published messages.
+
+    Every call waits for latency seconds to stand in for the network round
+    trip.
+    """
+
+    def __init__(self, latency: float = 0.0):
+        self.latency = latency
+        self.messages: List[Dict] = []
+        self.calls: List[str] = []
+        self.lock = threading.Lock()
+
+    def _call(self, name: str):
+        with self.lock:
+            self.calls.append(name)
+        if self.latency:
+            time.sleep(self.latency)
+
+    def publish(self, TopicArn: str, Message: str, MessageAttributes=None, **kwargs):
+        self._call("Publish")
+        message_id = str(uuid.uuid4())
+        with self.lock:
+            self.messages.append({"TopicArn": TopicArn, "Message": Message})
+        return {"MessageId": message_id}
+
+    def publish_batch(self, TopicArn: str, PublishBatchRequestEntries: List[Dict]):
+        self._call("PublishBatch")
+        successful = []
+        with self.lock:
+            for entry in PublishBatchRequestEntries:
+                message_id = str(uuid.uuid4())
+                self.messages.append(
+                    {"TopicArn": TopicArn, "Message": entry["Message"]}
+                )
+                successful.append({"Id": entry["Id"], "MessageId": message_id})
+        return {"Successful": successful, "Failed": []}
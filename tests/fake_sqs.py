@@ -0,0 +1,133 @@
+"""
+In-process stand-in for the SQS message API used by publishers and consumers.
+"""
+
+import time
+import uuid
+import threading
+from collections import deque
+from typing import Dict, List
+
+
+class FakeSQS:
+    """
+    A fake boto3 SQS client holding messages in memory.
+
+    Received messages are hidden until they are deleted or their visibility
+    timeout passes. Every call waits for latency seconds to stand in for the
+    network round trip.
+    """
+
+    def __init__(self, visibility_timeout: float = 30, latency: float = 0.0):
+        self.visibility_timeout = visibility_timeout
+        self.latency = latency
+        self.queues: Dict[str, deque] = {}
+        self.in_flight: Dict[str, Dict] = {}
+        self.calls: List[str] = []
+        self.lock = threading.Lock()
+
+    def _call(self, name: str):
+        with self.lock:
+            self.calls.append(name)
+        if self.latency:
+            time.sleep(self.latency)
+
+    def _queue(self, QueueUrl: str) -> deque:
+        return self.queues.setdefault(QueueUrl, deque())
+
+    def send_message(self, QueueUrl: str, MessageBody: str, MessageAttributes=None):
+        self._call("SendMessage")
+        message_id = str(uuid.uuid4())
+        with self.lock:
+            self._queue(QueueUrl).append(
+                {
+                    "MessageId": message_id,
+                    "Body": MessageBody,
+                    "MessageAttributes": MessageAttributes or {},
+                }
+            )
+        return {"MessageId": message_id}
+
+    def send_message_batch(self, QueueUrl: str, Entries: List[Dict]):
+        self._call("SendMessageBatch")
+        successful = []
+        with self.lock:
+            for entry in Entries:
+                message_id = str(uuid.uuid4())
+                self._queue(QueueUrl).append(
+                    {
+                        "MessageId": message_id,
+                        "Body": entry["MessageBody"],
+                        "MessageAttributes": entry.get("MessageAttributes", {}),
+                    }
+                )
+                successful.append({"Id": entry["Id"], "MessageId": message_id})
+        return {"Successful": successful, "Failed": []}
+
+    def receive_message(
+        self,
+        QueueUrl: str,
+        MaxNumberOfMessages: int = 1,
+        WaitTimeSeconds: int = 0,
+        MessageAttributeNames=None,
+        VisibilityTimeout=None,
+    ):
+        self._call("ReceiveMessage")
+        timeout = (
+            VisibilityTimeout
+            if VisibilityTimeout is not None
+            else self.visibility_timeout
+        )
+        now = time.monotonic()
+        messages = []
+        with self.lock:
+            queue = self._queue(QueueUrl)
+            for handle, flight in list(self.in_flight.items()):
+                if flight["queue_url"] == QueueUrl and flight["visible_at"] <= now:
+                    del self.in_flight[handle]
+                    queue.append(flight["message"])
+            while queue and len(messages) < MaxNumberOfMessages:
+                message = queue.popleft()
+                handle = str(uuid.uuid4())
+                self.in_flight[handle] = {
+                    "queue_url": QueueUrl,
+                    "message": message,
+                    "visible_at": now + timeout,
+                }
+                messages.append({**message, "ReceiptHandle": handle})
+        return {"Messages": messages} if messages else {}
+
+    def delete_message(self, QueueUrl: str, ReceiptHandle: str):
+        self._call("DeleteMessage")
+        with self.lock:
+            self.in_flight.pop(ReceiptHandle, None)
+        return {}
+
+    def delete_message_batch(self, QueueUrl: str, Entries: List[Dict]):
+        self._call("DeleteMessageBatch")
+        successful = []
+        failed = []
+        with self.lock:
+            for entry in Entries:
+                if self.in_flight.pop(entry["ReceiptHandle"], None) is None:
+                    failed.append(
+                        {
+                            "Id": entry["Id"],
+                            "Code": "ReceiptHandleIsInvalid",
+                            "Message": "The receipt handle is not valid",
+                            "SenderFault": True,
+                        }
+                    )
+                else:
+                    successful.append({"Id": entry["Id"]})
+        return {"Successful": successful, "Failed": failed}
+
+    def pending(self, QueueUrl: str) -> int:
+        """Number of messages not yet deleted from a queue."""
+        with self.lock:
+            in_flight = sum(
+                1
+                for flight in self.in_flight.values()
+                if flight["queue_url"] == QueueUrl
+            )
+            return len(self._queue(QueueUrl)) + in_flight
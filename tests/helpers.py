@@ -0,0 +1,33 @@
+"""
+Helpers shared by several test modules.
+"""
+
+from src.brokers import MemoryBackend
+
+
+class FailingBackend(MemoryBackend):
+    """Memory sink that can be switched to fail every publish."""
+
+    name = "memory"
+    failing = False
+
+    def publish(self, client, broker_reference, articles, per_article):
+        if self.failing:
+            raise ConnectionError("broker unavailable")
+        return super().publish(client, broker_reference, articles, per_article)
+
+
+def make_page(start, count, total):
+    """Build a search response page of results start to start + count."""
+    return {
+        "response": {
+            "pages": -(-total // 10),
+            "results": [
+                {
+                    "webUrl": f"https://www.theguardian.com/world/article-{i}",
+                    "webPublicationDate": f"2024-01-{31 - i % 30:02d}T00:00:00Z",
+                }
+                for i in range(start, min(start + count, total))
+            ],
+        }
+    }
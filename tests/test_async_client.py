@@ -0,0 +1,115 @@
+import asyncio
+
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from src.async_guardian_api_client import AsyncGuardianApiClient
+from src.brokers import BrokerRegistry, MemoryBackend
+from src.guardian_api_client import GuardianApiClient
+
+
+SQS_URL = "https://sqs.us-east-1.amazonaws.com/123456789012/queue-name"
+
+
+def make_client(fake_api):
+    """Create an async client pointed at the local fake API."""
+    client = AsyncGuardianApiClient(api_key="test-api-key")
+    client.API_URL = fake_api.url
+    return client
+
+
+def test_search_articles(fake_api):
+    """Test searching articles against the fake API server."""
+
+    async def run():
+        async with make_client(fake_api) as client:
+            return await client.search_articles("test term", "2023-01-01")
+
+    result = asyncio.run(run())
+
+    assert len(result["response"]["results"]) == 10
+    assert fake_api.requests[0]["q"] == '"test term"'
+    assert fake_api.requests[0]["api-key"] == "test-api-key"
+    assert fake_api.requests[0]["from-date"] == "2023-01-01"
+
+
+def test_iter_articles_walks_pages(fake_api):
+    """Test iter_articles requests every page from the fake API."""
+
+    async def run():
+        async with make_client(fake_api) as client:
+            return [a async for a in client.iter_articles("test term", page_size=10)]
+
+    articles = asyncio.run(run())
+
+    assert len(articles) == 25
+    assert [r.get("page", "1") for r in fake_api.requests] == ["1", "2", "3"]
+
+
+def test_process_articles_matches_sync_client(fake_api):
+    """Test both clients share the same article processing."""
+    api_response = fake_api.build_response({"page-size": "5"})
+
+    async_articles = AsyncGuardianApiClient().process_articles(api_response)
+    sync_articles = GuardianApiClient().process_articles(api_response)
+
+    assert async_articles == sync_articles
+
+
+def test_publish_articles_sqs(fake_api):
+    """Test publishing searched articles to SQS."""
+
+    async def run():
+        async with make_client(fake_api) as client:
+            with patch.object(client, "publish_to_sqs", new_callable=AsyncMock) as mock:
+                mock.return_value = {"MessageId": "test-message-id"}
+                result = await client.publish_articles("test term", SQS_URL)
+            return result, mock
+
+    result, mock_publish = asyncio.run(run())
+
+    mock_publish.assert_awaited_once()
+    assert len(mock_publish.call_args.args[1]) == 10
+    assert result["broker_type"] == "sqs"
+    assert result["message_id"] == "test-message-id"
+
+
+def test_publish_many_concurrent(fake_api):
+    """Test publish_many runs all terms through a single event loop."""
+
+    async def run():
+        async with make_client(fake_api) as client:
+            with patch.object(client, "publish_to_sqs", new_callable=AsyncMock) as mock:
+                mock.return_value = {"MessageId": "test-message-id"}
+                return await client.publish_many(
+                    [f"term {i}" for i in range(20)] + [""], SQS_URL
+                )
+
+    result = asyncio.run(run())
+
+    assert result["status"] == "success"
+    assert result["terms_count"] == 20
+    assert result["articles_count"] == 200
+    assert len(fake_api.requests) == 20
+
+
+def test_publish_articles_unknown_broker():
+    with pytest.raises(ValueError) as excinfo:
+        asyncio.run(AsyncGuardianApiClient().publish_articles("test", "not-a-broker"))
+
+    assert "Unknown broker type" in str(excinfo.value)
+
+
+def test_broker_type_uses_the_clients_registry():
+    """Test broker references resolve through the client's own registry."""
+
+    class LocalQueueBackend(MemoryBackend):
+        name = "sqs"
+        prefixes = ("local-queue://",)
+
+    registry = BrokerRegistry()
+    registry.register(LocalQueueBackend())
+    client = AsyncGuardianApiClient(api_key="test-api-key", broker_registry=registry)
+
+    assert client.determine_broker_type("local-queue://articles") == "sqs"
+    assert client.determine_broker_type(SQS_URL) == "unknown"
@@ -0,0 +1,196 @@
+import threading
+
+import pytest
+from unittest.mock import patch
+
+from src.backfill import plan_windows, split_window
+from src.checkpoints import InMemoryCheckpointStore, SQLiteCheckpointStore
+from src.guardian_api_client import GuardianApiClient
+
+
+# Articles published per day, keyed on YYYY-MM-DD.
+DAILY_COUNTS = {
+    "2024-01-01": 30,
+    "2024-01-02": 30,
+    "2024-01-03": 500,
+    "2024-01-04": 5,
+    "2024-01-10": 40,
+}
+
+
+def window_total(date_from, date_to):
+    return sum(
+        count for day, count in DAILY_COUNTS.items() if date_from <= day <= date_to
+    )
+
+
+class FakeSearchClient:
+    """Answers probe searches from DAILY_COUNTS and records publishes."""
+
+    def __init__(self, fail_windows=()):
+        self.probes = []
+        self.published = []
+        self.fail_windows = set(fail_windows)
+        self.lock = threading.Lock()
+
+    def search_articles(self, search_term, date_from, page_size, show_fields, date_to):
+        with self.lock:
+            self.probes.append((date_from, date_to))
+        return {"response": {"total": window_total(date_from, date_to)}}
+
+    def publish_articles(
+        self, search_term, broker_reference, date_from, date_to, **kwargs
+    ):
+        if (date_from, date_to) in self.fail_windows:
+            raise RuntimeError("broker unavailable")
+        with self.lock:
+            self.published.append((date_from, date_to, kwargs["max_results"]))
+        return {"status": "success", "articles_count": kwargs["max_results"]}
+
+
+def test_split_window():
+    """Test ranges are halved on day boundaries."""
+    assert split_window("2024-01-01", "2024-01-10") == [
+        ("2024-01-01", "2024-01-05"),
+        ("2024-01-06", "2024-01-10"),
+    ]
+    assert split_window("2024-01-01", "2024-01-02") == [
+        ("2024-01-01", "2024-01-01"),
+        ("2024-01-02", "2024-01-02"),
+    ]
+    assert split_window("2024-01-03", "2024-01-03") == [("2024-01-03", "2024-01-03")]
+
+
+def test_plan_windows_subdivides_busy_windows():
+    """Test windows over the threshold are split until they fit."""
+    client = FakeSearchClient()
+
+    windows = plan_windows(client, "ai", "2024-01-01", "2024-01-16", 100)
+
+    assert windows == [
+        ("2024-01-01", "2024-01-02", 60),
+        ("2024-01-03", "2024-01-03", 500),
+        ("2024-01-04", "2024-01-04", 5),
+        ("2024-01-05", "2024-01-08", 0),
+        ("2024-01-09", "2024-01-16", 40),
+    ]
+    assert sum(total for _, _, total in windows) == window_total(
+        "2024-01-01", "2024-01-16"
+    )
+
+
+def test_backfill_publishes_every_window_in_parallel():
+    """Test each non-empty window is published with its result count."""
+    client = GuardianApiClient(api_key="test-api-key")
+    fake = FakeSearchClient()
+
+    with patch.object(client, "search_articles", fake.search_articles), patch.object(
+        client, "publish_articles", fake.publish_articles
+    ):
+        result = client.backfill(
+            "ai", "memory://backfill", "2024-01-01", "2024-01-16", 100
+        )
+
+    assert sorted(fake.published) == [
+        ("2024-01-01", "2024-01-02", 60),
+        ("2024-01-03", "2024-01-03", 500),
+        ("2024-01-04", "2024-01-04", 5),
+        ("2024-01-09", "2024-01-16", 40),
+    ]
+    assert result["status"] == "success"
+    assert result["windows_count"] == 5
+    assert result["articles_count"] == 605
+    assert result["articles_per_second"] > 0
+
+
+@pytest.mark.parametrize("store_type", ["memory", "sqlite"])
+def test_backfill_resumes_outstanding_windows(store_type, tmp_path):
+    """Test an interrupted backfill only re-publishes unfinished windows."""
+    if store_type == "memory":
+        store = InMemoryCheckpointStore()
+    else:
+        store = SQLiteCheckpointStore(str(tmp_path / "checkpoints.db"))
+    client = GuardianApiClient(api_key="test-api-key", checkpoint_store=store)
+
+    first = FakeSearchClient(fail_windows=[("2024-01-03", "2024-01-03")])
+    with patch.object(client, "search_articles", first.search_articles), patch.object(
+        client, "publish_articles", first.publish_articles
+    ):
+        result = client.backfill(
+            "ai", "memory://backfill", "2024-01-01", "2024-01-16", 100
+        )
+    assert result["status"] == "partial"
+    assert result["errors"] == {"2024-01-03..2024-01-03": "broker unavailable"}
+
+    second = FakeSearchClient()
+    with patch.object(client, "search_articles", second.search_articles), patch.object(
+        client, "publish_articles", second.publish_articles
+    ):
+        result = client.backfill(
+            "ai", "memory://backfill", "2024-01-01", "2024-01-16", 100
+        )
+
+    assert second.probes == []
+    assert second.published == [("2024-01-03", "2024-01-03", 500)]
+    assert result["status"] == "success"
+    assert result["windows_resumed"] == 3
+    assert result["articles_count"] == 605
+
+
+def test_backfill_against_fake_api(fake_api):
+    """Test a backfill pages through every window end to end."""
+    client = GuardianApiClient(api_key="test-api-key")
+    client.API_URL = fake_api.url
+    sink = client.broker_registry.get("memory")
+    sink.clear()
+
+    # The fake API reports 25 results for any range, so every day is a window.
+    result = client.backfill(
+        "ai", "memory://backfill", "2024-01-01", "2024-01-04", max_window_results=10
+    )
+
+    assert result["windows_count"] == 4
+    assert result["articles_count"] == 100
+    assert sum(len(message) for message in sink.messages["backfill"]) == 100
+    published_windows = {
+        (r["from-date"], r["to-date"])
+        for r in fake_api.requests
+        if r["page-size"] != "1"
+    }
+    assert len(published_windows) == 4
+
+
+def test_backfill_validation():
+    """Test invalid backfill ranges are rejected."""
+    client = GuardianApiClient(api_key="test-api-key")
+
+    with pytest.raises(ValueError, match="required"):
+        client.backfill("ai", "memory://backfill", "2024-01-01", None)
+    with pytest.raises(ValueError, match="Invalid date_to format"):
+        client.backfill("ai", "memory://backfill", "2024-01-01", "01/02/2024")
+    with pytest.raises(ValueError, match="after"):
+        client.backfill("ai", "memory://backfill", "2024-02-01", "2024-01-01")
+    with pytest.raises(ValueError, match="Unknown broker type"):
+        client.backfill("ai", "nowhere", "2024-01-01", "2024-01-02")
+
+
+def test_backfill_checkpoints_are_per_broker_and_cleared():
+    """Test a finished backfill can be repeated, to the same or another broker."""
+    store = InMemoryCheckpointStore()
+    client = GuardianApiClient(api_key="test-api-key", checkpoint_store=store)
+
+    fake = FakeSearchClient()
+    with patch.object(client, "search_articles", fake.search_articles), patch.object(
+        client, "publish_articles", fake.publish_articles
+    ):
+        first = client.backfill("ai", "memory://one", "2024-01-01", "2024-01-16", 100)
+        other = client.backfill("ai", "memory://two", "2024-01-01", "2024-01-16", 100)
+        again = client.backfill("ai", "memory://one", "2024-01-01", "2024-01-16", 100)
+
+    for result in (first, other, again):
+        assert result["windows_resumed"] == 0
+        assert result["articles_count"] == 605
+    runs = [sorted(fake.published[start : start + 4]) for start in (0, 4, 8)]
+    assert len(fake.published) == 12
+    assert runs[0] == runs[1] == runs[2]
+    assert store.get("backfill:ai:memory://one:2024-01-01:2024-01-16:plan") is None
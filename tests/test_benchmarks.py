@@ -0,0 +1,187 @@
+import time
+
+import pytest
+import requests
+
+from benchmark import record, run_benchmark
+from fake_guardian_api import FakeGuardianApi
+from fake_sns import FakeSNS
+from fake_sqs import FakeSQS
+from src.guardian_api_client import GuardianApiClient
+
+
+REQUESTS = 50
+
+
+@pytest.fixture
+def client(fake_api):
+    """Create a client pointed at the local fake API."""
+    client = GuardianApiClient(api_key="test-api-key")
+    client.API_URL = fake_api.url
+    return client
+
+
+@pytest.mark.integration
+def test_session_reuses_connection(client, fake_api):
+    """Test repeated searches share a single keep-alive connection."""
+    for _ in range(10):
+        client.search_articles("test term")
+
+    assert len(fake_api.requests) == 10
+    assert fake_api.connections == 1
+
+
+@pytest.mark.benchmark
+def test_session_vs_per_request_connections(client, fake_api):
+    """Benchmark pooled session requests against one-off requests.get calls."""
+    start = time.perf_counter()
+    for _ in range(REQUESTS):
+        requests.get(fake_api.url, params={"q": "test"}).json()
+    unpooled = (time.perf_counter() - start) / REQUESTS
+    unpooled_connections = fake_api.connections
+
+    fake_api.connections = 0
+    start = time.perf_counter()
+    for _ in range(REQUESTS):
+        client.search_articles("test term")
+    pooled = (time.perf_counter() - start) / REQUESTS
+
+    print(
+        f"\nrequests.get: {unpooled * 1000:.3f} ms/request, "
+        f"{unpooled_connections} connections"
+        f"\nsession:      {pooled * 1000:.3f} ms/request, "
+        f"{fake_api.connections} connections"
+    )
+    assert unpooled_connections == REQUESTS
+    assert fake_api.connections == 1
+
+
+TOPIC_ARN = "arn:aws:sns:eu-west-2:123456789012:guardian_content"
+QUEUE_URL = "https://sqs.eu-west-2.amazonaws.com/123456789012/guardian_content"
+
+
+@pytest.fixture
+def start_api():
+    """Start fake APIs with custom settings, stopping them after the test."""
+    servers = []
+
+    def start(**kwargs):
+        server = FakeGuardianApi(**kwargs).start()
+        servers.append(server)
+        return server
+
+    yield start
+    for server in servers:
+        server.stop()
+
+
+def api_client(server, **kwargs):
+    client = GuardianApiClient(api_key="test-api-key", **kwargs)
+    client.API_URL = server.url
+    return client
+
+
+@pytest.mark.benchmark
+def test_benchmark_search(start_api):
+    """Benchmark full-page searches with large article bodies."""
+    server = start_api(total=1000, body_size=5000, latency=0.001)
+    client = api_client(server)
+
+    def search():
+        api_response = client.search_articles("ai", page_size=200)
+        return len(api_response["response"]["results"])
+
+    result = run_benchmark(
+        "search", search, 10, count_requests=lambda: len(server.requests)
+    )
+    record(result)
+    assert result["requests_per_second"] > 0
+    assert result["articles_per_second"] == pytest.approx(
+        result["requests_per_second"] * 200, rel=0.01
+    )
+
+
+@pytest.mark.benchmark
+def test_benchmark_process(start_api):
+    """Benchmark extracting articles from a page of results."""
+    api_response = FakeGuardianApi(total=200, body_size=5000).build_response(
+        {"page-size": "200"}
+    )
+    client = GuardianApiClient(api_key="test-api-key")
+
+    result = run_benchmark(
+        "process", lambda: len(client.process_articles(api_response)), 50
+    )
+    record(result)
+    assert result["articles_per_second"] > 0
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("stream_responses", [False, True])
+def test_benchmark_paging(start_api, stream_responses):
+    """Benchmark paging through results, buffered and streamed."""
+    server = start_api(total=1000, body_size=5000)
+    client = api_client(server, stream_responses=stream_responses)
+
+    result = run_benchmark(
+        f"paging stream_responses={stream_responses}",
+        lambda: sum(1 for _ in client.iter_articles("ai", max_results=1000)),
+        3,
+        count_requests=lambda: len(server.requests),
+    )
+    record(result)
+    assert result["articles_per_second"] > 0
+    # Only a streamed page's current result is held in memory.
+    if stream_responses:
+        assert result["peak_memory_kib"] < 1000 * 5000 / 1024
+
+
+@pytest.mark.benchmark
+def test_benchmark_throttled_search(start_api):
+    """Benchmark paging through an API answering every fourth request with 429."""
+    server = start_api(total=1000, latency=0.001, throttle_every=4)
+    client = api_client(server)
+
+    result = run_benchmark(
+        "throttled paging",
+        lambda: sum(
+            1 for _ in client.iter_articles("ai", max_results=1000, page_size=50)
+        ),
+        3,
+        count_requests=lambda: len(server.requests),
+    )
+    record(result)
+    assert client.metrics.snapshot()["counts"]["http_retries"] > 0
+    assert result["articles_per_second"] > 0
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize(
+    "broker_reference, per_article",
+    [(TOPIC_ARN, False), (TOPIC_ARN, True), (QUEUE_URL, False), (QUEUE_URL, True)],
+)
+def test_benchmark_publish(start_api, broker_reference, per_article):
+    """Benchmark searching for and publishing articles to SNS and SQS."""
+    server = start_api(total=500, body_size=1000)
+    client = api_client(server)
+    client.sns_client = FakeSNS(latency=0.0005)
+    client.sqs_client = FakeSQS(latency=0.0005)
+
+    def publish():
+        return client.publish_articles(
+            "ai",
+            broker_reference,
+            max_results=500,
+            batch_size=10,
+            per_article=per_article,
+        )["articles_count"]
+
+    broker = client.sns_client if broker_reference == TOPIC_ARN else client.sqs_client
+    result = run_benchmark(
+        f"publish {client.determine_broker_type(broker_reference)} per_article={per_article}",
+        publish,
+        3,
+        count_requests=lambda: len(server.requests) + len(broker.calls),
+    )
+    record(result)
+    assert result["articles_per_second"] > 0
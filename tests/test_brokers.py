@@ -0,0 +1,207 @@
+import json
+
+import pytest
+from unittest.mock import MagicMock, patch
+
+from src.brokers import (
+    BrokerBackend,
+    BrokerRegistry,
+    MemoryBackend,
+    SnsBackend,
+    default_registry,
+)
+from src.guardian_api_client import GuardianApiClient
+
+
+ARTICLES = [
+    {"webTitle": "Article 1", "webUrl": "https://www.theguardian.com/article-1"},
+    {"webTitle": "Article 2", "webUrl": "https://www.theguardian.com/article-2"},
+]
+
+
+@pytest.fixture
+def client():
+    """Create a test client instance."""
+    return GuardianApiClient(api_key="test-api-key")
+
+
+@pytest.mark.parametrize(
+    "reference, name",
+    [
+        ("arn:aws:sns:us-east-1:123456789012:topic", "sns"),
+        ("https://sqs.us-east-1.amazonaws.com/123456789012/queue", "sqs"),
+        ("arn:aws:kinesis:us-east-1:123456789012:stream/articles", "kinesis"),
+        ("kinesis://articles", "kinesis"),
+        ("arn:aws:firehose:us-east-1:123456789012:deliverystream/articles", "firehose"),
+        ("firehose://articles", "firehose"),
+        ("file:///tmp/articles.jsonl", "file"),
+        ("memory://articles", "memory"),
+    ],
+)
+def test_default_registry_resolves_references(reference, name):
+    """Test every built-in reference format resolves to its backend."""
+    assert default_registry.resolve(reference).name == name
+
+
+def test_registry_custom_backend(client):
+    """Test custom backends can be registered and routed to."""
+
+    class RecordingBackend(BrokerBackend):
+        name = "recording"
+        prefixes = ("recording://",)
+
+        def publish(self, client, broker_reference, articles, per_article):
+            return {
+                "sent": len(articles),
+                "failed": 0,
+                "requests": 1,
+                "message_ids": ["recorded"],
+                "errors": [],
+            }
+
+    registry = BrokerRegistry()
+    registry.register(RecordingBackend())
+    client.broker_registry = registry
+
+    with patch.object(client, "search_articles") as mock_search:
+        mock_search.return_value = {"response": {"results": ARTICLES}}
+        result = client.publish_articles("test term", "recording://anywhere")
+
+    assert result["broker_type"] == "recording"
+    assert result["message_id"] == "recorded"
+    assert registry.names() == ["recording"]
+
+
+def test_memory_backend_collects_messages(client):
+    """Test the in-memory sink stores one message per publish or article."""
+    backend = MemoryBackend()
+
+    backend.publish(client, "memory://test", ARTICLES, per_article=False)
+    backend.publish(client, "memory://test", ARTICLES, per_article=True)
+
+    assert backend.messages["test"] == [ARTICLES, ARTICLES[0], ARTICLES[1]]
+
+
+def test_file_backend_writes_jsonl(client, tmp_path):
+    """Test the file sink appends JSON Lines."""
+    path = tmp_path / "out" / "articles.jsonl"
+
+    with patch.object(client, "search_articles") as mock_search:
+        mock_search.return_value = {"response": {"results": ARTICLES}}
+        result = client.publish_articles(
+            "test term", f"file://{path}", per_article=True
+        )
+
+    lines = path.read_text().splitlines()
+    assert [json.loads(line)["webTitle"] for line in lines] == [
+        "Article 1",
+        "Article 2",
+    ]
+    assert result["broker_type"] == "file"
+    assert result["sent_count"] == 2
+
+
+def test_publish_to_kinesis(client):
+    """Test Kinesis records are sent with PutRecords and failures reported."""
+    client.kinesis_client = MagicMock()
+    client.kinesis_client.put_records.return_value = {
+        "FailedRecordCount": 1,
+        "Records": [
+            {"SequenceNumber": "1", "ShardId": "shardId-0"},
+            {"ErrorCode": "ProvisionedThroughputExceededException"},
+        ],
+    }
+
+    result = client.publish_to_kinesis("articles", ARTICLES, max_attempts=1)
+
+    call = client.kinesis_client.put_records.call_args.kwargs
+    assert call["StreamName"] == "articles"
+    assert call["Records"][0]["PartitionKey"] == "article-1"
+    assert result["sent"] == 1
+    assert result["failed"] == 1
+    assert result["errors"][0]["Id"] == "1"
+    assert result["shards"]["shardId-0"]["records"] == 1
+
+
+def test_publish_to_firehose(client):
+    """Test Firehose records are newline-delimited JSON."""
+    client.firehose_client = MagicMock()
+    client.firehose_client.put_record_batch.return_value = {
+        "FailedPutCount": 0,
+        "RequestResponses": [{"RecordId": "a"}, {"RecordId": "b"}],
+    }
+
+    with patch.object(client, "search_articles") as mock_search:
+        mock_search.return_value = {"response": {"results": ARTICLES}}
+        result = client.publish_articles(
+            "test term",
+            "arn:aws:firehose:us-east-1:123456789012:deliverystream/articles",
+            max_results=10,
+        )
+
+    call = client.firehose_client.put_record_batch.call_args.kwargs
+    assert call["DeliveryStreamName"] == "articles"
+    assert call["Records"][0]["Data"].endswith(b"\n")
+    assert result["broker_type"] == "firehose"
+    assert result["message_ids"] == ["a", "b"]
+
+
+def test_publish_to_firehose_respects_request_limits(client):
+    """Test Firehose batches stay under 4 MiB and oversized records are rejected."""
+    client.firehose_client = MagicMock()
+    client.firehose_client.put_record_batch.side_effect = lambda **kwargs: {
+        "RequestResponses": [{"RecordId": "id"} for _ in kwargs["Records"]]
+    }
+    articles = [
+        {"webTitle": f"Article {i}", "bodyText": "x" * 900000} for i in range(6)
+    ]
+    articles.insert(2, {"webTitle": "Huge", "bodyText": "x" * 1100000})
+
+    result = client.publish_to_firehose("articles", articles)
+
+    calls = client.firehose_client.put_record_batch.call_args_list
+    assert all(
+        sum(len(record["Data"]) for record in call.kwargs["Records"]) <= 4194304
+        for call in calls
+    )
+    assert result["requests"] == 2
+    assert result["sent"] == 6
+    assert result["failed"] == 1
+    assert result["errors"][0]["Id"] == "2"
+    assert result["errors"][0]["Code"] == "RecordTooLarge"
+
+
+def test_sns_backend_fifo_groups(client):
+    """Test FIFO group and deduplication IDs configured on the SNS backend."""
+    topic = "arn:aws:sns:us-east-1:123456789012:articles.fifo"
+    articles = [
+        {**ARTICLES[0], "id": "world/1", "sectionId": "world"},
+        {**ARTICLES[1], "id": "sport/1", "sectionId": "sport"},
+    ]
+    registry = BrokerRegistry()
+    registry.register(
+        SnsBackend(group_by="section", deduplication_id=lambda article: article["id"])
+    )
+    client.broker_registry = registry
+    client.sns_client = MagicMock()
+    client.sns_client.publish_batch.return_value = {
+        "Successful": [{"Id": "0", "MessageId": "a"}, {"Id": "1", "MessageId": "b"}],
+        "Failed": [],
+    }
+    client.sns_client.publish.return_value = {"MessageId": "c"}
+
+    with patch.object(client, "search_articles"), patch.object(
+        client, "process_articles", return_value=articles
+    ):
+        client.publish_articles("ai", topic, per_article=True)
+        registry.register(SnsBackend(message_group_id="world"))
+        client.publish_articles("ai", topic)
+
+    entries = client.sns_client.publish_batch.call_args.kwargs[
+        "PublishBatchRequestEntries"
+    ]
+    assert [e["MessageGroupId"] for e in entries] == ["world", "sport"]
+    assert [e["MessageDeduplicationId"] for e in entries] == ["world/1", "sport/1"]
+    assert client.sns_client.publish.call_args.kwargs["MessageGroupId"] == "world"
+    with pytest.raises(ValueError, match="group_by"):
+        SnsBackend(group_by="tag")
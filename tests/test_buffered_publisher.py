@@ -0,0 +1,208 @@
+import time
+
+import pytest
+from unittest.mock import patch
+
+from helpers import FailingBackend
+from src.brokers import BrokerRegistry
+from src.buffered_publisher import BufferedPublisher, _Buffer
+from src.checkpoints import InMemoryCheckpointStore
+from src.dedup import ContentDeduplicator
+from src.guardian_api_client import GuardianApiClient
+from src.seen_articles import InMemorySeenArticleStore
+from src.watermarks import InMemoryWatermarkStore
+
+
+def make_articles(count, start=0):
+    return [
+        {
+            "webTitle": f"Article {i}",
+            "webUrl": f"https://www.theguardian.com/world/article-{i}",
+            "webPublicationDate": "2024-01-01T00:00:00Z",
+        }
+        for i in range(start, start + count)
+    ]
+
+
+@pytest.fixture
+def client():
+    """Create a client publishing to its own in-memory broker."""
+    registry = BrokerRegistry()
+    registry.register(FailingBackend())
+    return GuardianApiClient(api_key="test-api-key", broker_registry=registry)
+
+
+def messages(client, name="buffer"):
+    return client.broker_registry.get("memory").messages[name]
+
+
+def test_publish_articles_coalesces_searches(client):
+    """Test small results from many searches share one broker message."""
+    client.publish_buffer = BufferedPublisher(client, max_age=60)
+
+    with patch.object(client, "search_articles"), patch.object(
+        client,
+        "process_articles",
+        side_effect=[make_articles(2, start=i * 2) for i in range(10)],
+    ):
+        results = [client.publish_articles("ai", "memory://buffer") for _ in range(10)]
+
+    assert results[0]["buffered_count"] == 2
+    assert messages(client) == []
+
+    assert client.publish_buffer.flush() == {"batches": 1, "articles": 20, "failed": 0}
+    assert len(messages(client)) == 1
+    assert len(messages(client)[0]) == 20
+    assert client.publish_buffer.stats()["articles_per_request"] == 20.0
+
+
+def test_full_buffers_are_flushed_by_count_and_bytes(client):
+    """Test buffers are published as soon as they hold enough articles or bytes."""
+    publisher = BufferedPublisher(client, max_articles=5, max_age=60)
+
+    publisher.add("memory://buffer", make_articles(12))
+
+    assert [len(message) for message in messages(client)] == [5, 5]
+    assert publisher.stats()["buffered"] == 2
+
+    article_size = len(str(make_articles(1)[0]))
+    small = BufferedPublisher(client, max_bytes=article_size * 3, max_age=60)
+    small.add("memory://small", make_articles(7))
+
+    assert all(len(message) <= 3 for message in messages(client, "small"))
+    assert small.stats()["buffered"] < 3
+
+
+def test_old_buffers_are_flushed_in_the_background(client):
+    """Test the background thread publishes articles older than max_age."""
+    publisher = BufferedPublisher(client, max_age=0.05)
+
+    publisher.add("memory://buffer", make_articles(3))
+    publisher.add("memory://other", make_articles(1))
+    waited = 0.0
+    while publisher.stats()["buffered"] and waited < 2:
+        time.sleep(0.01)
+        waited += 0.01
+
+    # Waits for a background publish still in progress; nothing is left.
+    assert publisher.flush()["batches"] == 0
+    assert [len(message) for message in messages(client)] == [3]
+    assert [len(message) for message in messages(client, "other")] == [1]
+
+
+def test_close_flushes_and_rejects_more_articles(client):
+    """Test closing publishes what is left and refuses further articles."""
+    with BufferedPublisher(client, max_age=60) as publisher:
+        publisher.add("memory://buffer", make_articles(3))
+        publisher.add("memory://buffer", make_articles(2, start=3), per_article=True)
+
+    # One message of three articles, then one message per article.
+    assert messages(client) == [make_articles(3)] + make_articles(2, start=3)
+    with pytest.raises(RuntimeError, match="closed"):
+        publisher.add("memory://buffer", make_articles(1))
+
+
+def test_failed_flushes_are_counted(client):
+    """Test a broker failure during a flush is reported, not raised."""
+    publisher = BufferedPublisher(client, max_age=60)
+    publisher.add("memory://buffer", make_articles(4))
+    client.broker_registry.get("memory").failing = True
+
+    assert publisher.flush()["failed"] == 4
+    assert publisher.stats()["failed"] == 4
+
+
+def test_failed_flush_leaves_articles_unseen(client):
+    """Test articles are only marked seen once the buffer has published them."""
+    client.seen_store = InMemorySeenArticleStore()
+    client.deduplicator = ContentDeduplicator()
+    client.publish_buffer = BufferedPublisher(client, max_age=60)
+    backend = client.broker_registry.get("memory")
+
+    with patch.object(client, "search_articles"), patch.object(
+        client, "process_articles", return_value=make_articles(3)
+    ):
+        first = client.publish_articles("ai", "memory://buffer")
+        assert client.seen_store.stats()["size"] == 0
+
+        backend.failing = True
+        assert client.publish_buffer.flush()["failed"] == 3
+        backend.failing = False
+        second = client.publish_articles("ai", "memory://buffer")
+        client.publish_buffer.flush()
+        third = client.publish_articles("ai", "memory://buffer")
+
+    assert first["buffered_count"] == second["buffered_count"] == 3
+    assert third["articles_count"] == 0
+    assert third["seen_articles"]["skipped"] == 3
+    assert messages(client) == [make_articles(3)]
+
+
+def test_remaining_articles_keep_their_age(client):
+    """Test articles left after a batch is taken keep their arrival time."""
+    clock = {"now": 0.0}
+    publisher = BufferedPublisher(client, max_articles=3, max_age=10)
+    buffer = publisher._buffers.setdefault(("memory://buffer", False), _Buffer())
+
+    with patch(
+        "src.buffered_publisher.time.monotonic", side_effect=lambda: clock["now"]
+    ):
+        publisher.add("memory://buffer", make_articles(2))
+        clock["now"] = 8.0
+        publisher.add("memory://buffer", make_articles(1, start=2))
+        assert buffer.started is None
+
+        buffer.articles.extend(make_articles(4, start=3))
+        buffer.sizes.extend([10] * 4)
+        buffer.arrived.extend([2.0, 2.0, 2.0, 5.0])
+        buffer.callbacks.extend([(None, 0)] * 4)
+        buffer.bytes += 40
+
+        assert len(publisher._take(buffer)[0]) == 3
+        assert buffer.started == 5.0
+    publisher.close()
+
+
+def test_checkpointed_runs_publish_directly(client):
+    """Test paged runs with a checkpoint store bypass the buffer."""
+    client.checkpoint_store = InMemoryCheckpointStore()
+    client.publish_buffer = BufferedPublisher(client, max_age=60)
+
+    def search(term, date_from, page_size, page, date_to, use_date):
+        return {"response": {"pages": 1, "results": []}}
+
+    with patch.object(client, "search_articles", side_effect=search), patch.object(
+        client, "process_articles", return_value=make_articles(5)
+    ):
+        result = client.publish_articles(
+            "ai", "memory://buffer", max_results=5, batch_size=5
+        )
+
+    assert "buffered_count" not in result
+    assert len(messages(client)) == 1
+
+
+def test_validation(client):
+    """Test invalid limits are rejected."""
+    with pytest.raises(ValueError, match="at least 1"):
+        BufferedPublisher(client, max_articles=0)
+    with pytest.raises(ValueError, match="max_age"):
+        BufferedPublisher(client, max_age=0)
+
+
+def test_incremental_runs_publish_directly(client):
+    """Test incremental runs bypass the buffer so their watermark advances."""
+    client.watermark_store = InMemoryWatermarkStore()
+    client.publish_buffer = BufferedPublisher(client, max_age=60)
+
+    def search(term, date_from, page_size, page, date_to, use_date):
+        return {"response": {"pages": 1, "results": []}}
+
+    with patch.object(client, "search_articles", side_effect=search), patch.object(
+        client, "process_articles", return_value=make_articles(3)
+    ):
+        result = client.publish_articles("ai", "memory://buffer", incremental=True)
+
+    assert "buffered_count" not in result
+    assert result["watermark"] == "2024-01-01T00:00:00Z"
+    assert len(messages(client)) == 1
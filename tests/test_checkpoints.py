@@ -0,0 +1,141 @@
+import pytest
+from unittest.mock import patch
+
+from fake_dynamodb import FakeDynamoDB
+from helpers import make_page
+from src.brokers import BrokerRegistry, MemoryBackend
+from src.checkpoints import (
+    DynamoDBCheckpointStore,
+    InMemoryCheckpointStore,
+    SQLiteCheckpointStore,
+)
+from src.guardian_api_client import GuardianApiClient
+
+
+@pytest.fixture(params=["memory", "sqlite", "dynamodb"])
+def store(request, tmp_path):
+    """Create each kind of checkpoint store."""
+    if request.param == "memory":
+        yield InMemoryCheckpointStore()
+    elif request.param == "sqlite":
+        store = SQLiteCheckpointStore(str(tmp_path / "checkpoints.db"))
+        yield store
+        store.close()
+    else:
+        yield DynamoDBCheckpointStore("checkpoints", client=FakeDynamoDB())
+
+
+class FailingBackend(MemoryBackend):
+    """Memory sink that fails after publishing a number of batches."""
+
+    name = "memory"
+
+    def __init__(self, fail_after=None):
+        super().__init__()
+        self.fail_after = fail_after
+
+    def publish(self, client, broker_reference, articles, per_article):
+        if (
+            self.fail_after is not None
+            and len(self.messages["sink"]) >= self.fail_after
+        ):
+            raise TimeoutError("Lambda timed out")
+        return super().publish(client, broker_reference, articles, per_article)
+
+
+def test_store_round_trip(store):
+    """Test checkpoints are saved, replaced and deleted."""
+    assert store.get("job") is None
+
+    store.put("job", {"position": 10, "published_ids": ["a"]})
+    store.put("job", {"position": 20, "published_ids": ["a", "b"]})
+    assert store.get("job") == {"position": 20, "published_ids": ["a", "b"]}
+
+    store.delete("job")
+    assert store.get("job") is None
+
+
+def test_dynamodb_store_ignores_expired_checkpoints():
+    """Test checkpoints past their TTL are treated as missing."""
+    store = DynamoDBCheckpointStore("checkpoints", client=FakeDynamoDB(), ttl=-1)
+
+    store.put("job", {"position": 10})
+
+    assert store.get("job") is None
+
+
+def test_iter_articles_resumes_from_start():
+    """Test iteration can start part way through the results."""
+    client = GuardianApiClient(api_key="test-api-key")
+
+    def search(term, date_from, page_size, page, date_to, use_date):
+        return make_page((page - 1) * page_size, page_size, 25)
+
+    with patch.object(client, "search_articles", side_effect=search) as mock_search:
+        articles = list(client.iter_articles("ai", page_size=10, start=13))
+
+    assert [a["webUrl"][-2:] for a in articles[:2]] == ["13", "14"]
+    assert len(articles) == 12
+    assert [c.kwargs["page"] for c in mock_search.call_args_list] == [2, 3]
+
+
+def run(client, total=25):
+    def search(term, date_from, page_size, page, date_to, use_date):
+        return make_page((page - 1) * page_size, page_size, total)
+
+    with patch.object(client, "search_articles", side_effect=search):
+        return client.publish_articles(
+            "ai", "memory://sink", max_results=total, batch_size=5
+        )
+
+
+def test_publish_articles_resumes_after_last_committed_batch(store):
+    """Test an interrupted run publishes each remaining article exactly once."""
+    registry = BrokerRegistry()
+    backend = registry.register(FailingBackend(fail_after=2))
+    client = GuardianApiClient(
+        api_key="test-api-key", checkpoint_store=store, broker_registry=registry
+    )
+
+    with pytest.raises(TimeoutError):
+        run(client)
+
+    backend.fail_after = None
+    result = run(client)
+
+    urls = [a["webUrl"] for message in backend.messages["sink"] for a in message]
+    assert len(urls) == 25
+    assert len(set(urls)) == 25
+    assert result["resumed_from"] == 10
+    assert result["articles_count"] == 15
+
+    # A finished run leaves no checkpoint behind.
+    assert len(run(client)["message_ids"]) == 5
+
+
+def test_publish_articles_resume_skips_shifted_results(store):
+    """Test results pushed down by new articles are not published twice."""
+    registry = BrokerRegistry()
+    backend = registry.register(FailingBackend(fail_after=1))
+    client = GuardianApiClient(
+        api_key="test-api-key", checkpoint_store=store, broker_registry=registry
+    )
+    with pytest.raises(TimeoutError):
+        run(client)
+
+    # Three new articles are published ahead of the first five.
+    def search(term, date_from, page_size, page, date_to, use_date):
+        page_results = make_page((page - 1) * page_size - 3, page_size, 25)
+        for article in page_results["response"]["results"]:
+            article["webUrl"] = article["webUrl"].replace("article--", "new-")
+        return page_results
+
+    backend.fail_after = None
+    with patch.object(client, "search_articles", side_effect=search):
+        client.publish_articles("ai", "memory://sink", max_results=25, batch_size=5)
+
+    urls = [a["webUrl"] for message in backend.messages["sink"] for a in message]
+    assert len(urls) == len(set(urls))
+    assert {f"https://www.theguardian.com/world/article-{i}" for i in range(22)} <= set(
+        urls
+    )
@@ -0,0 +1,112 @@
+import json
+
+import pytest
+from unittest.mock import MagicMock, patch
+
+from fake_s3 import FakeS3
+from src.claim_check import ClaimCheck, resolve_claim_checks
+from src.guardian_api_client import GuardianApiClient
+from src.projection import DEFAULT_PROJECTION
+
+
+def make_articles(body_sizes):
+    return [
+        {
+            "webTitle": f"Article {i}",
+            "webUrl": f"https://www.theguardian.com/world/article-{i}",
+            "contentPreview": "x" * min(size, 1000),
+            "bodyText": "x" * size,
+        }
+        for i, size in enumerate(body_sizes)
+    ]
+
+
+def test_claim_check_validation():
+    """Test invalid claim-check settings are rejected."""
+    with pytest.raises(ValueError, match="bucket is required"):
+        ClaimCheck("")
+    with pytest.raises(ValueError, match="mode"):
+        ClaimCheck("bodies", mode="object")
+
+
+def test_projection_includes_body():
+    """Test the full body is only kept when asked for."""
+    article = {"webUrl": "u", "fields": {"bodyText": "y" * 2000}}
+    with_body = DEFAULT_PROJECTION.replace(include_body=True)
+
+    assert "bodyText" not in DEFAULT_PROJECTION.extract(article)
+    assert with_body.extract(article)["bodyText"] == "y" * 2000
+
+
+def test_offload_per_article():
+    """Test large bodies are written one object per article."""
+    s3 = FakeS3()
+    articles = make_articles([100, 50000, 60000])
+
+    messages = ClaimCheck("bodies", threshold=1000).offload(s3, articles)
+
+    assert messages[0] == articles[0]
+    assert len(s3.objects) == 2
+    for message in messages[1:]:
+        assert "bodyText" not in message
+        assert message["claimCheck"]["bucket"] == "bodies"
+        assert message["claimCheck"]["key"].startswith("articles/")
+        assert message["contentPreview"]
+    assert len(json.dumps(messages)) < 5000
+    assert resolve_claim_checks(messages, s3) == articles
+
+
+def test_offload_per_batch():
+    """Test large bodies share one NDJSON object per batch."""
+    s3 = FakeS3()
+    articles = make_articles([50000, 100, 60000, 70000])
+
+    messages = ClaimCheck("bodies", threshold=1000, mode="batch").offload(s3, articles)
+
+    assert len(s3.objects) == 1
+    (stored,) = s3.objects.values()
+    assert stored["ContentType"] == "application/x-ndjson"
+    assert len(stored["Body"].splitlines()) == 3
+    assert [m.get("claimCheck", {}).get("line") for m in messages] == [0, None, 1, 2]
+
+    assert resolve_claim_checks(messages, s3) == articles
+    assert len(s3.gets) == 1
+
+
+def test_publish_articles_with_claim_check():
+    """Test publish_articles publishes pointers instead of large bodies."""
+    client = GuardianApiClient(
+        api_key="test-api-key", claim_check=ClaimCheck("bodies", threshold=1000)
+    )
+    client.s3_client = FakeS3()
+    client.sqs_client = MagicMock()
+    client.sqs_client.send_message.return_value = {"MessageId": "test-message-id"}
+    api_response = {
+        "response": {
+            "results": [
+                {
+                    "webUrl": "https://www.theguardian.com/a",
+                    "fields": {"bodyText": "a" * 300000},
+                },
+                {
+                    "webUrl": "https://www.theguardian.com/b",
+                    "fields": {"bodyText": "b" * 500},
+                },
+            ]
+        }
+    }
+
+    with patch.object(client, "search_articles", return_value=api_response):
+        result = client.publish_articles(
+            "test term", "https://sqs.us-east-1.amazonaws.com/123456789012/queue"
+        )
+
+    assert result["status"] == "success"
+    body = client.sqs_client.send_message.call_args.kwargs["MessageBody"]
+    assert len(body) < 5000
+    published = json.loads(body)
+    assert "claimCheck" in published[0]
+    assert published[1]["bodyText"] == "b" * 500
+
+    resolved = resolve_claim_checks(published, client.s3_client)
+    assert resolved[0]["bodyText"] == "a" * 300000
@@ -1,7 +1,14 @@
+import threading
+import time
+
 import pytest
+import requests
 from unittest.mock import patch, MagicMock
 
 from src.guardian_api_client import GuardianApiClient
+from src.rate_limiter import RateLimiter
+from src.seen_articles import InMemorySeenArticleStore
+from src.watermarks import InMemoryWatermarkStore
 
 
 @pytest.fixture
@@ -42,15 +49,15 @@ def sample_response():
     }
 
 
-@patch("src.guardian_api_client.requests.get")
-def test_search_articles(mock_get, client, sample_response):
+def test_search_articles(client, sample_response):
     """Test searching articles from the Guardian API."""
     mock_response = MagicMock()
     mock_response.json.return_value = sample_response
     mock_response.raise_for_status.return_value = None
-    mock_get.return_value = mock_response
 
-    result = client.search_articles("test term", "2023-01-01")
+    with patch.object(client.session, "get") as mock_get:
+        mock_get.return_value = mock_response
+        result = client.search_articles("test term", "2023-01-01")
 
     mock_get.assert_called_once()
     assert result == sample_response
@@ -180,3 +187,496 @@ def test_publish_articles_unknown_broker(client):
             client.publish_articles("test", "not-a-valid-broker")
 
         assert "Unknown broker type" in str(excinfo.value)
+
+
+def make_page(page, pages, count):
+    """Build a single page of a paged API response."""
+    return {
+        "response": {
+            "status": "ok",
+            "currentPage": page,
+            "pages": pages,
+            "results": [
+                {
+                    "id": f"technology/article-{page}-{i}",
+                    "webPublicationDate": "2023-11-21T12:00:00Z",
+                    "webTitle": f"Article {page}-{i}",
+                    "webUrl": f"https://www.theguardian.com/article-{page}-{i}",
+                    "fields": {"bodyText": "Body"},
+                }
+                for i in range(count)
+            ],
+        }
+    }
+
+
+def test_search_articles_paging_params(client, sample_response):
+    """Test page and date_to are passed through to the API."""
+    with patch.object(client.session, "get") as mock_get:
+        mock_get.return_value.json.return_value = sample_response
+        client.search_articles("test term", page=3, date_to="2023-12-31")
+
+    call_args = mock_get.call_args[1]["params"]
+    assert call_args["page"] == 3
+    assert call_args["to-date"] == "2023-12-31"
+
+
+def test_iter_articles_walks_pages(client):
+    """Test iter_articles requests pages lazily until the last page."""
+    pages = {1: make_page(1, 3, 2), 2: make_page(2, 3, 2), 3: make_page(3, 3, 1)}
+
+    with patch.object(client, "search_articles") as mock_search:
+        mock_search.side_effect = lambda *args, **kwargs: pages[kwargs["page"]]
+
+        iterator = client.iter_articles("test term")
+        first = next(iterator)
+        assert first["webTitle"] == "Article 1-0"
+        assert mock_search.call_count == 1
+
+        rest = list(iterator)
+
+    assert len(rest) == 4
+    assert rest[-1]["webTitle"] == "Article 3-0"
+    assert mock_search.call_count == 3
+
+
+def test_iter_articles_max_results(client):
+    """Test iter_articles stops requesting pages once max_results is reached."""
+    with patch.object(client, "search_articles") as mock_search:
+        mock_search.side_effect = lambda *args, **kwargs: make_page(
+            kwargs["page"], 100, kwargs["page_size"]
+        )
+
+        articles = list(client.iter_articles("test term", max_results=5, page_size=2))
+
+    assert len(articles) == 5
+    assert mock_search.call_count == 3
+
+
+@patch("src.guardian_api_client.GuardianApiClient.publish_to_sqs")
+def test_publish_articles_streams_batches(mock_publish_sqs, client):
+    """Test publish_articles streams paged results in batches."""
+    mock_publish_sqs.return_value = {"MessageId": "test-message-id"}
+    articles = make_page(1, 1, 25)["response"]["results"]
+
+    with patch.object(client, "iter_articles") as mock_iter:
+        mock_iter.return_value = iter(articles)
+
+        result = client.publish_articles(
+            "test term",
+            "https://sqs.us-east-1.amazonaws.com/123456789012/queue-name",
+            max_results=100,
+            batch_size=10,
+        )
+
+    assert mock_publish_sqs.call_count == 3
+    assert [len(c.args[1]) for c in mock_publish_sqs.call_args_list] == [10, 10, 5]
+    assert result["articles_count"] == 25
+    assert result["message_ids"] == ["test-message-id"] * 3
+
+
+def test_publish_many_aggregates_results(client):
+    """Test publish_many collects per-term results and errors."""
+
+    def fake_publish(term, broker_reference, date_from):
+        if term == "bad term":
+            raise ValueError("boom")
+        return {"status": "success", "broker_type": "sqs", "articles_count": 2}
+
+    with patch.object(client, "publish_articles", side_effect=fake_publish):
+        result = client.publish_many(
+            ["ai", "bad term", "ml", "ai"],
+            "https://sqs.us-east-1.amazonaws.com/123456789012/queue-name",
+        )
+
+    assert result["status"] == "partial"
+    assert result["terms_count"] == 3
+    assert result["articles_count"] == 4
+    assert set(result["results"]) == {"ai", "ml"}
+    assert result["errors"] == {"bad term": "boom"}
+
+
+def test_publish_many_runs_concurrently(client):
+    """Test publish_many overlaps searches instead of running them serially."""
+
+    def slow_publish(term, broker_reference, date_from):
+        time.sleep(0.1)
+        return {"status": "success", "broker_type": "sns", "articles_count": 1}
+
+    terms = [f"term {i}" for i in range(20)]
+    with patch.object(client, "publish_articles", side_effect=slow_publish):
+        start = time.perf_counter()
+        result = client.publish_many(
+            terms, "arn:aws:sns:us-east-1:123:topic", max_workers=20
+        )
+        elapsed = time.perf_counter() - start
+
+    assert result["status"] == "success"
+    assert result["articles_count"] == 20
+    assert elapsed < 1.0
+
+
+def test_search_articles_host_concurrency_cap(sample_response):
+    """Test concurrent searches never exceed the connection pool size."""
+    client = GuardianApiClient(api_key="test-api-key", pool_size=2)
+    lock = threading.Lock()
+    active = []
+    peak = []
+
+    def slow_get(*args, **kwargs):
+        with lock:
+            active.append(1)
+            peak.append(len(active))
+        time.sleep(0.05)
+        with lock:
+            active.pop()
+        response = MagicMock()
+        response.json.return_value = sample_response
+        return response
+
+    with patch.object(client.session, "get", side_effect=slow_get):
+        threads = [
+            threading.Thread(target=client.search_articles, args=(f"term {i}",))
+            for i in range(6)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    assert len(peak) == 6
+    assert max(peak) <= 2
+
+
+def test_publish_many_requires_terms(client):
+    with pytest.raises(ValueError):
+        client.publish_many([], "arn:aws:sns:us-east-1:123:topic")
+    with pytest.raises(ValueError):
+        client.publish_many("ai", "arn:aws:sns:us-east-1:123:topic")
+
+
+def sqs_batch_success(QueueUrl, Entries):
+    """Fake SendMessageBatch response where every entry succeeds."""
+    return {
+        "Successful": [
+            {"Id": entry["Id"], "MessageId": f"msg-{entry['Id']}"} for entry in Entries
+        ]
+    }
+
+
+def test_publish_to_sqs_batch_chunks_of_ten(client):
+    """Test articles are sent as one message each in batches of ten."""
+    articles = make_page(1, 1, 25)["response"]["results"]
+    client.sqs_client = MagicMock()
+    client.sqs_client.send_message_batch.side_effect = sqs_batch_success
+
+    result = client.publish_to_sqs_batch("queue-url", articles)
+
+    calls = client.sqs_client.send_message_batch.call_args_list
+    assert [len(c.kwargs["Entries"]) for c in calls] == [10, 10, 5]
+    assert result["sent"] == 25
+    assert result["failed"] == 0
+    assert result["requests"] == 3
+    assert len(result["message_ids"]) == 25
+
+
+def test_publish_to_sqs_batch_size_aware(client):
+    """Test batches are split before exceeding the aggregate size limit."""
+    articles = [{"contentPreview": "x" * 100000} for _ in range(5)]
+    client.sqs_client = MagicMock()
+    client.sqs_client.send_message_batch.side_effect = sqs_batch_success
+
+    result = client.publish_to_sqs_batch("queue-url", articles)
+
+    calls = client.sqs_client.send_message_batch.call_args_list
+    assert [len(c.kwargs["Entries"]) for c in calls] == [2, 2, 1]
+    assert result["sent"] == 5
+
+
+@patch("src.guardian_api_client.time.sleep")
+def test_publish_to_sqs_batch_retries_failed_entries(mock_sleep, client):
+    """Test only entries reported as failed are re-sent."""
+    articles = make_page(1, 1, 4)["response"]["results"]
+    client.sqs_client = MagicMock()
+    client.sqs_client.send_message_batch.side_effect = [
+        {
+            "Successful": [
+                {"Id": "0", "MessageId": "m0"},
+                {"Id": "2", "MessageId": "m2"},
+            ],
+            "Failed": [
+                {"Id": "1", "SenderFault": False, "Code": "InternalError"},
+                {"Id": "3", "SenderFault": True, "Code": "InvalidMessageContents"},
+            ],
+        },
+        {"Successful": [{"Id": "1", "MessageId": "m1"}]},
+    ]
+
+    result = client.publish_to_sqs_batch("queue-url", articles)
+
+    retry_entries = client.sqs_client.send_message_batch.call_args_list[1].kwargs[
+        "Entries"
+    ]
+    assert [entry["Id"] for entry in retry_entries] == ["1"]
+    assert result["sent"] == 3
+    assert result["failed"] == 1
+    assert result["errors"][0]["Code"] == "InvalidMessageContents"
+    mock_sleep.assert_called_once()
+
+
+def test_publish_to_sqs_batch_oversized_article(client):
+    """Test an article too large for SQS is reported rather than sent."""
+    client.sqs_client = MagicMock()
+    client.sqs_client.send_message_batch.side_effect = sqs_batch_success
+
+    result = client.publish_to_sqs_batch(
+        "queue-url", [{"contentPreview": "x" * 300000}, {"webTitle": "small"}]
+    )
+
+    assert result["sent"] == 1
+    assert result["failed"] == 1
+    assert result["errors"][0]["Code"] == "MessageTooLong"
+
+
+@patch("src.guardian_api_client.GuardianApiClient.search_articles")
+def test_publish_articles_per_article_sqs(mock_search, client, sample_response):
+    """Test per_article mode publishes through SendMessageBatch."""
+    mock_search.return_value = sample_response
+    client.sqs_client = MagicMock()
+    client.sqs_client.send_message_batch.side_effect = sqs_batch_success
+
+    result = client.publish_articles(
+        "test term",
+        "https://sqs.us-east-1.amazonaws.com/123456789012/queue-name",
+        per_article=True,
+    )
+
+    client.sqs_client.send_message.assert_not_called()
+    assert result["status"] == "success"
+    assert result["sent_count"] == 2
+    assert result["failed_count"] == 0
+    assert result["message_ids"] == ["msg-0", "msg-1"]
+
+
+def sns_batch_success(TopicArn, PublishBatchRequestEntries):
+    """Fake PublishBatch response where every entry succeeds."""
+    return {
+        "Successful": [
+            {"Id": entry["Id"], "MessageId": f"msg-{entry['Id']}"}
+            for entry in PublishBatchRequestEntries
+        ]
+    }
+
+
+def test_publish_to_sns_batch_size_aware(client):
+    """Test SNS batches respect both the entry count and aggregate size."""
+    articles = [{"webTitle": f"Article {i}"} for i in range(12)]
+    articles += [{"contentPreview": "x" * 132000} for _ in range(2)]
+    client.sns_client = MagicMock()
+    client.sns_client.publish_batch.side_effect = sns_batch_success
+
+    result = client.publish_to_sns_batch("arn:aws:sns:us-east-1:123:topic", articles)
+
+    calls = client.sns_client.publish_batch.call_args_list
+    sizes = [len(c.kwargs["PublishBatchRequestEntries"]) for c in calls]
+    assert sizes == [10, 3, 1]
+    assert result["sent"] == 14
+    assert "MessageGroupId" not in calls[0].kwargs["PublishBatchRequestEntries"][0]
+
+
+@patch("src.guardian_api_client.time.sleep")
+def test_publish_to_sns_batch_retries_failed_entries(mock_sleep, client):
+    """Test only failed SNS entries are retried, up to max_attempts."""
+    articles = [{"webTitle": "Article 0"}, {"webTitle": "Article 1"}]
+    client.sns_client = MagicMock()
+    client.sns_client.publish_batch.return_value = {
+        "Successful": [{"Id": "0", "MessageId": "m0"}],
+        "Failed": [{"Id": "1", "SenderFault": False, "Code": "Throttled"}],
+    }
+
+    result = client.publish_to_sns_batch(
+        "arn:aws:sns:us-east-1:123:topic", articles, max_attempts=2
+    )
+
+    calls = client.sns_client.publish_batch.call_args_list
+    assert [e["Id"] for e in calls[1].kwargs["PublishBatchRequestEntries"]] == ["1"]
+    assert result["sent"] == 2
+    assert result["failed"] == 1
+    assert result["errors"][0]["Code"] == "Throttled"
+
+
+def test_publish_to_sns_batch_fifo_ids(client):
+    """Test FIFO topics get group IDs and URL-based deduplication IDs."""
+    articles = [
+        {"webUrl": "https://www.theguardian.com/a"},
+        {"webUrl": "https://www.theguardian.com/a"},
+        {"webUrl": "https://www.theguardian.com/b"},
+    ]
+    client.sns_client = MagicMock()
+    client.sns_client.publish_batch.side_effect = sns_batch_success
+
+    client.publish_to_sns_batch("arn:aws:sns:us-east-1:123:topic.fifo", articles)
+
+    entries = client.sns_client.publish_batch.call_args.kwargs[
+        "PublishBatchRequestEntries"
+    ]
+    assert {e["MessageGroupId"] for e in entries} == {"guardian_content"}
+    dedup_ids = [e["MessageDeduplicationId"] for e in entries]
+    assert dedup_ids[0] == dedup_ids[1] != dedup_ids[2]
+
+
+@patch("src.guardian_api_client.GuardianApiClient.search_articles")
+@patch("src.guardian_api_client.GuardianApiClient.publish_to_sqs")
+def test_publish_articles_skips_seen_articles(
+    mock_publish_sqs, mock_search, sample_response
+):
+    """Test only articles not published by an earlier run reach the broker."""
+    client = GuardianApiClient(
+        api_key="test-api-key", seen_store=InMemorySeenArticleStore()
+    )
+    mock_search.return_value = sample_response
+    mock_publish_sqs.return_value = {"MessageId": "test-message-id"}
+    queue_url = "https://sqs.us-east-1.amazonaws.com/123456789012/queue-name"
+
+    first = client.publish_articles("test term", queue_url)
+    second = client.publish_articles("test term", queue_url)
+
+    mock_publish_sqs.assert_called_once()
+    assert first["articles_count"] == 2
+    assert second["articles_count"] == 0
+    assert second["message_id"] is None
+    assert second["seen_articles"]["skipped"] == 2
+    assert second["seen_articles"]["hits"] == 2
+    assert second["seen_articles"]["misses"] == 2
+
+
+def dated_page(dates, pages=5):
+    """Build a page of results with the given publication dates, newest first."""
+    return {
+        "response": {
+            "pages": pages,
+            "results": [
+                {
+                    "webPublicationDate": date,
+                    "webTitle": f"Article {date}",
+                    "webUrl": f"https://www.theguardian.com/{date}",
+                }
+                for date in dates
+            ],
+        }
+    }
+
+
+@patch("src.guardian_api_client.GuardianApiClient.publish_to_sqs")
+def test_publish_articles_incremental_first_run(mock_publish_sqs):
+    """Test the first incremental run publishes the newest articles."""
+    store = InMemoryWatermarkStore()
+    client = GuardianApiClient(api_key="test-api-key", watermark_store=store)
+    mock_publish_sqs.return_value = {"MessageId": "test-message-id"}
+    dates = [f"2023-11-{day:02d}T12:00:00Z" for day in range(20, 10, -1)]
+
+    with patch.object(client, "search_articles") as mock_search:
+        mock_search.return_value = dated_page(dates)
+        result = client.publish_articles(
+            "test term",
+            "https://sqs.us-east-1.amazonaws.com/123456789012/queue-name",
+            incremental=True,
+        )
+
+    mock_search.assert_called_once()
+    assert result["articles_count"] == 10
+    assert result["watermark"] == "2023-11-20T12:00:00Z"
+    assert store.get("test term") == "2023-11-20T12:00:00Z"
+
+
+@patch("src.guardian_api_client.GuardianApiClient.publish_to_sqs")
+def test_publish_articles_incremental_stops_at_watermark(mock_publish_sqs):
+    """Test incremental runs query from the watermark and stop at seen content."""
+    store = InMemoryWatermarkStore()
+    store.set("test term", "2023-11-20T12:00:00Z")
+    client = GuardianApiClient(api_key="test-api-key", watermark_store=store)
+    mock_publish_sqs.return_value = {"MessageId": "test-message-id"}
+    dates = [
+        "2023-11-21T18:00:00Z",
+        "2023-11-21T09:00:00Z",
+        "2023-11-20T12:00:00Z",
+        "2023-11-20T08:00:00Z",
+    ]
+
+    with patch.object(client, "search_articles") as mock_search:
+        mock_search.return_value = dated_page(dates)
+        result = client.publish_articles(
+            "test term",
+            "https://sqs.us-east-1.amazonaws.com/123456789012/queue-name",
+            incremental=True,
+        )
+
+    mock_search.assert_called_once()
+    assert mock_search.call_args.args[1] == "2023-11-20"
+    assert mock_search.call_args.kwargs["use_date"] == "published"
+    published = mock_publish_sqs.call_args.args[1]
+    assert [a["webPublicationDate"] for a in published] == dates[:2]
+    assert result["watermark"] == "2023-11-21T18:00:00Z"
+
+
+def test_publish_articles_incremental_requires_store(client):
+    with pytest.raises(ValueError):
+        client.publish_articles(
+            "test term", "arn:aws:sns:us-east-1:123:topic", incremental=True
+        )
+
+
+def api_response(status_code, headers=None, body=None):
+    """Build a fake HTTP response."""
+    response = MagicMock()
+    response.status_code = status_code
+    response.headers = headers or {}
+    response.json.return_value = body
+    if status_code >= 400:
+        response.raise_for_status.side_effect = requests.HTTPError(str(status_code))
+    return response
+
+
+def test_search_articles_honours_retry_after(sample_response):
+    """Test a 429 pauses the shared rate limiter for Retry-After seconds."""
+    limiter = RateLimiter(rate=1000, burst=10)
+    client = GuardianApiClient(api_key="test-api-key", rate_limiter=limiter)
+
+    with patch.object(client.session, "get") as mock_get, patch.object(
+        limiter, "pause"
+    ) as mock_pause:
+        mock_get.side_effect = [
+            api_response(429, {"Retry-After": "2"}),
+            api_response(200, body=sample_response),
+        ]
+        result = client.search_articles("test term")
+
+    assert result == sample_response
+    assert mock_get.call_count == 2
+    mock_pause.assert_called_once_with(2.0)
+    assert limiter.used_today == 2
+
+
+@patch("src.guardian_api_client.time.sleep")
+def test_search_articles_backs_off_on_server_errors(mock_sleep, client):
+    """Test 5xx responses are retried with backoff until retries run out."""
+    with patch.object(client.session, "get") as mock_get:
+        mock_get.return_value = api_response(503)
+        with pytest.raises(requests.HTTPError):
+            client.search_articles("test term")
+
+    assert mock_get.call_count == client.max_retries + 1
+    assert mock_sleep.call_count == client.max_retries
+
+
+@patch("boto3.client")
+def test_broker_clients_created_lazily_and_shared(mock_boto3_client):
+    """Test boto3 clients are built on first use and shared between clients."""
+    with patch.dict("src.guardian_api_client._boto3_clients", clear=True):
+        first = GuardianApiClient(api_key="test-api-key")
+        mock_boto3_client.assert_not_called()
+
+        first.sqs_client
+        GuardianApiClient(api_key="test-api-key").sqs_client
+
+    mock_boto3_client.assert_called_once_with("sqs")
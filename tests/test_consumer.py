@@ -0,0 +1,223 @@
+import json
+import time
+import threading
+
+import pytest
+from unittest.mock import MagicMock
+
+from fake_s3 import FakeS3
+from fake_sqs import FakeSQS
+from src.claim_check import ClaimCheck
+from src.consumer import ArticleConsumer, decode_articles
+from src.guardian_api_client import GuardianApiClient
+from src.message_encoding import encode_message
+
+
+QUEUE_URL = "https://sqs.eu-west-2.amazonaws.com/123456789012/guardian_content"
+
+
+def make_articles(count, start=0):
+    return [
+        {
+            "webTitle": f"Article {i}",
+            "webUrl": f"https://www.theguardian.com/world/article-{i}",
+            "webPublicationDate": "2024-01-01T00:00:00Z",
+        }
+        for i in range(start, start + count)
+    ]
+
+
+class Collector:
+    """Thread-safe handler recording every batch it is given."""
+
+    def __init__(self):
+        self.batches = []
+        self.lock = threading.Lock()
+
+    def __call__(self, articles):
+        with self.lock:
+            self.batches.append(articles)
+
+    @property
+    def urls(self):
+        return [article["webUrl"] for batch in self.batches for article in batch]
+
+
+@pytest.mark.parametrize("encoding", ["json", "gzip"])
+def test_consumer_reads_what_the_client_publishes(encoding):
+    """Test batched and per-article messages are decoded and deleted."""
+    sqs = FakeSQS()
+    client = GuardianApiClient(api_key="test-api-key", message_encoding=encoding)
+    client.sqs_client = sqs
+    client.publish_to_sqs(QUEUE_URL, make_articles(5))
+    client.publish_to_sqs_batch(QUEUE_URL, make_articles(25, start=5))
+
+    collector = Collector()
+    consumer = ArticleConsumer(
+        QUEUE_URL, collector, pollers=3, workers=2, wait_time=0, sqs_client=sqs
+    )
+    stats = consumer.run(stop_when_empty=True)
+
+    assert sorted(collector.urls) == sorted(a["webUrl"] for a in make_articles(30))
+    assert all(len(batch) <= 14 for batch in collector.batches)
+    assert stats["received"] == stats["deleted"] == 26
+    assert stats["articles"] == 30
+    assert sqs.pending(QUEUE_URL) == 0
+    assert "DeleteMessage" not in sqs.calls
+
+
+def test_consumer_leaves_messages_when_handler_fails():
+    """Test messages are not deleted when the callback raises."""
+    sqs = FakeSQS()
+    for article in make_articles(3):
+        sqs.send_message(QUEUE_URL, json.dumps(article))
+
+    def handler(articles):
+        raise RuntimeError("database unavailable")
+
+    consumer = ArticleConsumer(QUEUE_URL, handler, wait_time=0, sqs_client=sqs)
+    stats = consumer.run(stop_when_empty=True)
+
+    assert stats["handler_errors"] == 1
+    assert stats["deleted"] == 0
+    assert sqs.pending(QUEUE_URL) == 3
+
+
+def test_consumer_skips_undecodable_messages():
+    """Test a message that cannot be decoded is left for the dead-letter queue."""
+    sqs = FakeSQS()
+    sqs.send_message(QUEUE_URL, "not json")
+    sqs.send_message(QUEUE_URL, json.dumps(make_articles(2)))
+
+    collector = Collector()
+    consumer = ArticleConsumer(QUEUE_URL, collector, wait_time=0, sqs_client=sqs)
+    stats = consumer.run(stop_when_empty=True)
+
+    assert len(collector.urls) == 2
+    assert stats["undecodable"] == 1
+    assert stats["deleted"] == 1
+    assert sqs.pending(QUEUE_URL) == 1
+
+
+def test_decode_articles_unwraps_sns_notifications():
+    """Test notifications delivered from the SNS topic are unwrapped."""
+    body, attributes = encode_message(make_articles(2), "gzip")
+    notification = {
+        "Type": "Notification",
+        "Message": body,
+        "MessageAttributes": {
+            name: {"Type": "String", "Value": value["StringValue"]}
+            for name, value in attributes.items()
+        },
+    }
+
+    articles = decode_articles({"Body": json.dumps(notification)})
+
+    assert articles == make_articles(2)
+    assert decode_articles({"Body": json.dumps(make_articles(1)[0])}) == make_articles(
+        1
+    )
+
+
+def test_consumer_resolves_claim_checks():
+    """Test article bodies offloaded to S3 are restored before the callback."""
+    s3 = FakeS3()
+    articles = [{**article, "bodyText": "x" * 100} for article in make_articles(3)]
+    offloaded = ClaimCheck("bodies", threshold=10).offload(s3, articles)
+    sqs = FakeSQS()
+    sqs.send_message(QUEUE_URL, json.dumps(offloaded))
+
+    collector = Collector()
+    consumer = ArticleConsumer(
+        QUEUE_URL, collector, wait_time=0, sqs_client=sqs, s3_client=s3
+    )
+    consumer.run(stop_when_empty=True)
+
+    assert collector.batches == [articles]
+
+
+def test_consumer_counts_claim_check_and_delete_errors(caplog):
+    """Test S3 and DeleteMessageBatch failures are logged and counted."""
+    s3 = FakeS3()
+    articles = [{**article, "bodyText": "x" * 100} for article in make_articles(2)]
+    offloaded = ClaimCheck("bodies", threshold=10).offload(s3, articles)
+    sqs = FakeSQS()
+    sqs.send_message(QUEUE_URL, json.dumps(offloaded))
+
+    broken_s3 = MagicMock()
+    broken_s3.get_object.side_effect = ConnectionError("S3 unavailable")
+    consumer = ArticleConsumer(
+        QUEUE_URL, Collector(), wait_time=0, sqs_client=sqs, s3_client=broken_s3
+    )
+    stats = consumer.run(stop_when_empty=True)
+
+    assert stats["resolve_errors"] == 1
+    assert stats["deleted"] == 0
+    assert "S3 unavailable" in caplog.text
+
+    sqs = FakeSQS()
+    sqs.send_message(QUEUE_URL, json.dumps(make_articles(1)))
+    sqs.delete_message_batch = MagicMock(side_effect=ConnectionError("SQS down"))
+    consumer = ArticleConsumer(QUEUE_URL, Collector(), wait_time=0, sqs_client=sqs)
+    stats = consumer.run(stop_when_empty=True)
+
+    assert stats["articles"] == 1
+    assert stats["delete_errors"] == 1
+    assert "SQS down" in caplog.text
+
+
+def test_consumer_stops_on_request():
+    """Test a long-running consumer finishes once stop() is called."""
+    sqs = FakeSQS()
+    consumer = ArticleConsumer(QUEUE_URL, Collector(), wait_time=0, sqs_client=sqs)
+
+    timer = threading.Timer(0.05, consumer.stop)
+    timer.start()
+    stats = consumer.run()
+
+    assert stats["receives"] > 0
+    assert stats["received"] == 0
+
+
+def test_consumer_validation():
+    """Test invalid consumer settings are rejected."""
+    with pytest.raises(ValueError, match="at least 1"):
+        ArticleConsumer(QUEUE_URL, Collector(), pollers=0)
+    with pytest.raises(ValueError, match="wait_time"):
+        ArticleConsumer(QUEUE_URL, Collector(), wait_time=30)
+
+
+@pytest.mark.benchmark
+def test_consumer_vs_single_message_polling():
+    """Benchmark the batch consumer against a one-message-at-a-time poller."""
+    messages = 200
+    sqs = FakeSQS(latency=0.002)
+    for article in make_articles(messages):
+        sqs.send_message(QUEUE_URL, json.dumps(article))
+
+    handled = 0
+    start = time.perf_counter()
+    while True:
+        response = sqs.receive_message(QueueUrl=QUEUE_URL, MaxNumberOfMessages=1)
+        if not response:
+            break
+        message = response["Messages"][0]
+        json.loads(message["Body"])
+        handled += 1
+        sqs.delete_message(QueueUrl=QUEUE_URL, ReceiptHandle=message["ReceiptHandle"])
+    single = handled / (time.perf_counter() - start)
+
+    for article in make_articles(messages):
+        sqs.send_message(QUEUE_URL, json.dumps(article))
+    consumer = ArticleConsumer(
+        QUEUE_URL, Collector(), pollers=4, wait_time=0, sqs_client=sqs
+    )
+    stats = consumer.run(stop_when_empty=True)
+
+    print(
+        f"\nsingle-message poller: {single:.0f} messages/s"
+        f"\nbatch consumer:        {stats['messages_per_second']:.0f} messages/s, "
+        f"{stats['receives']} receives"
+    )
+    assert stats["deleted"] == messages
+    assert stats["messages_per_second"] > single * 3
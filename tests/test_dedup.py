@@ -0,0 +1,190 @@
+import random
+
+import pytest
+import requests
+from unittest.mock import patch
+
+from helpers import FailingBackend
+from src.brokers import BrokerRegistry
+from src.dedup import ContentDeduplicator, simhash
+from src.guardian_api_client import GuardianApiClient
+
+
+VOCABULARY = [f"word{i}" for i in range(2000)]
+
+
+def make_text(seed, words=160):
+    rng = random.Random(seed)
+    return " ".join(rng.choice(VOCABULARY) for _ in range(words))
+
+
+def make_article(i, text=None):
+    return {
+        "webUrl": f"https://www.theguardian.com/technology/article-{i}",
+        "webTitle": f"Article {i}",
+        "contentPreview": text if text is not None else make_text(i),
+    }
+
+
+def edited(text, seed):
+    """Return a copy of a text with one word changed."""
+    words = text.split()
+    words[random.Random(seed).randrange(len(words))] = "amended"
+    return " ".join(words)
+
+
+def test_simhash_keeps_similar_texts_close():
+    """Test lightly edited texts differ in few bits and unrelated ones in many."""
+    text = make_text(1)
+
+    assert simhash(text) == simhash(text.upper())
+    assert (simhash(text) ^ simhash(edited(text, 1))).bit_count() <= 7
+    assert (simhash(text) ^ simhash(make_text(2))).bit_count() > 7
+
+
+def test_check_suppresses_exact_and_near_duplicates():
+    """Test repeated ids and edited copies are suppressed."""
+    deduplicator = ContentDeduplicator()
+    original = make_article(1)
+    syndicated = make_article(2, edited(original["contentPreview"], 2))
+
+    assert deduplicator.check(original) is False
+    assert deduplicator.check(make_article(3)) is False
+    assert deduplicator.check(original) is True
+    assert deduplicator.check(syndicated) is True
+    assert deduplicator.stats() == {"exact": 1, "near": 1, "evictions": 0, "size": 2}
+
+
+def test_short_previews_only_match_on_id():
+    """Test previews too short to fingerprint are only matched on their id."""
+    deduplicator = ContentDeduplicator()
+
+    assert deduplicator.check(make_article(1, "Live updates")) is False
+    assert deduplicator.check(make_article(2, "Live updates")) is False
+    assert deduplicator.check(make_article(1, "Live updates")) is True
+
+
+def test_index_size_is_bounded():
+    """Test the index evicts the least recently seen articles."""
+    deduplicator = ContentDeduplicator(max_size=50)
+
+    unique = [make_article(i) for i in range(200)]
+    assert deduplicator.filter(unique) == unique
+
+    stats = deduplicator.stats()
+    assert stats["size"] == 50
+    assert stats["evictions"] == 150
+    assert all(
+        sum(len(keys) for keys in band.values()) == 50 for band in deduplicator._bands
+    )
+    assert deduplicator.check(unique[0]) is False
+    assert deduplicator.check(unique[-1]) is True
+
+
+def test_discard_allows_republishing():
+    """Test discarded articles are no longer treated as duplicates."""
+    deduplicator = ContentDeduplicator()
+    article = make_article(1)
+    deduplicator.check(article)
+
+    deduplicator.discard([article])
+
+    assert deduplicator.check(article) is False
+
+
+def test_validation():
+    """Test invalid settings are rejected."""
+    with pytest.raises(ValueError, match="max_size"):
+        ContentDeduplicator(max_size=0)
+    with pytest.raises(ValueError, match="max_distance"):
+        ContentDeduplicator(max_distance=16)
+
+
+def test_publish_many_publishes_overlapping_results_once():
+    """Test articles found under several terms are only published once."""
+    registry = BrokerRegistry()
+    backend = registry.register(FailingBackend())
+    client = GuardianApiClient(
+        api_key="test-api-key",
+        broker_registry=registry,
+        deduplicator=ContentDeduplicator(),
+    )
+    articles = [make_article(i) for i in range(6)]
+    syndicated = make_article(99, edited(articles[0]["contentPreview"], 3))
+    results = {
+        "machine learning": articles[:4],
+        "ai": articles[2:] + [syndicated],
+        "neural networks": articles[::2],
+    }
+
+    with patch.object(
+        client,
+        "process_articles",
+        side_effect=lambda api_response: api_response["term_results"],
+    ), patch.object(
+        client,
+        "search_articles",
+        side_effect=lambda term, *args, **kwargs: {"term_results": results[term]},
+    ):
+        result = client.publish_many(list(results), "memory://dedup", max_workers=3)
+
+    urls = [a["webUrl"] for message in backend.messages["dedup"] for a in message]
+    assert sorted(urls) == sorted(a["webUrl"] for a in articles)
+    assert sum(r["duplicates"]["skipped"] for r in result["results"].values()) == 6
+
+
+def test_failed_publish_releases_articles():
+    """Test articles whose publish failed can be published by a later run."""
+    registry = BrokerRegistry()
+    backend = registry.register(FailingBackend())
+    client = GuardianApiClient(
+        api_key="test-api-key",
+        broker_registry=registry,
+        deduplicator=ContentDeduplicator(),
+    )
+    articles = [make_article(i) for i in range(3)]
+
+    with patch.object(client, "search_articles"), patch.object(
+        client, "process_articles", return_value=articles
+    ):
+        backend.failing = True
+        with pytest.raises(ConnectionError):
+            client.publish_articles("ai", "memory://dedup")
+        backend.failing = False
+        result = client.publish_articles("ai", "memory://dedup")
+
+    assert result["articles_count"] == 3
+    assert result["duplicates"]["skipped"] == 0
+
+
+def test_failed_page_fetch_releases_articles():
+    """Test articles indexed for a batch whose next page failed are released."""
+    registry = BrokerRegistry()
+    backend = registry.register(FailingBackend())
+    client = GuardianApiClient(
+        api_key="test-api-key",
+        broker_registry=registry,
+        deduplicator=ContentDeduplicator(),
+    )
+    articles = [make_article(i) for i in range(6)]
+    broken = {"page": 2}
+
+    def search(term, date_from, page_size, page, date_to, use_date):
+        if page == broken["page"]:
+            raise requests.HTTPError("503 Server Error")
+        start = (page - 1) * 3
+        return {"response": {"pages": 2, "results": articles[start : start + 3]}}
+
+    with patch.object(client, "search_articles", side_effect=search), patch.object(
+        client,
+        "process_articles",
+        side_effect=lambda response: response["response"]["results"],
+    ), patch.object(client, "MAX_PAGE_SIZE", 3):
+        with pytest.raises(requests.HTTPError):
+            client.publish_articles("ai", "memory://dedup", max_results=6)
+        broken["page"] = None
+        result = client.publish_articles("ai", "memory://dedup", max_results=6)
+
+    assert result["articles_count"] == 6
+    assert result["duplicates"]["skipped"] == 0
+    assert len(backend.messages["dedup"][0]) == 6
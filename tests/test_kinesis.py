@@ -0,0 +1,166 @@
+import json
+
+import pytest
+from unittest.mock import patch
+
+from fake_kinesis import FakeKinesis
+from src.brokers import BrokerRegistry, KinesisBackend
+from src.guardian_api_client import GuardianApiClient, kinesis_partition_key
+
+
+SECTIONS = ["technology", "politics", "sport", "world"]
+
+
+def make_articles(count, body_size=100):
+    return [
+        {
+            "webTitle": f"Article {i}",
+            "webUrl": f"https://www.theguardian.com/{SECTIONS[i % 4]}/2024/article-{i}",
+            "contentPreview": "x" * body_size,
+        }
+        for i in range(count)
+    ]
+
+
+@pytest.fixture
+def client():
+    """Create a test client publishing to a fake Kinesis stream."""
+    client = GuardianApiClient(api_key="test-api-key")
+    client.kinesis_client = FakeKinesis()
+    return client
+
+
+def test_kinesis_partition_key():
+    """Test partition keys are derived from the article id or section."""
+    article = {"webUrl": "https://www.theguardian.com/technology/2024/jan/01/ai"}
+
+    assert kinesis_partition_key(article) == "technology/2024/jan/01/ai"
+    assert kinesis_partition_key(article, "section") == "technology"
+    assert kinesis_partition_key({"id": "world/1", "sectionId": "uk"}) == "world/1"
+    assert kinesis_partition_key({"id": "world/1"}, "section") == "world"
+
+    with pytest.raises(ValueError):
+        kinesis_partition_key(article, "title")
+
+
+def test_publish_to_kinesis_spreads_records_over_shards(client):
+    """Test partitioning on the article id uses every shard."""
+    result = client.publish_to_kinesis("articles", make_articles(200))
+
+    assert result["sent"] == 200
+    assert result["requests"] == 1
+    assert all(len(records) > 20 for records in client.kinesis_client.shards.values())
+    assert set(result["shards"]) == set(client.kinesis_client.shards)
+    assert sum(s["records"] for s in result["shards"].values()) == 200
+    assert all(s["records_per_second"] > 0 for s in result["shards"].values())
+
+
+def test_publish_to_kinesis_partitions_by_section(client):
+    """Test partitioning on the section keeps a section on one shard."""
+    client.publish_to_kinesis("articles", make_articles(40), partition_by="section")
+
+    for records in client.kinesis_client.shards.values():
+        sections = {record["PartitionKey"] for record in records}
+        for section in sections:
+            assert sum(r["PartitionKey"] == section for r in records) == 10
+
+
+def test_publish_to_kinesis_respects_request_limits(client):
+    """Test batches are split at 500 records and at 5 MiB."""
+    result = client.publish_to_kinesis("articles", make_articles(1200))
+    assert [len(c["Records"]) for c in client.kinesis_client.calls] == [500, 500, 200]
+    assert result["sent"] == 1200
+
+    client.kinesis_client = FakeKinesis()
+    result = client.publish_to_kinesis("articles", make_articles(30, 400000))
+    assert result["requests"] == 3
+    assert result["sent"] == 30
+
+
+def test_publish_to_kinesis_retries_only_throttled_records(client):
+    """Test records rejected by a throttled shard are re-sent on their own."""
+    client.kinesis_client = FakeKinesis(shard_count=2, shard_capacity=10)
+
+    with patch("src.guardian_api_client.time.sleep"):
+        result = client.publish_to_kinesis(
+            "articles", make_articles(30), max_attempts=5
+        )
+
+    calls = client.kinesis_client.calls
+    assert len(calls[0]["Records"]) == 30
+    assert len(calls[1]["Records"]) == 10
+    assert result["sent"] == 30
+    assert result["failed"] == 0
+    stored = [
+        json.loads(r["Data"])
+        for rs in client.kinesis_client.shards.values()
+        for r in rs
+    ]
+    assert sorted(a["webTitle"] for a in stored) == sorted(
+        a["webTitle"] for a in make_articles(30)
+    )
+
+
+def test_publish_to_kinesis_reports_records_that_keep_failing(client):
+    """Test records still throttled after the last attempt are reported."""
+    client.kinesis_client = FakeKinesis(shard_count=1, shard_capacity=3)
+
+    with patch("src.guardian_api_client.time.sleep"):
+        result = client.publish_to_kinesis("articles", make_articles(10))
+
+    assert result["requests"] == 3
+    assert result["sent"] == 9
+    assert result["failed"] == 1
+    assert result["errors"][0]["Code"] == "ProvisionedThroughputExceededException"
+
+
+def test_publish_to_kinesis_rejects_oversized_records(client):
+    """Test records over 1 MiB are reported without being sent."""
+    articles = make_articles(2)
+    articles[1]["contentPreview"] = "x" * 1100000
+
+    result = client.publish_to_kinesis("articles", articles)
+
+    assert result["sent"] == 1
+    assert result["errors"] == [
+        {
+            "Id": "1",
+            "Code": "RecordTooLarge",
+            "Message": "Record exceeds 1048576 bytes",
+        }
+    ]
+
+
+def test_publish_articles_to_kinesis_reports_shards(client):
+    """Test publish_articles reports the records written to each shard."""
+    registry = BrokerRegistry()
+    registry.register(KinesisBackend(partition_by="section"))
+    client.broker_registry = registry
+    articles = make_articles(8)
+
+    with patch.object(client, "iter_articles", return_value=iter(articles)):
+        result = client.publish_articles(
+            "test term", "kinesis://articles", max_results=8, batch_size=4
+        )
+
+    assert result["broker_type"] == "kinesis"
+    assert result["articles_count"] == 8
+    assert sum(s["records"] for s in result["shards"].values()) == 8
+    assert len(result["message_ids"]) == 8
+
+
+def test_publish_articles_to_kinesis_reports_every_record(client):
+    """Test a single-page publish reports the sequence number of every record."""
+    registry = BrokerRegistry()
+    registry.register(KinesisBackend())
+    client.broker_registry = registry
+
+    with patch.object(client, "search_articles"), patch.object(
+        client, "process_articles", return_value=make_articles(3)
+    ):
+        result = client.publish_articles("test term", "kinesis://articles")
+
+    assert "message_id" not in result
+    assert len(result["message_ids"]) == 3
+    assert result["sent_count"] == 3
+    assert result["failed_count"] == 0
@@ -5,7 +5,17 @@ import sys
 import os
 
 sys.path.append(os.path.join(os.path.dirname(__file__), "..", "src"))
+import src.lambda_handler
 from src.lambda_handler import lambda_handler
+from src.metrics import Metrics
+
+
+@pytest.fixture(autouse=True)
+def reset_cached_client():
+    """Ensure every test starts without a client cached from a warm invocation."""
+    src.lambda_handler._client = None
+    yield
+    src.lambda_handler._client = None
 
 
 @pytest.fixture
@@ -141,3 +151,219 @@ def test_lambda_handler_invalid_broker(mock_client_class):
 
     assert result["statusCode"] == 400
     assert "Unknown broker type" in json.loads(result["body"])["error"]
+
+
+@patch("src.lambda_handler.GuardianApiClient")
+def test_lambda_handler_reuses_client(mock_client_class, valid_event):
+    """Test the client is created once and reused across warm invocations."""
+    mock_client_class.return_value.publish_articles.return_value = {}
+
+    lambda_handler(valid_event, {})
+    lambda_handler(valid_event, {})
+
+    mock_client_class.assert_called_once()
+    assert mock_client_class.return_value.publish_articles.call_count == 2
+
+
+@patch("src.lambda_handler.GuardianApiClient")
+def test_lambda_handler_search_terms(mock_client_class):
+    """Test a search_terms event fans out through publish_many."""
+    mock_client = mock_client_class.return_value
+    mock_client.publish_many.return_value = {"status": "success"}
+
+    event = {
+        "search_terms": ["machine learning", "ai"],
+        "broker_reference": "arn:aws:sns:us-east-1:123456789012:guardian_content",
+        "max_workers": 4,
+    }
+    result = lambda_handler(event, {})
+
+    assert result["statusCode"] == 200
+    mock_client.publish_many.assert_called_once_with(
+        ["machine learning", "ai"],
+        "arn:aws:sns:us-east-1:123456789012:guardian_content",
+        None,
+        max_workers=4,
+    )
+    mock_client.publish_articles.assert_not_called()
+
+
+@patch("src.lambda_handler.GuardianApiClient")
+def test_lambda_handler_incremental(mock_client_class, valid_event):
+    """Test an incremental event polls from the stored watermark."""
+    mock_client = mock_client_class.return_value
+    mock_client.publish_articles.return_value = {"status": "success"}
+
+    result = lambda_handler({**valid_event, "incremental": True}, {})
+
+    assert result["statusCode"] == 200
+    mock_client.publish_articles.assert_called_once_with(
+        "machine learning",
+        "arn:aws:sns:us-east-1:123456789012:guardian_content",
+        "2023-01-01",
+        incremental=True,
+    )
+
+
+@patch("src.lambda_handler.GuardianApiClient")
+def test_lambda_handler_backfill(mock_client_class, valid_event):
+    """Test a backfill event publishes the whole date range."""
+    mock_client = mock_client_class.return_value
+    mock_client.backfill.return_value = {"status": "success"}
+
+    result = lambda_handler(
+        {**valid_event, "backfill": True, "date_to": "2023-12-31"}, {}
+    )
+
+    assert result["statusCode"] == 200
+    mock_client.backfill.assert_called_once_with(
+        "machine learning",
+        "arn:aws:sns:us-east-1:123456789012:guardian_content",
+        "2023-01-01",
+        "2023-12-31",
+        max_workers=4,
+    )
+
+
+class FakeContext:
+    """Lambda context with a fixed amount of time left."""
+
+    invoked_function_arn = (
+        "arn:aws:lambda:us-east-1:123456789012:function:guardian_api_client"
+    )
+
+    def __init__(self, remaining_ms):
+        self.remaining_ms = remaining_ms
+
+    def get_remaining_time_in_millis(self):
+        return self.remaining_ms
+
+
+@patch("src.lambda_handler.GuardianApiClient")
+def test_lambda_handler_passes_deadline(mock_client_class, valid_event):
+    """Test the remaining time, less the margin, becomes the client deadline."""
+    mock_client = mock_client_class.return_value
+    mock_client.publish_articles.return_value = {"status": "success"}
+
+    with patch("src.lambda_handler.time.monotonic", return_value=100.0):
+        lambda_handler(valid_event, FakeContext(60000))
+
+    assert mock_client.publish_articles.call_args.kwargs["deadline"] == 150.0
+
+
+@patch("src.lambda_handler.get_boto3_client")
+@patch("src.lambda_handler.GuardianApiClient")
+def test_lambda_handler_returns_continuation(
+    mock_client_class, mock_get_boto3_client, valid_event
+):
+    """Test a cut-short run returns the event that carries on from it."""
+    mock_client = mock_client_class.return_value
+    mock_client.publish_many.return_value = {
+        "status": "success",
+        "complete": False,
+        "pending_terms": ["ai"],
+    }
+    event = {
+        "search_terms": ["machine learning", "ai"],
+        "broker_reference": valid_event["broker_reference"],
+    }
+
+    result = lambda_handler(event, FakeContext(60000))
+
+    body = json.loads(result["body"])
+    assert body["continuation"] == {
+        "search_terms": ["ai"],
+        "broker_reference": valid_event["broker_reference"],
+        "continuation_count": 1,
+    }
+    mock_get_boto3_client.assert_not_called()
+
+
+@patch("src.lambda_handler.get_boto3_client")
+@patch("src.lambda_handler.GuardianApiClient")
+def test_lambda_handler_auto_continues(
+    mock_client_class, mock_get_boto3_client, valid_event, monkeypatch
+):
+    """Test a cut-short run re-invokes the function until the limit."""
+    monkeypatch.setenv("MAX_CONTINUATIONS", "2")
+    mock_client = mock_client_class.return_value
+    mock_client.publish_articles.return_value = {"status": "success", "complete": False}
+    context = FakeContext(60000)
+
+    lambda_handler({**valid_event, "auto_continue": True}, context)
+
+    invoke = mock_get_boto3_client.return_value.invoke
+    invoke.assert_called_once()
+    assert invoke.call_args.kwargs["FunctionName"] == context.invoked_function_arn
+    assert invoke.call_args.kwargs["InvocationType"] == "Event"
+    next_event = json.loads(invoke.call_args.kwargs["Payload"])
+    assert next_event["continuation_count"] == 1
+
+    invoke.reset_mock()
+    lambda_handler({**next_event, "continuation_count": 2}, context)
+    invoke.assert_not_called()
+
+
+@pytest.fixture
+def metrics_client():
+    """Install a mocked client with real metrics as the handler's client."""
+    client = MagicMock()
+    client.metrics = Metrics()
+    client.publish_articles.return_value = {"status": "success"}
+    client.publish_buffer.flush.return_value = {"failed": 0}
+    src.lambda_handler._client = client
+    yield client
+    src.lambda_handler._client = None
+
+
+def test_lambda_handler_emits_emf(metrics_client, capsys):
+    """Test each invocation logs its metrics once in EMF and starts afresh."""
+    metrics_client.metrics.timing("search", 0.1)
+    event = {"search_term": "ai", "broker_reference": "memory://metrics"}
+    context = MagicMock(function_name="guardian_api_client", aws_request_id="req-1")
+
+    result = lambda_handler(event, context)
+
+    assert result["statusCode"] == 200
+    document = json.loads(capsys.readouterr().out.strip())
+    assert document["FunctionName"] == "guardian_api_client"
+    assert document["request_id"] == "req-1"
+    assert document["search_term"] == "ai"
+    assert document["search_time"] == 100.0
+    assert metrics_client.metrics.snapshot() == {"timings": {}, "counts": {}}
+
+
+def test_lambda_handler_flushes_publish_buffer(metrics_client, valid_event):
+    """Test buffered articles are published before the handler returns."""
+    metrics_client.publish_articles.side_effect = Exception("search failed")
+
+    result = lambda_handler(valid_event, {})
+
+    assert result["statusCode"] == 500
+    metrics_client.publish_buffer.flush.assert_called_once_with()
+
+
+def test_lambda_handler_reports_failed_buffer_flush(metrics_client, valid_event):
+    """Test articles the final flush failed to publish make the result partial."""
+    metrics_client.publish_buffer.flush.return_value = {"failed": 3}
+
+    result = lambda_handler(valid_event, {})
+
+    body = json.loads(result["body"])
+    assert result["statusCode"] == 200
+    assert body["status"] == "partial"
+    assert body["buffer_failed_count"] == 3
+
+
+@patch("src.lambda_handler.GuardianApiClient")
+def test_get_client_configures_sns_fifo_groups(mock_client_class, monkeypatch):
+    """Test SNS message groups can be set from the environment."""
+    monkeypatch.setenv("SNS_MESSAGE_GROUP_BY", "section")
+    registry = src.lambda_handler.default_registry
+    topic = "arn:aws:sns:us-east-1:123456789012:articles.fifo"
+
+    try:
+        src.lambda_handler.get_client()
+        assert registry.resolve(topic).group_by == "section"
+    finally:
+        registry.register(src.lambda_handler.SnsBackend())
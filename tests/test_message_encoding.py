@@ -0,0 +1,102 @@
+import json
+
+import pytest
+from unittest.mock import MagicMock
+
+from src.guardian_api_client import MAX_BATCH_BYTES, GuardianApiClient
+from src.message_encoding import decode_message, encode_message
+
+
+ARTICLES = [
+    {
+        "webTitle": f"Article {i}",
+        "webUrl": f"https://www.theguardian.com/technology/article-{i}",
+        "contentPreview": "The quick brown fox jumps over the lazy dog. " * 22,
+    }
+    for i in range(20)
+]
+
+
+@pytest.mark.parametrize("encoding", ["json", "gzip", "zstd", "msgpack"])
+def test_encode_message_round_trip(encoding):
+    """Test every encoding decodes back to the original payload."""
+    if encoding == "zstd":
+        pytest.importorskip("zstandard")
+    if encoding == "msgpack":
+        pytest.importorskip("msgpack")
+
+    body, attributes = encode_message(ARTICLES, encoding)
+
+    assert isinstance(body, str)
+    assert decode_message(body, attributes) == ARTICLES
+
+
+def test_encode_message_json_is_unchanged():
+    """Test the default encoding is plain JSON without extra attributes."""
+    body, attributes = encode_message(ARTICLES)
+
+    assert body == json.dumps(ARTICLES)
+    assert attributes == {}
+
+
+def test_compressed_encoding_is_smaller():
+    """Test gzip shrinks a message carrying article previews."""
+    body, attributes = encode_message(ARTICLES, "gzip")
+
+    assert len(body) < len(json.dumps(ARTICLES)) / 4
+    assert attributes == {
+        "content-encoding": {"DataType": "String", "StringValue": "gzip"}
+    }
+
+
+def test_decode_message_accepts_sns_notification_attributes():
+    """Test attributes in the SNS notification format are understood."""
+    body, _ = encode_message(ARTICLES, "gzip")
+
+    attributes = {"content-encoding": {"Type": "String", "Value": "gzip"}}
+    assert decode_message(body, attributes) == ARTICLES
+
+
+def test_unknown_encoding():
+    """Test unknown encodings are rejected."""
+    with pytest.raises(ValueError, match="Unknown message encoding: brotli"):
+        encode_message(ARTICLES, "brotli")
+    with pytest.raises(ValueError, match="Unknown message encoding"):
+        GuardianApiClient(api_key="test-api-key", message_encoding="brotli")
+
+
+def test_publish_to_sqs_sends_encoded_message():
+    """Test the client encodes messages and records the encoding."""
+    client = GuardianApiClient(api_key="test-api-key", message_encoding="gzip")
+    client.sqs_client = MagicMock()
+    client.sqs_client.send_message.return_value = {"MessageId": "test-message-id"}
+
+    client.publish_to_sqs("https://sqs.example.com/queue", ARTICLES)
+
+    call = client.sqs_client.send_message.call_args.kwargs
+    assert call["MessageAttributes"]["TTL"]["StringValue"] == "259200"
+    assert call["MessageAttributes"]["content-encoding"]["StringValue"] == "gzip"
+    assert decode_message(call["MessageBody"], call["MessageAttributes"]) == ARTICLES
+
+
+def test_compressed_batches_fit_more_articles():
+    """Test compression lets more articles fit in one batch request."""
+    articles = [
+        {**article, "contentPreview": "The quick brown fox. " * 2000}
+        for article in ARTICLES
+    ]
+    assert len(json.dumps(articles[:10])) > MAX_BATCH_BYTES
+
+    requests = {}
+    for encoding in ("json", "gzip"):
+        client = GuardianApiClient(api_key="test-api-key", message_encoding=encoding)
+        client.sqs_client = MagicMock()
+        client.sqs_client.send_message_batch.side_effect = lambda QueueUrl, Entries: {
+            "Successful": [{"Id": e["Id"], "MessageId": e["Id"]} for e in Entries]
+        }
+        result = client.publish_to_sqs_batch("https://sqs.example.com/q", articles)
+        assert result["sent"] == len(articles)
+        requests[encoding] = result["requests"]
+
+    assert requests["gzip"] == 2
+    assert requests["json"] > requests["gzip"]
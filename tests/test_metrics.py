@@ -0,0 +1,90 @@
+from unittest.mock import MagicMock, patch
+
+from src.guardian_api_client import GuardianApiClient
+from src.metrics import InMemoryMetricsSink, Metrics
+
+
+def test_metrics_totals_and_hooks():
+    """Test timings and counters are totalled and passed to hooks."""
+    sink = InMemoryMetricsSink()
+    metrics = Metrics(hooks=[sink])
+
+    metrics.timing("search", 0.2)
+    metrics.timing("search", 0.1)
+    with metrics.timer("publish"):
+        pass
+    metrics.count("articles_published", 10)
+    metrics.count("articles_published", 5)
+    metrics.count("http_retries", 0)
+
+    snapshot = metrics.snapshot()
+    assert snapshot["timings"]["search"] == {
+        "count": 2,
+        "total_ms": 300.0,
+        "max_ms": 200.0,
+    }
+    assert snapshot["timings"]["publish"]["count"] == 1
+    assert snapshot["counts"] == {"articles_published": 15}
+    assert sink.timings("search") == [0.2, 0.1]
+    assert sink.total("articles_published") == 15
+
+    metrics.reset()
+    assert metrics.snapshot() == {"timings": {}, "counts": {}}
+
+
+def test_metrics_emf_document():
+    """Test totals render as a CloudWatch Embedded Metric Format document."""
+    metrics = Metrics()
+    metrics.timing("search", 0.25)
+    metrics.count("response_bytes", 2048)
+    metrics.count("articles_published", 10)
+
+    document = metrics.emf(
+        "GuardianApiClient",
+        dimensions={"FunctionName": "guardian_api_client"},
+        properties={"search_term": "ai"},
+    )
+
+    assert document["FunctionName"] == "guardian_api_client"
+    assert document["search_term"] == "ai"
+    assert document["search_time"] == 250.0
+    assert document["response_bytes"] == 2048
+    directive = document["_aws"]["CloudWatchMetrics"][0]
+    assert directive["Namespace"] == "GuardianApiClient"
+    assert directive["Dimensions"] == [["FunctionName"]]
+    assert directive["Metrics"] == [
+        {"Name": "search_time", "Unit": "Milliseconds"},
+        {"Name": "response_bytes", "Unit": "Bytes"},
+        {"Name": "articles_published", "Unit": "Count"},
+    ]
+    assert isinstance(document["_aws"]["Timestamp"], int)
+
+
+def test_publish_articles_times_each_stage(fake_api):
+    """Test a publish records the HTTP, parse, process and publish stages."""
+    sink = InMemoryMetricsSink()
+    client = GuardianApiClient(api_key="test-api-key", metrics=Metrics([sink]))
+    client.API_URL = fake_api.url
+
+    client.publish_articles("ai", "memory://metrics", max_results=25, batch_size=10)
+
+    for stage in ("search", "parse", "process", "publish"):
+        assert sink.timings(stage), stage
+    assert len(sink.timings("publish")) == 3
+    counts = client.metrics.snapshot()["counts"]
+    assert counts["articles_published"] == 25
+    assert counts["broker_requests"] == 3
+    assert counts["response_bytes"] > 0
+
+
+def test_http_retries_are_counted():
+    """Test retried Guardian API responses are counted."""
+    client = GuardianApiClient(api_key="test-api-key", max_retries=2)
+    throttled = MagicMock(status_code=429, headers={"Retry-After": "0"})
+    ok = MagicMock(status_code=200, headers={}, content=b"{}")
+    ok.json.return_value = {"response": {"results": []}}
+
+    with patch.object(client.session, "get", side_effect=[throttled, ok]):
+        client.search_articles("ai")
+
+    assert client.metrics.snapshot()["counts"]["http_retries"] == 1
@@ -0,0 +1,109 @@
+import pytest
+from unittest.mock import MagicMock
+
+from src.claim_check import ClaimCheck
+from src.guardian_api_client import GuardianApiClient
+from src.projection import DEFAULT_PROJECTION, FieldProjection
+
+
+RESULT = {
+    "id": "technology/2024/jan/01/ai",
+    "sectionId": "technology",
+    "webPublicationDate": "2024-01-01T09:00:00Z",
+    "webTitle": "AI",
+    "webUrl": "https://www.theguardian.com/technology/2024/jan/01/ai",
+    "fields": {"bodyText": "b" * 3000, "trailText": "Trail", "wordcount": "500"},
+    "tags": [{"id": "technology/ai"}, {"id": "type/article"}],
+}
+
+
+def test_default_projection():
+    """Test the default projection publishes the original fields."""
+    assert DEFAULT_PROJECTION.show_fields() == "bodyText"
+    assert DEFAULT_PROJECTION.extract(RESULT) == {
+        "webPublicationDate": "2024-01-01T09:00:00Z",
+        "webTitle": "AI",
+        "webUrl": "https://www.theguardian.com/technology/2024/jan/01/ai",
+        "contentPreview": "b" * 1000,
+    }
+    assert "contentPreview" not in DEFAULT_PROJECTION.extract({"webTitle": "AI"})
+
+
+def test_custom_projection():
+    """Test output keys, preview length and tags follow the spec."""
+    projection = FieldProjection(
+        fields={"id": "id", "section": "sectionId", "trail": "fields.trailText"},
+        preview_length=20,
+        show_tags="keyword",
+    )
+
+    assert projection.search_params() == {
+        "show-fields": "trailText,bodyText",
+        "show-tags": "keyword",
+    }
+    assert projection.extract(RESULT) == {
+        "id": "technology/2024/jan/01/ai",
+        "section": "technology",
+        "trail": "Trail",
+        "contentPreview": "b" * 20,
+        "tags": ["technology/ai", "type/article"],
+    }
+
+
+def test_projection_without_preview_skips_body():
+    """Test the body is not requested when nothing published needs it."""
+    projection = FieldProjection(preview_length=0, show_blocks="body:latest")
+
+    assert projection.search_params() == {"show-blocks": "body:latest"}
+    assert "contentPreview" not in projection.extract(RESULT)
+
+    with pytest.raises(ValueError):
+        FieldProjection(preview_length=-1)
+
+
+def test_client_requests_projected_fields():
+    """Test search requests are built from the client's projection."""
+    session = MagicMock()
+    session.get.return_value.status_code = 200
+    session.get.return_value.json.return_value = {"response": {"results": [RESULT]}}
+    projection = FieldProjection(
+        fields={"webUrl": "webUrl", "words": "fields.wordcount"}, preview_length=0
+    )
+    client = GuardianApiClient(
+        api_key="test-api-key", session=session, projection=projection
+    )
+
+    articles = client.process_articles(client.search_articles("ai"))
+
+    params = session.get.call_args.kwargs["params"]
+    assert params["show-fields"] == "wordcount"
+    assert "show-tags" not in params
+    assert articles == [{"webUrl": RESULT["webUrl"], "words": "500"}]
+
+
+def test_claim_check_keeps_full_body():
+    """Test claim-check mode extends the projection to the full body."""
+    client = GuardianApiClient(api_key="test-api-key", claim_check=ClaimCheck("bodies"))
+
+    (article,) = client.process_articles({"response": {"results": [RESULT]}})
+    assert client.projection.search_params()["show-fields"] == "bodyText"
+    assert article["bodyText"] == "b" * 3000
+    assert article["contentPreview"] == "b" * 1000
+
+
+def test_search_uses_projection_params():
+    """Test tags and blocks from the projection are requested with the fields."""
+    session = MagicMock()
+    session.get.return_value.status_code = 200
+    session.get.return_value.json.return_value = {"response": {"results": []}}
+    projection = FieldProjection(show_tags="keyword", show_blocks="body:latest")
+    client = GuardianApiClient(
+        api_key="test-api-key", session=session, projection=projection
+    )
+
+    client.search_articles("ai", show_fields="trailText")
+
+    params = session.get.call_args.kwargs["params"]
+    assert params["show-fields"] == "trailText"
+    assert params["show-tags"] == "keyword"
+    assert params["show-blocks"] == "body:latest"
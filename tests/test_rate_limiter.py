@@ -0,0 +1,89 @@
+import threading
+import time
+from email.utils import format_datetime
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from unittest.mock import patch
+
+from src.rate_limiter import (
+    QuotaExceededError,
+    RateLimiter,
+    backoff_delay,
+    parse_retry_after,
+)
+
+
+@patch("src.rate_limiter.time.sleep")
+@patch("src.rate_limiter.time.monotonic", return_value=100.0)
+def test_token_bucket_allows_burst_then_waits(mock_monotonic, mock_sleep):
+    """Test requests beyond the burst wait for tokens to refill."""
+    limiter = RateLimiter(rate=10, burst=2)
+
+    limiter.acquire()
+    limiter.acquire()
+    mock_sleep.assert_not_called()
+
+    limiter.acquire()
+    limiter.acquire()
+
+    waits = [c.args[0] for c in mock_sleep.call_args_list]
+    assert waits == pytest.approx([0.1, 0.2])
+
+
+@patch("src.rate_limiter.time.sleep")
+@patch("src.rate_limiter.time.monotonic", return_value=100.0)
+def test_pause_holds_back_requests(mock_monotonic, mock_sleep):
+    """Test a pause delays the next request even with tokens available."""
+    limiter = RateLimiter(rate=10, burst=5)
+
+    limiter.pause(3.0)
+    limiter.acquire()
+
+    mock_sleep.assert_called_once_with(3.0)
+
+
+def test_daily_quota():
+    """Test the daily budget is counted and enforced."""
+    limiter = RateLimiter(rate=1000, burst=10, daily_quota=3)
+
+    limiter.acquire()
+    assert limiter.remaining_quota == 2
+
+    limiter.sync_remaining(1)
+    assert limiter.remaining_quota == 1
+
+    limiter.acquire()
+    with pytest.raises(QuotaExceededError):
+        limiter.acquire()
+    assert limiter.used_today == 3
+
+
+def test_limiter_shared_across_threads():
+    """Test concurrent callers are spread out to the configured rate."""
+    limiter = RateLimiter(rate=50, burst=1)
+    threads = [threading.Thread(target=limiter.acquire) for _ in range(6)]
+
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert time.perf_counter() - start >= 0.09
+
+
+def test_parse_retry_after():
+    """Test Retry-After is parsed from seconds and HTTP dates."""
+    in_ten_seconds = datetime.now(timezone.utc) + timedelta(seconds=10)
+
+    assert parse_retry_after("5") == 5.0
+    assert 8 < parse_retry_after(format_datetime(in_ten_seconds, usegmt=True)) <= 10
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after(None) is None
+
+
+def test_backoff_delay_is_bounded():
+    """Test jittered backoff stays within the exponential bound and cap."""
+    for attempt in range(10):
+        assert 0 <= backoff_delay(attempt, base=0.5, cap=4) <= min(4, 0.5 * 2**attempt)
@@ -0,0 +1,115 @@
+import pytest
+from unittest.mock import patch
+
+from src.guardian_api_client import GuardianApiClient
+from src.response_cache import InMemoryResponseCache, SQLiteResponseCache
+
+
+URL = "https://content.guardianapis.com/search"
+BODY = {"response": {"results": [{"webTitle": "Article"}]}}
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def cache(request, tmp_path):
+    """Create each kind of response cache."""
+    if request.param == "memory":
+        yield InMemoryResponseCache(max_size=2, ttl=60)
+    else:
+        cache = SQLiteResponseCache(str(tmp_path / "cache.db"), max_size=2, ttl=60)
+        yield cache
+        cache.close()
+
+
+def test_key_ignores_api_key_and_order():
+    """Test keys are normalised and exclude the API key."""
+    first = InMemoryResponseCache.key_for(
+        URL, {"q": "ai", "page-size": 10, "api-key": "a"}
+    )
+    second = InMemoryResponseCache.key_for(
+        URL, {"page-size": "10", "api-key": "b", "q": "ai"}
+    )
+
+    assert first == second
+    assert "api-key" not in first
+
+
+def test_lookup_fresh_and_missing(cache):
+    """Test fresh responses are returned and misses are counted."""
+    assert cache.lookup("key") == (None, None)
+
+    cache.store("key", BODY, '"v1"')
+
+    assert cache.lookup("key") == (BODY, None)
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+@patch("src.response_cache.time.time")
+def test_expired_response_revalidates(mock_time, cache):
+    """Test expired responses expose their ETag and can be renewed."""
+    mock_time.return_value = 1000.0
+    cache.store("key", BODY, '"v1"')
+
+    mock_time.return_value = 1061.0
+    assert cache.lookup("key") == (None, '"v1"')
+
+    assert cache.revalidate("key") == BODY
+    assert cache.lookup("key") == (BODY, None)
+    assert cache.stats()["revalidations"] == 1
+
+
+def test_lru_eviction(cache):
+    """Test the least recently used response is evicted first."""
+    cache.store("a", BODY)
+    cache.store("b", BODY)
+    cache.lookup("a")
+    cache.store("c", BODY)
+
+    assert cache.lookup("b") == (None, None)
+    assert cache.lookup("a")[0] == BODY
+    assert cache.stats()["evictions"] == 1
+
+
+def test_sqlite_cache_survives_restart(tmp_path):
+    """Test cached responses persist across SQLite cache instances."""
+    path = str(tmp_path / "cache.db")
+    first = SQLiteResponseCache(path)
+    first.store("key", BODY)
+    first.close()
+
+    second = SQLiteResponseCache(path)
+
+    assert second.lookup("key") == (BODY, None)
+    second.close()
+
+
+@pytest.mark.integration
+def test_client_serves_repeat_searches_from_cache(fake_api):
+    """Test identical searches only reach the API once within the TTL."""
+    client = GuardianApiClient(
+        api_key="test-api-key", response_cache=InMemoryResponseCache()
+    )
+    client.API_URL = fake_api.url
+
+    first = client.search_articles("test term")
+    second = client.search_articles("test term")
+    client.search_articles("other term")
+
+    assert first == second
+    assert len(fake_api.requests) == 2
+
+
+@pytest.mark.integration
+def test_client_revalidates_with_etag(fake_api):
+    """Test expired responses are revalidated with If-None-Match."""
+    fake_api.etag = '"v1"'
+    cache = InMemoryResponseCache(ttl=0)
+    client = GuardianApiClient(api_key="test-api-key", response_cache=cache)
+    client.API_URL = fake_api.url
+
+    first = client.search_articles("test term")
+    second = client.search_articles("test term")
+
+    assert first == second
+    assert len(fake_api.requests) == 2
+    assert cache.stats()["revalidations"] == 1
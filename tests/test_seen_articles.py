@@ -0,0 +1,75 @@
+import pytest
+from unittest.mock import patch
+
+from src.seen_articles import InMemorySeenArticleStore, SQLiteSeenArticleStore
+
+
+ARTICLES = [
+    {"webUrl": "https://www.theguardian.com/article-1"},
+    {"webUrl": "https://www.theguardian.com/article-2"},
+]
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def store(request, tmp_path):
+    """Create each kind of seen article store."""
+    if request.param == "memory":
+        yield InMemorySeenArticleStore(max_size=3, ttl=60)
+    else:
+        store = SQLiteSeenArticleStore(str(tmp_path / "seen.db"), max_size=3, ttl=60)
+        yield store
+        store.close()
+
+
+def test_filter_new_skips_marked_articles(store):
+    """Test articles marked as seen are filtered out."""
+    assert store.filter_new(ARTICLES) == ARTICLES
+
+    store.mark_seen(ARTICLES[:1])
+
+    assert store.filter_new(ARTICLES) == ARTICLES[1:]
+    assert store.stats() == {"hits": 1, "misses": 3, "evictions": 0, "size": 1}
+
+
+def test_article_id_preferred_over_url(store):
+    """Test the Guardian id is used as the key when present."""
+    store.mark_seen([{"id": "technology/article-1", "webUrl": "https://a"}])
+
+    assert store.seen({"id": "technology/article-1", "webUrl": "https://b"})
+    assert not store.seen({"webUrl": "https://a"})
+
+
+@patch("src.seen_articles.time.time")
+def test_expired_articles_are_evicted(mock_time, store):
+    """Test entries older than the TTL count as unseen."""
+    mock_time.return_value = 1000.0
+    store.mark_seen(ARTICLES)
+
+    mock_time.return_value = 1061.0
+
+    assert store.filter_new(ARTICLES) == ARTICLES
+    assert store.stats()["evictions"] == 2
+
+
+def test_max_size_evicts_oldest(store):
+    """Test the store stays within max_size."""
+    articles = [{"webUrl": f"https://www.theguardian.com/{i}"} for i in range(5)]
+    for article in articles:
+        store.mark_seen([article])
+
+    assert store.stats()["size"] == 3
+    assert store.stats()["evictions"] == 2
+    assert store.filter_new(articles) == articles[:2]
+
+
+def test_sqlite_store_survives_restart(tmp_path):
+    """Test the SQLite store keeps articles across instances."""
+    path = str(tmp_path / "seen.db")
+    first = SQLiteSeenArticleStore(path)
+    first.mark_seen(ARTICLES)
+    first.close()
+
+    second = SQLiteSeenArticleStore(path)
+
+    assert second.filter_new(ARTICLES) == []
+    second.close()
@@ -0,0 +1,99 @@
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+
+SRC_DIR = os.path.join(os.path.dirname(__file__), "..", "src")
+
+# Generous ceilings that only catch gross cold start regressions.
+MAX_IMPORT_SECONDS = 2.0
+MAX_FIRST_INVOCATION_SECONDS = 5.0
+
+COLD_START_SCRIPT = """
+import json
+import sys
+import time
+from unittest.mock import patch
+
+start = time.perf_counter()
+import lambda_handler
+import_seconds = time.perf_counter() - start
+boto3_loaded_on_import = "boto3" in sys.modules
+
+import boto3
+
+created = []
+create_client = boto3.client
+
+
+def tracking_client(service_name, *args, **kwargs):
+    created.append(service_name)
+    return create_client(service_name, *args, **kwargs)
+
+
+event = {
+    "search_term": "machine learning",
+    "broker_reference": "https://sqs.eu-west-2.amazonaws.com/123456789012/queue",
+}
+with patch("boto3.client", tracking_client), patch(
+    "botocore.client.BaseClient._make_api_call", return_value={"MessageId": "id"}
+), patch.object(lambda_handler.GuardianApiClient, "API_URL", sys.argv[1]):
+    start = time.perf_counter()
+    first = lambda_handler.lambda_handler(event, None)
+    first_invocation_seconds = time.perf_counter() - start
+    second = lambda_handler.lambda_handler(event, None)
+
+print(json.dumps({
+    "import_seconds": import_seconds,
+    "first_invocation_seconds": first_invocation_seconds,
+    "boto3_loaded_on_import": boto3_loaded_on_import,
+    "clients_created": created,
+    "status_codes": [first["statusCode"], second["statusCode"]],
+}))
+"""
+
+
+@pytest.fixture
+def cold_start(fake_api):
+    """Run a cold start of the Lambda handler in a fresh interpreter."""
+    env = {
+        **os.environ,
+        "PYTHONPATH": SRC_DIR,
+        "AWS_DEFAULT_REGION": "eu-west-2",
+        "AWS_ACCESS_KEY_ID": "testing",
+        "AWS_SECRET_ACCESS_KEY": "testing",
+    }
+    output = subprocess.run(
+        [sys.executable, "-c", COLD_START_SCRIPT, fake_api.url],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+@pytest.mark.benchmark
+def test_cold_start(cold_start):
+    """Benchmark handler import and first invocation times."""
+    print(
+        f"\nimport: {cold_start['import_seconds'] * 1000:.1f} ms"
+        f"\nfirst invocation: {cold_start['first_invocation_seconds'] * 1000:.1f} ms"
+    )
+
+    assert cold_start["status_codes"] == [200, 200]
+    assert cold_start["import_seconds"] < MAX_IMPORT_SECONDS
+    assert cold_start["first_invocation_seconds"] < MAX_FIRST_INVOCATION_SECONDS
+
+
+def test_import_does_not_load_boto3(cold_start):
+    """Test boto3 is only imported once a broker client is needed."""
+    assert not cold_start["boto3_loaded_on_import"]
+
+
+def test_only_used_broker_client_is_created_once(cold_start):
+    """Test warm invocations reuse the single broker client that is needed."""
+    assert cold_start["clients_created"] == ["sqs"]
@@ -0,0 +1,117 @@
+import json
+import tracemalloc
+
+import pytest
+
+from src.guardian_api_client import GuardianApiClient
+from src.streaming import ResultStream
+
+
+def chunked(data, size):
+    return (data[i : i + size] for i in range(0, len(data), size))
+
+
+def make_body(count, body_size=100):
+    return json.dumps(
+        {
+            "response": {
+                "status": "ok",
+                "total": count,
+                "pages": 3,
+                "results": [
+                    {
+                        "id": f"world/article-{i}",
+                        "webTitle": f"Café {i} ]}}",
+                        "fields": {"bodyText": "é" * body_size},
+                    }
+                    for i in range(count)
+                ],
+            }
+        },
+        ensure_ascii=False,
+    ).encode("utf-8")
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 4096])
+def test_result_stream_decodes_results_across_chunks(chunk_size):
+    """Test results and metadata survive any chunking of the body."""
+    body = make_body(5)
+    stream = ResultStream(chunked(body, chunk_size))
+
+    results = list(stream)
+
+    assert results == json.loads(body)["response"]["results"]
+    assert stream.results_count == 5
+    assert stream.metadata == {
+        "response": {"status": "ok", "total": 5, "pages": 3, "results": []}
+    }
+
+
+def test_result_stream_without_results():
+    """Test a response without a results array only yields metadata."""
+    body = json.dumps({"response": {"status": "error", "message": "bad key"}})
+    stream = ResultStream(chunked(body.encode("utf-8"), 5))
+
+    assert list(stream) == []
+    assert stream.metadata["response"]["message"] == "bad key"
+
+
+def test_result_stream_errors():
+    """Test truncated bodies raise and metadata needs consumed results."""
+    stream = ResultStream([make_body(3)[:-40]])
+    with pytest.raises(RuntimeError):
+        stream.metadata
+    with pytest.raises(json.JSONDecodeError):
+        list(stream)
+
+
+def test_result_stream_memory_is_bounded_by_one_result():
+    """Test peak memory stays near one result rather than the whole page."""
+    body = make_body(50, body_size=100000)
+    chunks = list(chunked(body, 65536))
+
+    tracemalloc.start()
+    for result in ResultStream(chunks):
+        pass
+    _, streaming_peak = tracemalloc.get_traced_memory()
+    tracemalloc.reset_peak()
+    json.loads(body)
+    _, full_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    assert streaming_peak < full_peak / 5
+
+
+def test_iter_articles_streams_every_page(fake_api):
+    """Test streaming yields the same articles as whole-page parsing."""
+    client = GuardianApiClient(api_key="test-api-key", stream_responses=True)
+    client.API_URL = fake_api.url
+    streamed = list(client.iter_articles("test term", page_size=10))
+
+    client.stream_responses = False
+    parsed = list(client.iter_articles("test term", page_size=10))
+
+    assert len(streamed) == 25
+    assert streamed == parsed
+    assert [r.get("page", "1") for r in fake_api.requests[:3]] == ["1", "2", "3"]
+
+
+def test_iter_articles_stops_streaming_at_max_results(fake_api):
+    """Test a partly read page is closed once enough articles were yielded."""
+    client = GuardianApiClient(api_key="test-api-key", stream_responses=True)
+    client.API_URL = fake_api.url
+
+    articles = list(client.iter_articles("test term", max_results=15, page_size=10))
+
+    assert len(articles) == 15
+    assert len(fake_api.requests) == 2
+
+
+def test_publish_articles_streams_single_page(fake_api):
+    """Test the default single page publish also streams."""
+    client = GuardianApiClient(api_key="test-api-key", stream_responses=True)
+    client.API_URL = fake_api.url
+    result = client.publish_articles("test term", "memory://streaming")
+
+    assert result["articles_count"] == 10
+    assert fake_api.requests[0]["page-size"] == "10"
@@ -0,0 +1,226 @@
+import time
+
+import pytest
+from unittest.mock import MagicMock, patch
+
+from helpers import make_page
+from src.brokers import BrokerRegistry, MemoryBackend
+from src.checkpoints import InMemoryCheckpointStore
+from src.guardian_api_client import DeadlineExceededError, GuardianApiClient
+from src.watermarks import InMemoryWatermarkStore
+
+
+def search(
+    term, date_from, page_size=10, page=1, date_to=None, use_date=None, deadline=None
+):
+    return make_page((page - 1) * page_size, page_size, 25)
+
+
+class SlowBackend(MemoryBackend):
+    """Memory sink that moves the clock past the deadline after a batch."""
+
+    name = "memory"
+
+    def __init__(self, clock, batches_in_budget):
+        super().__init__()
+        self.clock = clock
+        self.batches_in_budget = batches_in_budget
+
+    def publish(self, client, broker_reference, articles, per_article):
+        result = super().publish(client, broker_reference, articles, per_article)
+        if len(self.messages["sink"]) >= self.batches_in_budget:
+            self.clock["now"] = 1000.0
+        return result
+
+
+def make_client(batches_in_budget):
+    clock = {"now": 0.0}
+    registry = BrokerRegistry()
+    backend = registry.register(SlowBackend(clock, batches_in_budget))
+    client = GuardianApiClient(
+        api_key="test-api-key",
+        checkpoint_store=InMemoryCheckpointStore(),
+        watermark_store=InMemoryWatermarkStore(),
+        broker_registry=registry,
+    )
+    return client, backend, clock
+
+
+def test_publish_articles_stops_at_deadline_and_resumes():
+    """Test a run out of time stops between batches and the next run resumes."""
+    client, backend, clock = make_client(batches_in_budget=2)
+
+    with patch.object(client, "search_articles", side_effect=search), patch(
+        "src.guardian_api_client.time.monotonic", side_effect=lambda: clock["now"]
+    ):
+        first = client.publish_articles(
+            "ai", "memory://sink", max_results=25, batch_size=5, deadline=10.0
+        )
+        clock["now"] = 0.0
+        backend.batches_in_budget = 100
+        second = client.publish_articles(
+            "ai", "memory://sink", max_results=25, batch_size=5, deadline=10.0
+        )
+
+    assert first["complete"] is False
+    assert first["articles_count"] == 10
+    assert "complete" not in second
+    assert second["resumed_from"] == 10
+    urls = [a["webUrl"] for message in backend.messages["sink"] for a in message]
+    assert len(urls) == len(set(urls)) == 25
+
+
+def test_publish_articles_stopped_run_keeps_watermark():
+    """Test the watermark only moves once an incremental run completes."""
+    client, backend, clock = make_client(batches_in_budget=1)
+
+    with patch.object(client, "search_articles", side_effect=search), patch(
+        "src.guardian_api_client.time.monotonic", side_effect=lambda: clock["now"]
+    ):
+        result = client.publish_articles(
+            "ai",
+            "memory://sink",
+            max_results=25,
+            batch_size=5,
+            incremental=True,
+            deadline=10.0,
+        )
+
+    assert result["complete"] is False
+    assert result["watermark"] is None
+
+
+def test_publish_many_lists_terms_not_started():
+    """Test terms left when the deadline passes are reported as pending."""
+    client = GuardianApiClient(api_key="test-api-key")
+
+    with patch.object(
+        client, "publish_articles", return_value={"articles_count": 1}
+    ) as mock_publish:
+        result = client.publish_many(
+            ["ai", "climate"], "memory://sink", deadline=time.monotonic() - 1
+        )
+
+    mock_publish.assert_not_called()
+    assert result["complete"] is False
+    assert result["pending_terms"] == ["ai", "climate"]
+    assert result["results"] == {}
+
+
+def test_publish_many_reports_cut_short_terms_as_pending():
+    """Test a term stopped part way through is retried in the continuation."""
+    client = GuardianApiClient(api_key="test-api-key")
+
+    def publish(term, broker_reference, date_from, deadline):
+        if term == "ai":
+            return {"articles_count": 10, "complete": False}
+        return {"articles_count": 3}
+
+    with patch.object(client, "publish_articles", side_effect=publish):
+        result = client.publish_many(
+            ["ai", "climate"], "memory://sink", deadline=time.monotonic() + 60
+        )
+
+    assert result["pending_terms"] == ["ai"]
+    assert result["articles_count"] == 13
+
+
+def test_backfill_leaves_windows_outstanding_after_deadline():
+    """Test a backfill out of time does not checkpoint unfinished windows."""
+    client = GuardianApiClient(
+        api_key="test-api-key", checkpoint_store=InMemoryCheckpointStore()
+    )
+
+    def probe(search_term, date_from, page_size, show_fields, date_to):
+        return {"response": {"total": 10 if date_from == date_to else 20}}
+
+    def publish(search_term, broker_reference, date_from, date_to, **kwargs):
+        if date_from == "2024-01-01":
+            return {"status": "success", "articles_count": 4, "complete": False}
+        return {"status": "success", "articles_count": 10}
+
+    with patch.object(client, "search_articles", side_effect=probe), patch.object(
+        client, "publish_articles", side_effect=publish
+    ):
+        first = client.backfill(
+            "ai", "memory://sink", "2024-01-01", "2024-01-02", 10, max_workers=1
+        )
+        second = client.backfill(
+            "ai", "memory://sink", "2024-01-01", "2024-01-02", 10, max_workers=1
+        )
+        late = client.backfill(
+            "ai",
+            "memory://sink",
+            "2024-01-01",
+            "2024-01-02",
+            10,
+            deadline=time.monotonic() - 1,
+        )
+
+    assert first["complete"] is False
+    assert second["windows_resumed"] == 1
+    assert late["complete"] is False
+    assert late["articles_count"] == 10
+
+
+def test_publish_articles_finished_before_deadline_is_complete():
+    """Test a run with nothing left to publish is not reported as stopped."""
+    client, backend, clock = make_client(batches_in_budget=1)
+
+    with patch.object(client, "search_articles", side_effect=search), patch(
+        "src.guardian_api_client.time.monotonic", side_effect=lambda: clock["now"]
+    ):
+        single_page = client.publish_articles("ai", "memory://sink", deadline=10.0)
+        last_batch = client.publish_articles(
+            "climate", "memory://sink", max_results=5, batch_size=5, deadline=10.0
+        )
+
+    assert single_page["articles_count"] == 10
+    assert "complete" not in single_page
+    assert last_batch["articles_count"] == 5
+    assert "complete" not in last_batch
+
+
+def test_requests_are_cut_short_at_deadline():
+    """Test request timeouts and retries never run past the deadline."""
+    client = GuardianApiClient(api_key="test-api-key", max_retries=3, timeout=10.0)
+    throttled = MagicMock(status_code=429, headers={"Retry-After": "30"})
+
+    with patch.object(client.session, "get", return_value=throttled) as get, patch(
+        "src.guardian_api_client.time.sleep"
+    ) as sleep:
+        with pytest.raises(DeadlineExceededError, match="time budget"):
+            client.search_articles("ai", deadline=time.monotonic() + 2)
+
+    assert get.call_count == 1
+    assert get.call_args.kwargs["timeout"] <= 2
+    sleep.assert_not_called()
+
+    with pytest.raises(DeadlineExceededError):
+        client.search_articles("ai", deadline=time.monotonic() - 1)
+
+
+def test_publish_articles_stops_when_a_page_fetch_runs_out_of_time():
+    """Test a page request cut short by the deadline stops the run cleanly."""
+    client, backend, clock = make_client(batches_in_budget=100)
+
+    def search_until_page_two(
+        term, date_from, page_size, page, date_to, use_date, deadline
+    ):
+        if page == 2:
+            raise DeadlineExceededError("Time budget used up")
+        return search(term, date_from, page_size, page, date_to, use_date)
+
+    with patch.object(
+        client, "search_articles", side_effect=search_until_page_two
+    ), patch.object(client, "MAX_PAGE_SIZE", 10):
+        result = client.publish_articles(
+            "ai",
+            "memory://sink",
+            max_results=25,
+            batch_size=10,
+            deadline=time.monotonic() + 60,
+        )
+
+    assert result["complete"] is False
+    assert result["articles_count"] == 10
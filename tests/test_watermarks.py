@@ -0,0 +1,46 @@
+import pytest
+
+from src.watermarks import InMemoryWatermarkStore, SQLiteWatermarkStore
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def store(request, tmp_path):
+    """Create each kind of watermark store."""
+    if request.param == "memory":
+        yield InMemoryWatermarkStore()
+    else:
+        store = SQLiteWatermarkStore(str(tmp_path / "watermarks.db"))
+        yield store
+        store.close()
+
+
+def test_watermark_per_term(store):
+    """Test watermarks are stored separately for each term."""
+    assert store.get("ai") is None
+
+    store.set("ai", "2023-11-21T12:00:00Z")
+    store.set("ml", "2023-11-20T12:00:00Z")
+
+    assert store.get("ai") == "2023-11-21T12:00:00Z"
+    assert store.get("ml") == "2023-11-20T12:00:00Z"
+
+
+def test_watermark_never_moves_backwards(store):
+    """Test an older timestamp does not replace a newer watermark."""
+    store.set("ai", "2023-11-21T12:00:00Z")
+    store.set("ai", "2023-11-01T12:00:00Z")
+
+    assert store.get("ai") == "2023-11-21T12:00:00Z"
+
+
+def test_sqlite_watermark_survives_restart(tmp_path):
+    """Test SQLite watermarks persist across instances."""
+    path = str(tmp_path / "watermarks.db")
+    first = SQLiteWatermarkStore(path)
+    first.set("ai", "2023-11-21T12:00:00Z")
+    first.close()
+
+    second = SQLiteWatermarkStore(path)
+
+    assert second.get("ai") == "2023-11-21T12:00:00Z"
+    second.close()